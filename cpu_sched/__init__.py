@@ -0,0 +1,24 @@
+"""CPU-PRO scheduling engines, importable without Streamlit, Plotly or Matplotlib."""
+
+from .table import ProcessTable, SliceTable
+from .timeline import CompactTimeline
+from .core import CPUCore
+from .smp import SMPCore
+from .registry import Registry
+from .audit import audit_batch
+from .cache import ResultCache, fingerprint
+from .metrics import SUMMARY_COLUMNS, summarize
+from .stream import RunningStats, stream_schedule
+from .sweep import best_quantum, quantum_sweep
+from .telemetry import Telemetry
+from .workload import effective_mean, generate, generate_chunks, write_workload
+from .incremental import extend_schedule
+from .jobs import Job, JobCancelled, JobRunner
+from .schedulers import SCHEDULERS, Schedule, available, get_scheduler, register_scheduler, ModernProcessScheduler, FCFSScheduler, SJFScheduler, RRScheduler
+
+__all__ = [
+    'ProcessTable', 'SliceTable', 'CompactTimeline', 'CPUCore', 'SMPCore', 'Registry', 'audit_batch', 'ResultCache', 'fingerprint',
+    'SUMMARY_COLUMNS', 'summarize', 'RunningStats', 'stream_schedule', 'quantum_sweep', 'best_quantum', 'Telemetry',
+    'effective_mean', 'generate', 'generate_chunks', 'write_workload', 'extend_schedule', 'Job', 'JobCancelled', 'JobRunner',
+    'SCHEDULERS', 'Schedule', 'available', 'get_scheduler', 'register_scheduler', 'ModernProcessScheduler', 'FCFSScheduler', 'SJFScheduler', 'RRScheduler',
+]
@@ -0,0 +1,59 @@
+"""Batch audit: many workloads x algorithms x quanta over a process pool."""
+
+import os
+
+from .cache import fingerprint
+from .metrics import SUMMARY_COLUMNS, summarize
+from .schedulers import COST_PARAMS, SCHEDULERS, get_scheduler
+from .table import ProcessTable
+from .telemetry import span
+
+AUDIT_COLUMNS = ['workload', 'algorithm', 'quantum'] + SUMMARY_COLUMNS
+
+def _audit_job(job):
+    w, workload, algo, quantum, costs = job
+    table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_records(workload)
+    cls = get_scheduler(algo)
+    params = dict(cls.tune(quantum) if quantum is not None else {}, **(dict(zip(COST_PARAMS, costs)) if cls.costed() else {}))
+    final, timeline, _ = cls.run(table, **params)
+    return {'workload': w, 'algorithm': algo, 'quantum': quantum, **summarize(final, timeline)}
+
+def _audit_chunk(jobs):
+    return [_audit_job(job) for job in jobs]
+
+def audit_batch(workloads, algorithms=None, quanta=(2,), workers=None, chunksize=None, cache=None, switch_cost=0, warmup=0, telemetry=None):
+    # Runs every (workload x algorithm x quantum) job and returns one metrics row per job. Quantum-free
+    # engines run once per workload. Jobs are chunked workload-major so each chunk ships its workload once.
+    # With a ResultCache, rows already audited for the same workload content are reused instead of re-simulated.
+    # algorithms defaults to every registered scheduler; switch_cost / warmup are charged by the costed ones.
+    # A Telemetry records the planning / cache lookup, simulation and DataFrame phases as audit.* spans.
+    import pandas as pd  # deferred so importing the engine stays light
+    from concurrent.futures import ProcessPoolExecutor
+    costs, algorithms = (switch_cost, warmup), [get_scheduler(a).name for a in (SCHEDULERS if algorithms is None else algorithms)]
+    with span(telemetry, 'audit.plan', workloads=len(workloads), algorithms=len(algorithms)) as plan:
+        jobs = [(w, workload, algo, q, costs) for w, workload in enumerate(workloads) for algo in algorithms
+                for q in (quanta if SCHEDULERS[algo].tune(1) else (None,))]
+        order, rows, keys = [(w, algo, q) for w, _, algo, q, _ in jobs], {}, {}
+        if cache is not None:
+            prints, tag = {}, f':cs{switch_cost:g},{warmup:g}' if switch_cost or warmup else ''
+            for job in jobs:
+                w, workload, algo, q, _ = job
+                if w not in prints: prints[w] = fingerprint(workload)
+                keys[w, algo, q] = key = cache.key(prints[w], algo + ':audit' + (tag if SCHEDULERS[algo].costed() else ''), q)
+                row = cache.get(key)
+                if row is not None: rows[w, algo, q] = dict(row, workload=w)
+            jobs = [job for job in jobs if (job[0], job[2], job[3]) not in rows]
+        plan.update(jobs=len(order), cache_hits=len(rows))
+    workers = workers or os.cpu_count() or 1
+    with span(telemetry, 'audit.simulate', jobs=len(jobs), workers=min(workers, max(len(jobs), 1))):
+        if workers <= 1 or len(jobs) <= 1:
+            fresh = _audit_chunk(jobs)
+        else:
+            chunksize = chunksize or max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                fresh = [row for chunk in pool.map(_audit_chunk, [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]) for row in chunk]
+    with span(telemetry, 'audit.frame', rows=len(order)):
+        for row in fresh:
+            rows[row['workload'], row['algorithm'], row['quantum']] = row
+            if cache is not None: cache.put(keys[row['workload'], row['algorithm'], row['quantum']], row)
+        return pd.DataFrame([rows[k] for k in order], columns=AUDIT_COLUMNS)
@@ -0,0 +1,136 @@
+"""Engine benchmark suite: synthetic workloads at increasing sizes, timed per engine, saved as diffable JSON."""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .schedulers import SCHEDULERS
+from .table import ProcessTable
+from .workload import generate
+
+BENCH_SIZES = (10**2, 10**3, 10**4, 10**5)   # pass up to 10**7 explicitly for the full scaling curve
+BENCH_QUANTUM = 4
+OBJECT_MAX_N = 10**5   # the dict-based scheduler classes are skipped above this size
+TARGET_LOAD = 0.9      # offered load for the generated arrivals
+
+
+def _arrival_horizon(bursts):
+    return max(1, int(bursts.sum() / TARGET_LOAD))
+
+
+def uniform_workload(n, seed=0):
+    rng = np.random.default_rng(seed)
+    burst = rng.integers(1, 21, n)
+    return ProcessTable(np.arange(1, n + 1), rng.integers(0, _arrival_horizon(burst), n), burst)
+
+
+def pareto_workload(n, seed=0, shape=1.5):
+    # Heavy-tailed bursts: most jobs are short, a few are orders of magnitude longer
+    rng = np.random.default_rng(seed)
+    burst = np.minimum(np.ceil((rng.pareto(shape, n) + 1) * 4), 10**6).astype(np.int64)
+    return ProcessTable(np.arange(1, n + 1), rng.integers(0, _arrival_horizon(burst), n), burst)
+
+
+def bursty_workload(n, seed=0, cluster=200):
+    # Arrivals come in clusters of ~`cluster` processes released within a few time units of each other
+    rng = np.random.default_rng(seed)
+    burst = rng.integers(1, 21, n)
+    centers = rng.integers(0, _arrival_horizon(burst), max(1, n // cluster))
+    arrival = centers[rng.integers(0, len(centers), n)] + rng.geometric(0.5, n) - 1
+    return ProcessTable(np.arange(1, n + 1), arrival, burst)
+
+
+def mmpp_workload(n, seed=0):
+    # Two-phase Markov-modulated Poisson arrivals with lognormal bursts, at the suite's offered load
+    return generate(n, arrival='mmpp', burst='lognormal', mean_burst=10.5, load=TARGET_LOAD, seed=seed)
+
+
+WORKLOADS = {'uniform': uniform_workload, 'pareto': pareto_workload, 'bursty': bursty_workload, 'mmpp': mmpp_workload}
+
+
+def _prioritized(table, seed):
+    # Workloads get a priority column (levels 0-9) so engines that require one run on every workload
+    if table.priority is not None: return table
+    prio = np.random.default_rng([seed, 1]).integers(0, 10, len(table))
+    return ProcessTable(table.id, table.arrival_time, table.burst_time, priority=prio)
+
+
+def _table_run(cls, params):
+    return lambda table: cls.run(table, **params).timeline
+
+
+def _object_run(cls, params):
+    def run(table):
+        s = cls(table.to_records(), **params)
+        s.schedule()
+        return s.execution_order
+    return run
+
+
+def bench_engines():
+    # Read from the scheduler registry when called, so registered algorithms are benchmarked too. NAME times the
+    # table engine, NAME.records the dict-based object API (skipped above OBJECT_MAX_N).
+    out = {}
+    for name, cls in SCHEDULERS.items():
+        params = cls.tune(BENCH_QUANTUM)
+        out[name], out[f'{name}.records'] = _table_run(cls, params), _object_run(cls, params)
+    return out
+
+
+def bench_one(engine, table, repeat=3, memory=True):
+    run = bench_engines()[engine]
+    best, slices = float('inf'), 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        slices = len(run(table))
+        best = min(best, time.perf_counter() - t0)
+    peak = None
+    if memory:
+        # Separate traced pass: tracemalloc slows Python code down too much to time under it
+        tracemalloc.start()
+        run(table)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return {'wall_s': best, 'peak_mb': peak, 'slices': slices, 'slices_per_s': slices / best if best > 0 else None}
+
+
+def run_suite(sizes=BENCH_SIZES, engines=None, workloads=tuple(WORKLOADS), repeat=3, memory=True, seed=0, log=None):
+    # engines defaults to every registered scheduler, in both forms
+    engines = list(bench_engines()) if engines is None else engines
+    results = []
+    for kind in workloads:
+        for n in sizes:
+            table = _prioritized(WORKLOADS[kind](int(n), seed), seed)
+            for engine in engines:
+                if engine.endswith('.records') and n > OBJECT_MAX_N: continue
+                row = {'engine': engine, 'workload': kind, 'n': int(n), **bench_one(engine, table, repeat, memory)}
+                results.append(row)
+                if log: log(row)
+    return {'meta': {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'python': platform.python_version(),
+                     'numpy': np.__version__, 'machine': platform.machine(), 'platform': platform.platform(),
+                     'quantum': BENCH_QUANTUM, 'repeat': repeat, 'seed': seed},
+            'results': results}
+
+
+def save(report, path):
+    with open(path, 'w') as f: json.dump(report, f, indent=2)
+
+
+def load(path):
+    with open(path) as f: return json.load(f)
+
+
+def compare(baseline, current, tolerance=0.25, min_seconds=0.01):
+    # Rows of (engine, workload, n, base_s, new_s, ratio) whose wall time grew by more than `tolerance`;
+    # cases faster than `min_seconds` in both reports are timer noise and are ignored
+    base = {(r['engine'], r['workload'], r['n']): r['wall_s'] for r in baseline['results']}
+    out = []
+    for r in current['results']:
+        old = base.get((r['engine'], r['workload'], r['n']))
+        if old and max(old, r['wall_s']) >= min_seconds and r['wall_s'] > old * (1 + tolerance):
+            out.append((r['engine'], r['workload'], r['n'], old, r['wall_s'], r['wall_s'] / old))
+    return out
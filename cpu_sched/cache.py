@@ -0,0 +1,87 @@
+"""Memoized simulation results: a bounded in-memory LRU with an optional on-disk tier."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .table import ProcessTable
+
+CACHE_VERSION = 7  # bump when engine output changes so stale disk entries are ignored
+
+
+def fingerprint(workload):
+    # Content hash of the id / arrival / burst (and priority, if any) columns; a dict registry and its ProcessTable hash the same
+    table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_records(workload)
+    h = hashlib.blake2b(digest_size=16)
+    for col in (table.id, table.arrival_time, table.burst_time, table.priority):
+        if col is None: continue
+        h.update(col.dtype.str.encode())
+        h.update(col.tobytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    # Values are shared between callers, so treat cached results as read-only. The LRU is locked, so job-pool threads
+    # and concurrent sessions can share one cache (the hit / miss counters included); two threads missing the same key
+    # may both compute it.
+    def __init__(self, maxsize=32, directory=None):
+        self.maxsize, self.directory = maxsize, directory
+        self.hits = self.misses = 0
+        self._mem, self._lock = OrderedDict(), threading.RLock()
+        if directory: os.makedirs(directory, exist_ok=True)
+
+    def key(self, workload, algorithm, quantum=None):
+        # workload may also be a precomputed fingerprint string
+        return f"v{CACHE_VERSION}-{workload if isinstance(workload, str) else fingerprint(workload)}-{algorithm}-{quantum}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return self._mem[key]
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), 'rb') as f: value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                with self._lock:
+                    self.hits += 1
+                    self._remember(key, value)
+                return value
+        with self._lock: self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f: pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._mem[key] = value
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.maxsize: self._mem.popitem(last=False)
+
+    def get_or_compute(self, workload, algorithm, quantum, compute):
+        key = self.key(workload, algorithm, quantum)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock: self._mem.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pkl'): os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,179 @@
+"""`cpu-sched` command line: run a scheduling engine over a workload file without the UI."""
+
+import argparse
+import sys
+
+from . import bench as benchmarks
+from .bench import BENCH_SIZES, WORKLOADS, bench_engines
+from .io import read_workload, write_frame, write_table
+from .metrics import summarize
+from .schedulers import SCHEDULERS
+from .smp import QUEUE_MODELS
+from .sweep import best_quantum, parse_quanta, quantum_sweep
+from .telemetry import Telemetry, span
+from .workload import ARRIVALS, BURSTS, CHUNK, parse_mix, write_workload
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cpu-sched', description='Headless CPU scheduling simulator.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='simulate one workload file')
+    run.add_argument('workload', help='CSV / Parquet / JSONL file with id, arrival_time, burst_time (and optional priority) columns, or a .trace')
+    run.add_argument('-a', '--algorithm', type=str.upper, choices=list(SCHEDULERS), default='FCFS')
+    run.add_argument('-q', '--quantum', type=int, default=2, help='time quantum for RR; MLFQ uses q,2q,4q (default: 2)')
+    run.add_argument('--quanta', help='comma-separated MLFQ level quanta, e.g. 2,4,8')
+    run.add_argument('--boost', type=int, help='MLFQ priority boost period')
+    run.add_argument('--aging', type=int, help='PRIORITY / PRIORITY-P: lower a waiting process\'s priority value by 1 every N time units')
+    run.add_argument('--switch-cost', type=float, default=0, help='context-switch cost for the preemptive engines (default: 0)')
+    run.add_argument('--warmup', type=float, default=0, help='extra cost when a displaced process resumes (default: 0)')
+    run.add_argument('-c', '--cores', type=int, default=1, help='simulate k cores (engines with a multi-core variant: FCFS / SJF / RR)')
+    run.add_argument('--queues', choices=QUEUE_MODELS, default='global', help='SMP run queue model (default: global)')
+    run.add_argument('-m', '--metrics', help='write per-process metrics to this file')
+    run.add_argument('-t', '--timeline', help='write the execution timeline to this file')
+    _telemetry_args(run)
+
+    convert = sub.add_parser('convert', help='convert a workload between CSV / Parquet / JSONL / binary .trace')
+    convert.add_argument('source')
+    convert.add_argument('target')
+
+    gen = sub.add_parser('generate', help='write a synthetic workload, chunk by chunk, to CSV / Parquet / JSONL / .trace')
+    gen.add_argument('target')
+    gen.add_argument('-n', '--count', default='1e4', help='number of processes, e.g. 1e6 (default: 1e4)')
+    gen.add_argument('--arrival', choices=ARRIVALS, default='poisson', help='arrival process (default: poisson)')
+    gen.add_argument('--burst', choices=BURSTS, default='exponential', help='burst distribution (default: exponential)')
+    gen.add_argument('--mean-burst', type=float, default=5.0, help='mean burst before rounding up to whole units (default: 5)')
+    gen.add_argument('--shape', type=float, help='Pareto alpha (default: 1.5) or lognormal sigma (default: 1)')
+    gen.add_argument('--load', type=float, default=0.9, help='offered load; sets the arrival rate to load / mean of the rounded bursts (default: 0.9)')
+    gen.add_argument('--rate', type=float, help='arrivals per time unit, overriding --load')
+    gen.add_argument('--priorities', help='priority mix as level[:weight],..., e.g. 0:1,5:3,9:1 (default: no priority column)')
+    gen.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    gen.add_argument('--chunk', type=int, default=CHUNK, help=f'processes generated per chunk (default: {CHUNK})')
+
+    sweep = sub.add_parser('sweep', help='evaluate RR over many quanta and recommend the best')
+    sweep.add_argument('workload')
+    sweep.add_argument('-q', '--quanta', default='1:100', help='comma-separated quanta or an inclusive range start:stop[:step] (default: 1:100)')
+    sweep.add_argument('--objective', default='avg_wait', help='summary column to minimize, e.g. avg_wait, p99_wait, avg_response (default: avg_wait)')
+    sweep.add_argument('--switch-cost', type=float, default=0, help='context-switch cost (default: 0)')
+    sweep.add_argument('--warmup', type=float, default=0, help='extra cost when a displaced process resumes (default: 0)')
+    sweep.add_argument('-w', '--workers', type=int, help='worker processes (default: CPU count)')
+    sweep.add_argument('-o', '--out', help='write the per-quantum table to this file')
+    _telemetry_args(sweep)
+
+    bench = sub.add_parser('bench', help='time every engine on synthetic workloads and write a JSON report')
+    bench.add_argument('-o', '--out', default='bench.json', help='report path (default: bench.json)')
+    bench.add_argument('--sizes', default=','.join(str(n) for n in BENCH_SIZES), help='comma-separated process counts, e.g. 1e2,1e4,1e7')
+    bench.add_argument('--engines', help=f"comma-separated subset of: {', '.join(bench_engines())}")
+    bench.add_argument('--workloads', help=f"comma-separated subset of: {', '.join(WORKLOADS)}")
+    bench.add_argument('--repeat', type=int, default=3, help='timed runs per case, best is kept (default: 3)')
+    bench.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak-memory pass')
+
+    diff = sub.add_parser('bench-compare', help='exit non-zero if any case got slower than the baseline report')
+    diff.add_argument('baseline')
+    diff.add_argument('current')
+    diff.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown ratio (default: 0.25)')
+    return parser
+
+
+def _telemetry_args(parser):
+    parser.add_argument('--telemetry', help='write phase timings and engine statistics (JSON) to this file')
+    parser.add_argument('--telemetry-format', choices=('json', 'otlp'), default='json', help='plain JSON or OTLP/JSON spans (default: json)')
+    parser.add_argument('--trace-memory', action='store_true', help='record per-phase peak memory with tracemalloc (slower)')
+
+
+def _telemetry(args):
+    return Telemetry(memory=args.trace_memory) if args.telemetry else None
+
+
+def _costs(args):
+    # Whole-number costs stay ints so integer workloads keep integer timelines
+    return {k: int(v) if float(v).is_integer() else v for k, v in (('switch_cost', args.switch_cost), ('warmup', args.warmup))}
+
+
+def cmd_run(args):
+    tel = _telemetry(args)
+    with span(tel, 'load', path=args.workload) as attrs:
+        table = read_workload(args.workload)
+        attrs['processes'] = len(table)
+    cls = SCHEDULERS[args.algorithm]
+    params = cls.tune(args.quantum)
+    if args.quanta and 'quanta' in cls.params: params['quanta'] = tuple(int(q) for q in args.quanta.split(','))
+    if args.boost and 'boost' in cls.params: params['boost'] = args.boost
+    if args.aging and 'aging' in cls.params: params['aging'] = args.aging
+    if args.switch_cost or args.warmup:
+        if not cls.costed(): raise ValueError(f"Context-switch costs apply to {', '.join(n for n, c in SCHEDULERS.items() if c.costed())} only")
+        params.update(_costs(args))
+    final, timeline, _ = cls.run(table, args.cores, args.queues, telemetry=tel, **params)
+    with span(tel, 'write'):
+        if args.metrics: write_table(final, args.metrics)
+        if args.timeline: write_table(timeline, args.timeline)
+    if tel: tel.save(args.telemetry, args.telemetry_format)
+    if len(final):
+        m = summarize(final, timeline, args.cores)
+        print(f"{args.algorithm}: {m['processes']} processes, {m['slices']} slices, "
+              f"avg_wait={m['avg_wait']:.3f} p95_wait={m['p95_wait']:.3f} p99_wait={m['p99_wait']:.3f} "
+              f"avg_tat={m['avg_tat']:.3f} p99_tat={m['p99_tat']:.3f} avg_response={m['avg_response']:.3f} "
+              f"makespan={m['makespan']} throughput={m['throughput']:.4f}/t cpu_util={m['cpu_util']:.1f}% "
+              f"switches={m['switches']} overhead={m['overhead']}")
+    return 0
+
+
+def cmd_convert(args):
+    table = read_workload(args.source)
+    write_table(table, args.target)
+    print(f"wrote {len(table)} processes to {args.target}")
+    return 0
+
+
+def cmd_generate(args):
+    n = write_workload(args.target, int(float(args.count)), arrival=args.arrival, burst=args.burst, mean_burst=args.mean_burst, shape=args.shape,
+                       load=args.load, rate=args.rate, priorities=parse_mix(args.priorities) if args.priorities else None, seed=args.seed, chunk=args.chunk)
+    print(f"wrote {n} processes to {args.target}")
+    return 0
+
+
+def cmd_sweep(args):
+    tel = _telemetry(args)
+    with span(tel, 'load', path=args.workload): table = read_workload(args.workload)
+    result = quantum_sweep(table, parse_quanta(args.quanta), **_costs(args), workers=args.workers, telemetry=tel)
+    if args.objective not in result.columns: raise ValueError(f"Unknown objective '{args.objective}'")
+    with span(tel, 'write'):
+        if args.out: write_frame(result, args.out)
+    if tel: tel.save(args.telemetry, args.telemetry_format)
+    best = result[result['quantum'] == best_quantum(result, args.objective)].iloc[0]
+    print(f"RR sweep over {len(result)} quanta: best quantum={best['quantum']:.0f} {args.objective}={best[args.objective]:.3f} "
+          f"avg_tat={best['avg_tat']:.3f} switches={best['switches']:.0f}")
+    return 0
+
+
+def cmd_bench(args):
+    sizes = [int(float(n)) for n in args.sizes.split(',')]
+    known = bench_engines()
+    engines = args.engines.split(',') if args.engines else list(known)
+    workloads = args.workloads.split(',') if args.workloads else list(WORKLOADS)
+    unknown = [e for e in engines if e not in known] + [w for w in workloads if w not in WORKLOADS]
+    if unknown: raise ValueError(f"Unknown engine/workload: {', '.join(unknown)}")
+    log = lambda r: print(f"{r['engine']:<18} {r['workload']:<8} n={r['n']:<9} {r['wall_s']:.4f}s"
+                          + (f" {r['peak_mb']:.1f}MB" if r['peak_mb'] is not None else '')
+                          + (f" {r['slices_per_s']:,.0f} slices/s" if r['slices_per_s'] else ''), flush=True)
+    report = benchmarks.run_suite(sizes, engines, workloads, args.repeat, not args.no_memory, log=log)
+    benchmarks.save(report, args.out)
+    print(f"wrote {len(report['results'])} results to {args.out}")
+    return 0
+
+
+def cmd_bench_compare(args):
+    slower = benchmarks.compare(benchmarks.load(args.baseline), benchmarks.load(args.current), args.tolerance)
+    for engine, workload, n, old, new, ratio in slower:
+        print(f"REGRESSION {engine} {workload} n={n}: {old:.4f}s -> {new:.4f}s ({ratio:.2f}x)")
+    if not slower: print("no regressions")
+    return 1 if slower else 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return {'run': cmd_run, 'convert': cmd_convert, 'generate': cmd_generate, 'sweep': cmd_sweep, 'bench': cmd_bench, 'bench-compare': cmd_bench_compare}[args.command](args)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"cpu-sched: error: {e}", file=sys.stderr)
+        return 1
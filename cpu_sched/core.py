@@ -0,0 +1,353 @@
+"""Single-CPU scheduling engines (FCFS, SJF, RR, SRTF, MLFQ, priority) over ProcessTable columns."""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .heap import IndexedHeap
+from .table import ProcessTable, SliceTable
+from .timeline import CompactTimeline
+
+
+class RRState:
+    # Resumable Round Robin progress over one table. Quantum sweeps snapshot it where schedules for different quanta
+    # start to differ; the arrival sort and the id / arrival lists are shared between copies, never mutated.
+    __slots__ = ('arrival', 'pid', 'arrivals', 'time', 'queue', 'done', 'nxt', 'last', 'rem', 'first_start', 'comp', 'switches',
+                 's_id', 's_start', 's_end', 'o_pos')
+
+    def __init__(self, table):
+        n = len(table)
+        self.arrival, self.pid = table.arrival_time.tolist(), table.id.tolist()
+        self.arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+        self.time, self.queue, self.done, self.nxt, self.last = 0, deque(), 0, 0, None
+        self.rem, self.first_start, self.comp, self.switches = table.burst_time.tolist(), [None] * n, [None] * n, [0] * n
+        self.s_id, self.s_start, self.s_end, self.o_pos = [], [], [], []
+
+    def copy(self):
+        c = RRState.__new__(RRState)
+        c.arrival, c.pid, c.arrivals = self.arrival, self.pid, self.arrivals
+        c.time, c.queue, c.done, c.nxt, c.last = self.time, deque(self.queue), self.done, self.nxt, self.last
+        c.rem, c.first_start, c.comp, c.switches = self.rem[:], self.first_start[:], self.comp[:], self.switches[:]
+        c.s_id, c.s_start, c.s_end, c.o_pos = self.s_id[:], self.s_start[:], self.s_end[:], self.o_pos[:]
+        return c
+
+
+class CPUCore:
+    # Engines run on ProcessTable columns and return (ProcessTable, timeline). Passing the registry's list of
+    # dicts instead goes through the record adapters and returns (final_procs, execution_order) dict lists.
+    # The preemptive engines take switch_cost (CPU time lost whenever a different process is switched in) and warmup
+    # (extra time when a process that has already run resumes after being displaced); both show up as overhead slices
+    # in the timeline. If an arrival that outranks the incoming process lands inside its switch overhead, it is
+    # preempted before doing any work: the overhead is still charged, but no work slice or start_time is recorded.
+    # The SMP engines do not model these costs; ModernProcessScheduler.run raises ValueError for nonzero costs with cores > 1.
+    # Every engine also takes progress, a callable(done, time) invoked every PROGRESS_EVERY completions and every
+    # PROGRESS_STEPS scheduling steps (slices; rows for FCFS) with the processes finished so far and the simulated
+    # clock, so runs with few, long processes report too; an exception raised from it aborts the run (job cancellation).
+    VECTOR_MIN = 64  # below this a plain loop beats NumPy call overhead
+    PROGRESS_EVERY = 1024
+    PROGRESS_STEPS = 1 << 13
+    @staticmethod
+    def _dispatch(engine, processes, *args):
+        if isinstance(processes, ProcessTable): return engine(processes, *args)
+        final, timeline = engine(ProcessTable.from_records(processes), *args)
+        return final.to_records(), timeline.to_records()
+
+    @staticmethod
+    def _admit(arrival, arrivals, nxt, t, queue):
+        # Enqueue everything that has arrived by t; a batch is ordered by registry position. Returns the advanced cursor.
+        end = nxt
+        while end < len(arrivals) and arrival[arrivals[end]] <= t: end += 1
+        queue.extend(arrivals[nxt:end] if end - nxt < 2 else sorted(arrivals[nxt:end]))
+        return end
+
+    @staticmethod
+    def _costed(table, *costs):
+        # Fractional costs on an integer workload move the whole simulation to float time
+        if any(isinstance(c, float) and not c.is_integer() for c in costs) and np.issubdtype(table.arrival_time.dtype, np.integer):
+            return ProcessTable(table.id, table.arrival_time.astype(float), table.burst_time, priority=table.priority)
+        return table
+
+    @staticmethod
+    def _timeline(table, s_id, s_start, s_end, o_pos, costly, **extra):
+        # The overhead column is only attached when a cost was configured, so zero-cost timelines are unchanged.
+        # Slices are returned run-length encoded (see timeline.CompactTimeline); decode() gives the SliceTable.
+        overhead = None
+        if costly: overhead = np.zeros(len(s_id), dtype=np.int64); overhead[o_pos] = 1
+        return CompactTimeline.encode(SliceTable(s_id, np.asarray(s_start, dtype=table.arrival_time.dtype), s_end, overhead=overhead, **extra))
+
+    @staticmethod
+    def fcfs(processes, progress=None):
+        return CPUCore._dispatch(CPUCore._fcfs_table, processes, progress)
+
+    @staticmethod
+    def _fcfs_table(table, progress=None):
+        order = np.argsort(table.arrival_time, kind='stable')
+        ready = table.take(order)
+        if len(ready) < CPUCore.VECTOR_MIN:
+            start, current_time = [], 0
+            for at, bt in zip(ready.arrival_time.tolist(), ready.burst_time.tolist()):
+                if current_time < at: current_time = at
+                start.append(current_time)
+                current_time += bt
+            start = np.asarray(start, dtype=ready.arrival_time.dtype)
+            comp = start + ready.burst_time
+            if progress is not None and len(ready): progress(len(ready), current_time)
+        else:
+            # Closed form: completion_i = S_i + max(T, max_{j<=i}(arrival_j - S_{j-1})) with S the running burst sum
+            # and T the clock when the block starts; with progress the rows go in blocks of PROGRESS_STEPS, reported each
+            at, bt = ready.arrival_time, ready.burst_time
+            comp, block, clock = np.empty(len(ready), np.result_type(at, bt)), len(ready) if progress is None else CPUCore.PROGRESS_STEPS, 0
+            for lo in range(0, len(ready), block):
+                csum = np.cumsum(bt[lo:lo + block])
+                comp[lo:lo + block] = csum + np.maximum(np.maximum.accumulate(at[lo:lo + block] - (csum - bt[lo:lo + block])), clock)
+                clock = comp[lo + len(csum) - 1]
+                if progress is not None: progress(lo + len(csum), clock.item())
+            start = comp - bt
+        ready = ready.with_schedule(start, comp)
+        return ready, ready
+
+    @staticmethod
+    def sjf(processes, progress=None):
+        return CPUCore._dispatch(CPUCore._sjf_table, processes, progress)
+
+    @staticmethod
+    def _sjf_table(table, progress=None):
+        # Event-driven: one arrival sort, a min-heap of ready bursts, and idle jumps straight to the next arrival.
+        # Ties on burst go to the earlier registry entry, matching the original linear scan.
+        arrival, burst = table.arrival_time.tolist(), table.burst_time.tolist()
+        arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+        current_time, order, start, ready, nxt = 0, [], [], [], 0
+        while nxt < len(arrivals) or ready:
+            if not ready and arrival[arrivals[nxt]] > current_time: current_time = arrival[arrivals[nxt]]
+            while nxt < len(arrivals) and arrival[arrivals[nxt]] <= current_time:
+                heapq.heappush(ready, (burst[arrivals[nxt]], arrivals[nxt])); nxt += 1
+            bt, i = heapq.heappop(ready)
+            order.append(i); start.append(current_time)
+            current_time += bt
+            if progress is not None and not len(order) % CPUCore.PROGRESS_EVERY: progress(len(order), current_time)
+        done = table.take(np.asarray(order, dtype=np.int64))
+        start = np.asarray(start, dtype=done.arrival_time.dtype)
+        done = done.with_schedule(start, start + done.burst_time)
+        return done, done
+
+    @staticmethod
+    def rr(processes, quantum, switch_cost=0, warmup=0, progress=None):
+        return CPUCore._dispatch(CPUCore._rr_table, processes, quantum, None, switch_cost, warmup, progress)
+
+    @staticmethod
+    def _rr_table(table, quantum, state=None, switch_cost=0, warmup=0, progress=None):
+        # Deque ready queue fed by a cursor over arrival-sorted entries: every process is enqueued exactly once on arrival.
+        # Arrivals landing within one slice are enqueued in registry order, ahead of the preempted process.
+        # A state snapshot (see RRState) resumes a run part-way instead of starting at t=0.
+        table = CPUCore._costed(table, switch_cost, warmup)
+        s = RRState(table) if state is None else state.copy()
+        n, arrival, pid, arrivals = len(table), s.arrival, s.pid, s.arrivals
+        rem, first_start, comp, switches, queue = s.rem, s.first_start, s.comp, s.switches, s.queue
+        current_time, done, nxt, last, steps = s.time, s.done, s.nxt, s.last, 0
+        s_id, s_start, s_end, o_pos = s.s_id, s.s_start, s.s_end, s.o_pos
+        while done < n:
+            steps += 1
+            if progress is not None and not steps % CPUCore.PROGRESS_STEPS: progress(done, current_time)
+            if not queue and arrival[arrivals[nxt]] > current_time: current_time = arrival[arrivals[nxt]]
+            nxt = CPUCore._admit(arrival, arrivals, nxt, current_time, queue)
+            i = queue.popleft()
+            if i != last:
+                switches[i] += 1
+                pause = switch_cost + (warmup if first_start[i] is not None else 0)
+                if pause: o_pos.append(len(s_id)); s_id.append(pid[i]); s_start.append(current_time); current_time += pause; s_end.append(current_time)
+                last = i
+            if first_start[i] is None: first_start[i] = current_time
+            exec_t = min(quantum, rem[i])
+            s_id.append(pid[i]); s_start.append(current_time)
+            current_time += exec_t
+            rem[i] -= exec_t
+            s_end.append(current_time)
+            nxt = CPUCore._admit(arrival, arrivals, nxt, current_time, queue)
+            if rem[i] == 0:
+                comp[i] = current_time; done += 1
+                if progress is not None and not done % CPUCore.PROGRESS_EVERY: progress(done, current_time)
+            else: queue.append(i)
+        return table.with_schedule(first_start, comp, switches), CPUCore._timeline(table, s_id, s_start, s_end, o_pos, switch_cost or warmup)
+
+    @staticmethod
+    def mlfq(processes, quanta=(2, 4, 8), boost=None, switch_cost=0, warmup=0, progress=None):
+        return CPUCore._dispatch(CPUCore._mlfq_table, processes, tuple(quanta), boost, switch_cost, warmup, progress)
+
+    @staticmethod
+    def _mlfq_table(table, quanta, boost, switch_cost=0, warmup=0, progress=None):
+        # Multilevel feedback queue: one deque per level, arrivals enter level 0, using up a level's quantum demotes
+        # one level (the last level round-robins; a None quantum there runs to completion). A process below level 0 is
+        # preempted by any arrival and resumes at the head of its queue with its unused allotment. Every `boost` time
+        # units all queued processes move back to level 0. Time jumps from event to event.
+        if not quanta: raise ValueError("MLFQ needs at least one level")
+        levels = len(quanta)
+        budget = [float('inf') if q is None else q for q in quanta]
+        table = CPUCore._costed(table, switch_cost, warmup)
+        n, arrival, pid = len(table), table.arrival_time.tolist(), table.id.tolist()
+        rem, level, used, first_start, comp, switches = table.burst_time.tolist(), [0] * n, [0] * n, [None] * n, [None] * n, [0] * n
+        arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+        queues = [deque() for _ in range(levels)]
+        current_time, done, nxt, waiting, next_boost, last, steps = 0, 0, 0, 0, boost, None, 0
+        s_id, s_start, s_end, s_level, o_pos = [], [], [], [], []
+        while done < n:
+            steps += 1
+            if progress is not None and not steps % CPUCore.PROGRESS_STEPS: progress(done, current_time)
+            if not waiting and arrival[arrivals[nxt]] > current_time: current_time = arrival[arrivals[nxt]]
+            before = len(queues[0])
+            nxt = CPUCore._admit(arrival, arrivals, nxt, current_time, queues[0])
+            waiting += len(queues[0]) - before
+            if boost and current_time >= next_boost:
+                for q in queues[1:]:
+                    for i in q: level[i], used[i] = 0, 0
+                    queues[0].extend(q); q.clear()
+                next_boost = (current_time // boost + 1) * boost
+            lv = 0
+            while not queues[lv]: lv += 1
+            i = queues[lv].popleft(); waiting -= 1
+            if i != last:
+                switches[i] += 1
+                pause = switch_cost + (warmup if first_start[i] is not None else 0)
+                if pause:
+                    o_pos.append(len(s_id)); s_id.append(pid[i]); s_start.append(current_time); s_level.append(lv)
+                    current_time += pause; s_end.append(current_time)
+                last = i
+            end = current_time + min(budget[lv] - used[i], rem[i])
+            if lv > 0:
+                # An arrival or boost that fell inside the switch overhead preempts right after it, before any work runs
+                if nxt < n: end = min(end, max(arrival[arrivals[nxt]], current_time))
+                if boost: end = min(end, max(next_boost, current_time))
+            if end > current_time or not rem[i]:
+                if first_start[i] is None: first_start[i] = current_time
+                s_id.append(pid[i]); s_start.append(current_time); s_end.append(end); s_level.append(lv)
+            rem[i] -= end - current_time; used[i] += end - current_time
+            current_time = end
+            before = len(queues[0])
+            nxt = CPUCore._admit(arrival, arrivals, nxt, current_time, queues[0])
+            waiting += len(queues[0]) - before
+            if rem[i] == 0:
+                comp[i] = current_time; done += 1
+                if progress is not None and not done % CPUCore.PROGRESS_EVERY: progress(done, current_time)
+                continue
+            waiting += 1
+            if used[i] >= budget[lv]:
+                level[i], used[i] = min(lv + 1, levels - 1), 0
+                queues[level[i]].append(i)
+            else:
+                queues[lv].appendleft(i)
+        timeline = CPUCore._timeline(table, s_id, s_start, s_end, o_pos, switch_cost or warmup, level=s_level)
+        return table.with_schedule(first_start, comp, switches), timeline
+
+    @staticmethod
+    def priority(processes, aging=None, progress=None):
+        return CPUCore._dispatch(CPUCore._priority_table, processes, False, aging, 0, 0, progress)
+
+    @staticmethod
+    def priority_preemptive(processes, aging=None, switch_cost=0, warmup=0, progress=None):
+        return CPUCore._dispatch(CPUCore._priority_table, processes, True, aging, switch_cost, warmup, progress)
+
+    @staticmethod
+    def _priority_table(table, preemptive, aging, switch_cost=0, warmup=0, progress=None):
+        # Lower priority value runs first, ties go to the earlier arrival (a table without a priority column is FCFS).
+        # The ready queue is an indexed heap keyed on (effective priority, arrival rank). With aging, every `aging` time
+        # units spent waiting lower a process's value by one, down to 0: each waiting process has one pending aging event,
+        # and firing it is a single decrease_key, so aging is O(log n) per event instead of a rescan of the ready queue.
+        # Preemptive mode stops at arrivals and aging events; the runner keeps the CPU unless strictly outranked.
+        table = CPUCore._costed(table, switch_cost, warmup)
+        n, arrival, pid = len(table), table.arrival_time.tolist(), table.id.tolist()
+        arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+        arrival = [arrival[i] for i in arrivals]  # everything below is indexed by arrival rank
+        rem = table.burst_time[arrivals].tolist()
+        prio = table.priority[arrivals].tolist() if table.priority is not None else [0] * n
+        first_start, comp, clock, switches = [None] * n, [None] * n, [None] * n, [0] * n
+        ready, events = IndexedHeap(n), []
+        current_time, done, nxt, running, last, steps = 0, 0, 0, None, None, 0
+        s_id, s_start, s_end, o_pos = [], [], [], []
+
+        def enqueue(k, t):
+            ready.push(k, (prio[k], k))
+            if aging and prio[k] > 0: clock[k] = t + aging; heapq.heappush(events, (t + aging, k))
+
+        def admit_and_age(t, nxt):
+            while nxt < n and arrival[nxt] <= t: enqueue(nxt, arrival[nxt]); nxt += 1
+            while events and (events[0][0] <= t or events[0][1] not in ready or clock[events[0][1]] != events[0][0]):
+                e, k = heapq.heappop(events)
+                if k not in ready or clock[k] != e: continue  # stale: dispatched since this event was queued
+                steps = min(prio[k], (t - e) // aging + 1)
+                prio[k] -= steps
+                ready.decrease_key(k, (prio[k], k))
+                if prio[k] > 0: clock[k] = e + steps * aging; heapq.heappush(events, (clock[k], k))
+            return nxt
+
+        while done < n:
+            steps += 1
+            if progress is not None and not steps % CPUCore.PROGRESS_STEPS: progress(done, current_time)
+            if running is None:
+                if not ready and arrival[nxt] > current_time: current_time = arrival[nxt]
+                nxt = admit_and_age(current_time, nxt)
+                running = ready.pop()
+                if running != last:
+                    switches[running] += 1
+                    pause = switch_cost + (warmup if first_start[running] is not None else 0)
+                    if pause: o_pos.append(len(s_id)); s_id.append(pid[arrivals[running]]); s_start.append(current_time); current_time += pause; s_end.append(current_time)
+            end = current_time + rem[running]
+            if preemptive:
+                # Arrivals and aging events that fell inside the switch overhead are handled right after it, before any work runs
+                if nxt < n: end = min(end, max(arrival[nxt], current_time))
+                if events: end = min(end, max(events[0][0], current_time))
+            if end > current_time or not rem[running]:
+                if first_start[running] is None: first_start[running] = current_time
+                if last == running and s_end[-1] == current_time and (not o_pos or o_pos[-1] != len(s_id) - 1): s_end[-1] = end
+                else: s_id.append(pid[arrivals[running]]); s_start.append(current_time); s_end.append(end)
+            rem[running] -= end - current_time
+            current_time, last = end, running
+            if rem[running] == 0:
+                comp[running] = current_time; done += 1; running = None
+                if progress is not None and not done % CPUCore.PROGRESS_EVERY: progress(done, current_time)
+            if not preemptive: continue
+            nxt = admit_and_age(current_time, nxt)
+            if running is not None and ready and ready.key(ready.peek())[0] < prio[running]:
+                enqueue(running, current_time); running = None
+        order = np.argsort(arrivals)  # rank -> registry position
+        first_start, comp, switches = np.asarray(first_start)[order], np.asarray(comp)[order], np.asarray(switches)[order]
+        return table.with_schedule(first_start, comp, switches), CPUCore._timeline(table, s_id, s_start, s_end, o_pos, switch_cost or warmup)
+
+    @staticmethod
+    def srtf(processes, switch_cost=0, warmup=0, progress=None):
+        return CPUCore._dispatch(CPUCore._srtf_table, processes, switch_cost, warmup, progress)
+
+    @staticmethod
+    def _srtf_table(table, switch_cost=0, warmup=0, progress=None):
+        # Preemptive SJF. Time only advances to the next arrival or completion, and a heap keyed on
+        # (remaining, arrival rank) picks the runner, so a running process keeps the CPU on ties.
+        table = CPUCore._costed(table, switch_cost, warmup)
+        n, arrival, burst, pid = len(table), table.arrival_time.tolist(), table.burst_time.tolist(), table.id.tolist()
+        first_start, comp, switches = [None] * n, [None] * n, [0] * n
+        arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+        current_time, ready, done, nxt, last, steps = 0, [], 0, 0, None, 0
+        s_id, s_start, s_end, o_pos = [], [], [], []
+        while done < n:
+            steps += 1
+            if progress is not None and not steps % CPUCore.PROGRESS_STEPS: progress(done, current_time)
+            if not ready and arrival[arrivals[nxt]] > current_time: current_time = arrival[arrivals[nxt]]
+            while nxt < n and arrival[arrivals[nxt]] <= current_time:
+                heapq.heappush(ready, (burst[arrivals[nxt]], nxt)); nxt += 1
+            rem, k = ready[0]
+            i = arrivals[k]
+            if k != last:
+                switches[i] += 1
+                pause = switch_cost + (warmup if first_start[i] is not None else 0)
+                if pause: o_pos.append(len(s_id)); s_id.append(pid[i]); s_start.append(current_time); current_time += pause; s_end.append(current_time)
+            # An arrival that fell inside the switch overhead is admitted right after it, before any work runs
+            end = current_time + rem if nxt == n else min(current_time + rem, max(arrival[arrivals[nxt]], current_time))
+            if end > current_time or not rem:
+                if first_start[i] is None: first_start[i] = current_time
+                if last == k and s_end[-1] == current_time and (not o_pos or o_pos[-1] != len(s_id) - 1): s_end[-1] = end
+                else: s_id.append(pid[i]); s_start.append(current_time); s_end.append(end)
+            rem -= end - current_time
+            current_time, last = end, k
+            if rem == 0:
+                heapq.heappop(ready); comp[i] = current_time; done += 1
+                if progress is not None and not done % CPUCore.PROGRESS_EVERY: progress(done, current_time)
+            else: heapq.heapreplace(ready, (rem, k))
+        return table.with_schedule(first_start, comp, switches), CPUCore._timeline(table, s_id, s_start, s_end, o_pos, switch_cost or warmup)
@@ -0,0 +1,125 @@
+"""Render planning for Gantt charts: slice coalescing and level-of-detail downsampling.
+
+Nothing here draws. A plan is either per-process bar arrays (drawn as one colored bar trace) or, once the slice
+count exceeds the budget, an occupancy matrix over fixed time bins, so the drawing cost no longer
+grows with the timeline. Context-switch overhead slices get a band of their own: a separate bar group
+in bars mode, a trailing SWITCH row in bands mode.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .timeline import CompactTimeline
+
+GANTT_BUDGET = 4000   # max bar segments drawn before switching to occupancy bands
+GANTT_BINS = 800      # time bins for occupancy bands, roughly one per horizontal pixel
+GANTT_MAX_ROWS = 48   # band rows; beyond this processes are grouped into id ranges
+GANTT_LABELS = 60     # text labels are only drawn for timelines up to this many slices
+
+GanttBars = namedtuple('GanttBars', 'id row start duration')
+GanttPlan = namedtuple('GanttPlan', 'mode bars rows edges occupancy slices overhead')
+
+
+def timeline_columns(timeline):
+    # (id, start, end, core-or-None) arrays from a SliceTable / ProcessTable / CompactTimeline or a list of slice dicts
+    if isinstance(timeline, CompactTimeline): timeline = timeline.runs()
+    if hasattr(timeline, 'start_time'):
+        return timeline.id, timeline.start_time, timeline.completion_time, getattr(timeline, 'core', None)
+    if not timeline: return np.zeros(0, np.int64), np.zeros(0), np.zeros(0), None
+    ids = np.fromiter((x['id'] for x in timeline), np.int64, len(timeline))
+    if 'start_time' in timeline[0]:
+        start = np.array([x['start_time'] for x in timeline])
+        end = np.array([x['completion_time'] for x in timeline])
+    else:  # Schedular.py slices carry burst_time + completion_time
+        end = np.array([x['completion_time'] for x in timeline])
+        start = end - np.array([x['burst_time'] for x in timeline])
+    core = np.fromiter((x['core'] for x in timeline), np.int64, len(timeline)) if 'core' in timeline[0] else None
+    return ids, start, end, core
+
+
+def coalesce(ids, start, end, lane=None):
+    # Merge back-to-back slices of the same process (on the same lane); returns merged (ids, start, end, lane)
+    if len(ids) < 2: return ids, start, end, lane
+    order = np.lexsort((start, lane)) if lane is not None else np.argsort(start, kind='stable')
+    ids, start, end = ids[order], start[order], end[order]
+    brk = (ids[1:] != ids[:-1]) | (start[1:] != end[:-1])
+    if lane is not None:
+        lane = lane[order]
+        brk |= lane[1:] != lane[:-1]
+    first = np.flatnonzero(np.concatenate(([True], brk)))
+    last = np.concatenate((first[1:] - 1, [len(ids) - 1]))
+    return ids[first], start[first], end[last], None if lane is None else lane[first]
+
+
+def _busy_before(start, end, t):
+    # Busy time accumulated by non-overlapping, start-sorted slices up to each time in t
+    dur = end - start
+    cum = np.concatenate(([0], np.cumsum(dur)))
+    k = np.searchsorted(start, t, side='right') - 1
+    kc = np.clip(k, 0, None)
+    return np.where(k < 0, 0, cum[kc] + np.minimum(t - start[kc], dur[kc]))
+
+
+def _union(start, end):
+    # Start-sorted intervals merged where they overlap, so a row grouping processes that ran at once on different
+    # cores counts each instant once
+    if len(start) < 2: return start, end
+    reach = np.maximum.accumulate(end)
+    first = np.flatnonzero(np.concatenate(([True], start[1:] > reach[:-1])))
+    return start[first], reach[np.concatenate((first[1:] - 1, [len(start) - 1]))]
+
+
+def occupancy(row_of, start, end, n_rows, bins):
+    # Fraction of each time bin in which each row has something on a CPU (0..1, also for overlapping SMP slices)
+    t0, t1 = float(start.min()), float(end.max())
+    edges = np.linspace(t0, t1 if t1 > t0 else t0 + 1, bins + 1)
+    occ = np.zeros((n_rows, bins))
+    order = np.lexsort((start, row_of))
+    row_of, start, end = row_of[order], start[order], end[order]
+    bounds = np.searchsorted(row_of, np.arange(n_rows + 1))
+    for r in range(n_rows):
+        lo, hi = bounds[r], bounds[r + 1]
+        if lo < hi: occ[r] = np.diff(_busy_before(*_union(start[lo:hi], end[lo:hi]), edges)) / np.diff(edges)
+    return edges, occ
+
+
+def gantt_plan(timeline, lanes=False, budget=GANTT_BUDGET, bins=GANTT_BINS, max_rows=GANTT_MAX_ROWS):
+    # lanes=True draws one row per core (SMP timelines) instead of one row per process. Compact timelines are drawn
+    # from their runs, which coalesce() would merge into the same bars anyway.
+    if isinstance(timeline, CompactTimeline): timeline = timeline.runs()
+    ids, start, end, core = timeline_columns(timeline)
+    lane = core if lanes else None
+    over = getattr(timeline, 'overhead', None)
+    o_start = o_end = np.zeros(0)
+    if over is not None and over.any():
+        work = over == 0
+        o_start, o_end = start[~work], end[~work]
+        ids, start, end, lane = ids[work], start[work], end[work], None if lane is None else lane[work]
+    ids, start, end, lane = coalesce(ids, start, end, lane)
+    if len(ids) + len(o_start) <= budget:
+        order = np.argsort(ids, kind='stable')
+        cuts = np.flatnonzero(np.diff(ids[order])) + 1
+        bars = [GanttBars(int(ids[g[0]]), (lane if lane is not None else ids)[g], start[g], end[g] - start[g])
+                for g in np.split(order, cuts)] if len(ids) else []
+        overhead = GanttBars(None, None, o_start, o_end - o_start) if len(o_start) else None
+        return GanttPlan('bars', bars, None, None, None, len(ids), overhead)
+    if lane is not None:
+        keys = np.unique(lane)
+        row_of, rows = np.searchsorted(keys, lane), [f"CORE_{c + 1:02d}" for c in keys]
+    else:
+        keys = np.unique(ids)
+        rank = np.searchsorted(keys, ids)
+        if len(keys) <= max_rows:
+            row_of, rows = rank, [f"P{k}" for k in keys]
+        else:
+            group = np.arange(len(keys)) * max_rows // len(keys)
+            row_of = group[rank]
+            lo = np.searchsorted(group, np.arange(max_rows))
+            hi = np.concatenate((lo[1:], [len(keys)])) - 1
+            rows = [f"P{keys[a]}-P{keys[b]}" for a, b in zip(lo, hi)]
+    if len(o_start) and lane is None:
+        row_of, rows = np.concatenate((row_of, np.full(len(o_start), len(rows)))), rows + ['SWITCH']
+        start, end = np.concatenate((start, o_start)), np.concatenate((end, o_end))
+    edges, occ = occupancy(row_of, start, end, len(rows), bins)
+    return GanttPlan('bands', None, rows, edges, occ, len(ids), None)
@@ -0,0 +1,63 @@
+"""Indexed binary min-heap with decrease-key, for engines whose ready-queue keys change while queued."""
+
+
+class IndexedHeap:
+    # Items are ints in range(capacity); pos[item] is its slot in the heap array (-1 when absent), so
+    # contains / key lookup are O(1) and decrease_key is one O(log n) sift instead of a rescan or lazy re-push.
+    __slots__ = ('heap', 'keys', 'pos')
+
+    def __init__(self, capacity):
+        self.heap, self.keys, self.pos = [], [None] * capacity, [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def key(self, item):
+        return self.keys[item]
+
+    def peek(self):
+        return self.heap[0]
+
+    def push(self, item, key):
+        self.keys[item] = key
+        self.heap.append(item)
+        self.pos[item] = len(self.heap) - 1
+        self._up(len(self.heap) - 1)
+
+    def pop(self):
+        heap, top = self.heap, self.heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0], self.pos[last] = last, 0
+            self._down(0)
+        return top
+
+    def decrease_key(self, item, key):
+        self.keys[item] = key
+        self._up(self.pos[item])
+
+    def _up(self, i):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        item, key = heap[i], keys[heap[i]]
+        while i:
+            parent = (i - 1) >> 1
+            if keys[heap[parent]] <= key: break
+            heap[i] = heap[parent]; pos[heap[i]] = i
+            i = parent
+        heap[i], pos[item] = item, i
+
+    def _down(self, i):
+        heap, keys, pos, n = self.heap, self.keys, self.pos, len(self.heap)
+        item, key = heap[i], keys[heap[i]]
+        while True:
+            child = 2 * i + 1
+            if child >= n: break
+            if child + 1 < n and keys[heap[child + 1]] < keys[heap[child]]: child += 1
+            if key <= keys[heap[child]]: break
+            heap[i] = heap[child]; pos[heap[i]] = i
+            i = child
+        heap[i], pos[item] = item, i
@@ -0,0 +1,91 @@
+"""Incremental rescheduling: extend a finished single-core schedule with processes appended to its workload.
+
+Checkpoints are the idle boundaries of the previous run: times c by which every process that arrived before c has
+completed. The engine state there is empty (no ready queue, nothing running, no pending aging or boost work), so a
+checkpoint is fully described by c and costs nothing to keep. The engines only act on arrivals that have already
+happened, so processes arriving at or after c cannot change anything before it. A rerun keeps the old schedule up to
+the latest checkpoint at or before the earliest new arrival and re-simulates only the processes arriving from there on.
+A busy workload may have no checkpoint near the new arrivals; when the suffix would be most of the workload, splicing
+saves nothing and the rerun is an explicit full run instead.
+"""
+
+import numpy as np
+
+from .schedulers import get_scheduler
+from .table import ProcessTable, SliceTable
+from .telemetry import span
+from .timeline import CompactTimeline
+
+RESUME_MAX_FRACTION = 0.5   # re-simulating more than this share of the workload falls back to a full run
+
+
+def _settled(arrival, completion, t):
+    # arrival sorted, completion aligned with it: whether everything arriving before each time in t completed by it
+    latest = np.concatenate(([-np.inf], np.maximum.accumulate(completion)))
+    return latest[np.searchsorted(arrival, t, side='left')] <= t
+
+
+def checkpoints(final):
+    # Sorted checkpoint times of a finished schedule (a subset of its distinct arrival times)
+    order = np.argsort(final.arrival_time, kind='stable')
+    arrival = final.arrival_time[order]
+    times = arrival[np.r_[True, arrival[1:] != arrival[:-1]]]
+    return times[_settled(arrival, final.completion_time[order], times)]
+
+
+def resume_point(final, t):
+    # Latest checkpoint at or before t; t itself qualifies when every earlier arrival has completed by then
+    order = np.argsort(final.arrival_time, kind='stable')
+    arrival = final.arrival_time[order]
+    times = np.append(arrival[:np.searchsorted(arrival, t, side='right')], t)
+    return times[_settled(arrival, final.completion_time[order], times)].max()
+
+
+def extends(previous, table):
+    # Whether table is previous with rows appended (the only edit Registry.append / extend make)
+    m = len(previous)
+    if len(table) < m: return False
+    for c in ('id', 'arrival_time', 'burst_time', 'priority'):
+        a, b = getattr(previous, c), getattr(table, c)
+        if (a is None) != (b is None) or (a is not None and not np.array_equal(a, b[:m])): return False
+    return True
+
+
+def extend_schedule(scheduler, previous_table, previous, table, telemetry=None, progress=None, **params):
+    # Schedule of `table` under scheduler(**params), given `previous`: the single-core Schedule of previous_table under
+    # the same parameters. Anything other than appended rows (edits, removals, multi-core results) gets a full run, as
+    # does a suffix longer than RESUME_MAX_FRACTION of the workload. With a Telemetry the rerun is a `resume.<NAME>`
+    # span around the engine span; its `fallback` attribute names why a full run was taken (multi-core, edited or
+    # suffix). progress counts re-simulated processes only.
+    cls = get_scheduler(scheduler) if isinstance(scheduler, str) else scheduler
+    if previous is None: return cls.run(table, telemetry=telemetry, progress=progress, **params)
+    m = len(previous_table)
+    with span(telemetry, f'resume.{cls.name}', algorithm=cls.name, processes=len(table)) as attrs:
+        if previous.util is not None: attrs['fallback'] = 'multi-core'
+        elif not extends(previous_table, table): attrs['fallback'] = 'edited'
+        elif len(table) == m:
+            attrs['resimulated'] = 0
+            return previous
+        else:
+            at = resume_point(previous.final, table.arrival_time[m:].min()).item()
+            tail = np.flatnonzero(table.arrival_time >= at)
+            attrs['resumed_at'] = at
+            if len(tail) > RESUME_MAX_FRACTION * len(table): attrs['fallback'] = 'suffix'
+        if 'fallback' in attrs:
+            attrs['resimulated'] = len(table)
+            return cls.run(table, telemetry=telemetry, progress=progress, **params)
+        attrs['resimulated'] = len(tail)
+        suffix = cls.run(table.take(tail), telemetry=telemetry, progress=progress, **params)
+        kept = np.flatnonzero(previous.final.arrival_time < at)
+        final = ProcessTable.concat([previous.final.take(kept), suffix.final])
+        # Dispatch-ordered rows are already in order: everything kept ran before the suffix. Registry-ordered rows are
+        # interleaved back; kept positions are the same in both tables because rows were only appended.
+        if cls.ordering == 'registry': final = final.take(np.argsort(np.concatenate((kept, tail)), kind='stable'))
+        if previous.timeline is previous.final:
+            timeline = final  # FCFS / SJF: one slice per process, the final table doubles as the timeline
+        elif isinstance(previous.timeline, CompactTimeline):
+            timeline = CompactTimeline.concat([previous.timeline.before(at), suffix.timeline])
+        else:
+            cut = np.searchsorted(previous.timeline.start_time, at, side='left')
+            timeline = SliceTable.concat([previous.timeline.take(slice(0, cut)), suffix.timeline])
+    return suffix._replace(final=final, timeline=timeline)
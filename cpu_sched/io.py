@@ -0,0 +1,105 @@
+"""Workload and result files: CSV, Parquet, JSONL and a memory-mapped binary trace, picked by file extension."""
+
+import os
+
+import numpy as np
+
+from .table import ProcessTable
+from .timeline import CompactTimeline
+
+# Binary trace: a 24-byte header, then one contiguous little-endian int64 block per column (id, arrival_time,
+# burst_time and, if flagged, priority). Columns load as zero-copy numpy.memmap views, so a multi-GB trace is
+# simulated without parsing it into Python objects.
+TRACE_MAGIC = b'CPUTRACE'
+TRACE_VERSION = 1
+TRACE_HEADER = np.dtype([('magic', 'S8'), ('version', '<u4'), ('flags', '<u4'), ('n', '<u8')])
+TRACE_PRIORITY = 1  # flags bit: a priority column follows burst_time
+
+
+def _format(path):
+    ext = os.path.splitext(getattr(path, 'name', path))[1].lower()  # paths or uploaded file objects
+    if ext in ('.csv', '.txt'): return 'csv'
+    if ext in ('.parquet', '.pq'): return 'parquet'
+    if ext in ('.jsonl', '.ndjson'): return 'jsonl'
+    if ext in ('.trace', '.bin'): return 'trace'
+    raise ValueError(f"Unsupported workload format '{ext}' (expected .csv, .parquet, .jsonl or .trace)")
+
+
+def _require_parquet():
+    # Parquet goes through pyarrow, an optional dependency (the `parquet` extra)
+    try: import pyarrow  # noqa: F401
+    except ImportError: raise ImportError("Parquet files need pyarrow: pip install 'cpu-sched[parquet]' (or pip install pyarrow)") from None
+
+
+def read_frame(path, fmt=None):
+    import pandas as pd
+    fmt = fmt or _format(path)
+    if fmt == 'csv': return pd.read_csv(path)
+    if fmt == 'parquet':
+        _require_parquet()
+        return pd.read_parquet(path)
+    if fmt == 'trace': return table_to_frame(read_trace(path))
+    return pd.read_json(path, lines=True)
+
+
+def write_frame(df, path, fmt=None):
+    fmt = fmt or _format(path)
+    if fmt == 'csv': df.to_csv(path, index=False)
+    elif fmt == 'parquet':
+        _require_parquet()
+        df.to_parquet(path, index=False)
+    elif fmt == 'trace': write_trace(table_from_frame(df), path)
+    else: df.to_json(path, orient='records', lines=True)
+
+
+def read_trace(path):
+    # Paths are memory-mapped read-only; file objects (e.g. uploads) are read into one buffer and viewed in place
+    raw = np.frombuffer(path.read(), dtype=np.uint8) if hasattr(path, 'read') else np.memmap(path, dtype=np.uint8, mode='r')
+    if len(raw) < TRACE_HEADER.itemsize: raise ValueError("Not a binary trace: file is shorter than the header")
+    header = raw[:TRACE_HEADER.itemsize].view(TRACE_HEADER)[0]
+    if header['magic'] != TRACE_MAGIC: raise ValueError("Not a binary trace: bad magic bytes")
+    if header['version'] != TRACE_VERSION: raise ValueError(f"Unsupported trace version {header['version']}")
+    n, k = int(header['n']), 4 if header['flags'] & TRACE_PRIORITY else 3
+    body = raw[TRACE_HEADER.itemsize:TRACE_HEADER.itemsize + k * n * 8]
+    if len(body) != k * n * 8: raise ValueError(f"Truncated trace: expected {n} rows")
+    cols = body.view('<i8').reshape(k, n)
+    return ProcessTable(cols[0], cols[1], cols[2], priority=cols[3] if k == 4 else None)
+
+
+def write_trace(table, path):
+    if not isinstance(table, ProcessTable): raise ValueError("Binary traces hold workloads (id, arrival_time, burst_time, priority) only")
+    if not np.issubdtype(table.arrival_time.dtype, np.integer): raise ValueError("Binary traces need integer arrival/burst times")
+    cols = [table.id, table.arrival_time, table.burst_time] + ([table.priority] if table.priority is not None else [])
+    header = np.array([(TRACE_MAGIC, TRACE_VERSION, TRACE_PRIORITY if table.priority is not None else 0, len(table))], dtype=TRACE_HEADER)
+    if hasattr(path, 'write'):
+        path.write(header.tobytes())
+        for col in cols: path.write(np.ascontiguousarray(col, dtype='<i8').tobytes())
+        return
+    with open(path, 'wb') as f:
+        header.tofile(f)
+        for col in cols: np.ascontiguousarray(col, dtype='<i8').tofile(f)
+
+
+def table_from_frame(df):
+    missing = {'arrival_time', 'burst_time'} - set(df.columns)
+    if missing: raise ValueError(f"Workload is missing column(s): {', '.join(sorted(missing))}")
+    ids = df['id'].to_numpy() if 'id' in df.columns else range(1, len(df) + 1)
+    priority = df['priority'].to_numpy() if 'priority' in df.columns else None
+    return ProcessTable(ids, df['arrival_time'].to_numpy(), df['burst_time'].to_numpy(), priority=priority)
+
+
+def table_to_frame(table):
+    import pandas as pd
+    if isinstance(table, CompactTimeline): table = table.decode()
+    return pd.DataFrame({c: getattr(table, c) for c in table.COLUMNS if getattr(table, c, None) is not None})
+
+
+def read_workload(path, fmt=None):
+    fmt = fmt or _format(path)
+    return read_trace(path) if fmt == 'trace' else table_from_frame(read_frame(path, fmt))
+
+
+def write_table(table, path, fmt=None):
+    fmt = fmt or _format(path)
+    if fmt == 'trace': write_trace(table, path)
+    else: write_frame(table_to_frame(table), path, fmt)
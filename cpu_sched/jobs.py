@@ -0,0 +1,141 @@
+"""Background simulation jobs: a bounded worker pool behind a job queue, with progress polling and cancellation.
+
+A JobRunner owns a fixed number of workers (threads by default, processes with processes=True). Submitted callables
+wait in the executor's queue and run in submission order. Each one receives a Progress callback to hand to the engines
+(see CPUCore.PROGRESS_EVERY / PROGRESS_STEPS). It records the processes completed and the simulated clock in the job's shared state,
+and raises JobCancelled at the next report after Job.cancel(). Frontends keep the Job handle and poll it, so the
+submitting thread never waits on a simulation, and every caller shares one bounded pool.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+JOB_STATES = ('queued', 'running', 'done', 'failed', 'cancelled')
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Progress:
+    # Engine progress callback bound to a job's state (a dict, or a manager dict shared with worker processes).
+    # A job that runs several engines calls advance(n) after each one so the count keeps growing across runs.
+    def __init__(self, state):
+        self.state, self.base = state, 0
+
+    def __call__(self, done, time):
+        if self.state['cancel']: raise JobCancelled()
+        self.state.update(done=self.base + done, time=time)
+
+    def advance(self, n):
+        if self.state['cancel']: raise JobCancelled()
+        self.base += n
+        self.state.update(done=self.base)
+
+
+def _execute(fn, args, kwargs, progress):
+    if progress.state['cancel']: raise JobCancelled()
+    progress.state.update(status='running', started=time.time())
+    return fn(*args, progress=progress, **kwargs)
+
+
+class Job:
+    # Handle of a submitted run, safe to poll from any thread. done / total count processes (total may be None when
+    # the work has no natural size); time is the simulated clock at the last report.
+    def __init__(self, id, label, total, state, future):
+        self.id, self.label, self.total, self.submitted = id, label, total, time.time()
+        self._state, self._future = state, future
+
+    @property
+    def status(self):
+        f = self._future
+        if f.cancelled() or (f.done() and isinstance(f.exception(), JobCancelled)): return 'cancelled'
+        if f.done(): return 'failed' if f.exception() is not None else 'done'
+        return self._state['status']
+
+    @property
+    def finished(self):
+        return self._future.done()
+
+    @property
+    def done(self):
+        return self._state['done']
+
+    @property
+    def time(self):
+        return self._state['time']
+
+    @property
+    def fraction(self):
+        # Engines report periodically, not on the last completion, so the count is topped up once the job has succeeded
+        if self.status == 'done': return 1.0
+        return min(self.done / self.total, 1.0) if self.total else None
+
+    @property
+    def elapsed(self):
+        started = self._state['started']
+        return 0.0 if started is None else time.time() - started
+
+    @property
+    def error(self):
+        return self._future.exception() if self.status == 'failed' else None
+
+    def result(self, timeout=None):
+        # Blocks up to timeout; raises JobCancelled for cancelled jobs and re-raises a failed job's exception
+        if self._future.cancelled(): raise JobCancelled()
+        return self._future.result(timeout)
+
+    def cancel(self):
+        # A queued job is dropped; a running one stops at its engine's next progress report. Process pools pre-feed
+        # their workers, so a job already handed to a worker process is cancelled when it starts instead.
+        self._state['cancel'] = True
+        self._future.cancel()
+
+
+class JobRunner:
+    # One shared pool per process (the dashboard keeps it in st.cache_resource). At most `keep` jobs stay retrievable
+    # by id, plus any still unfinished; beyond that the oldest finished ones are forgotten. Process workers need a picklable fn and arguments.
+    def __init__(self, workers=2, processes=False, keep=64):
+        if workers < 1: raise ValueError("workers must be >= 1")
+        self.workers, self.processes, self.keep = workers, processes, keep
+        # Deferred so `import cpu_sched` does not pull in multiprocessing
+        if processes:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._manager, self._pool = multiprocessing.Manager(), ProcessPoolExecutor(max_workers=workers)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            self._manager, self._pool = None, ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cpu-sched-job')
+        self._jobs, self._ids, self._lock = OrderedDict(), itertools.count(1), threading.Lock()
+
+    def submit(self, fn, *args, total=None, label=None, **kwargs):
+        # Queues fn(*args, progress=<Progress>, **kwargs) and returns its Job
+        fields = {'status': 'queued', 'cancel': False, 'done': 0, 'time': None, 'started': None}
+        state = self._manager.dict(fields) if self._manager is not None else fields
+        with self._lock:
+            job_id = next(self._ids)
+            job = Job(job_id, label or getattr(fn, '__name__', 'job'), total, state, self._pool.submit(_execute, fn, args, kwargs, Progress(state)))
+            self._jobs[job_id] = job
+            # Oldest finished jobs go first; unfinished ones are kept however many there are, but never block eviction
+            excess = len(self._jobs) - self.keep
+            for old in [j for j in self._jobs.values() if j.finished][:max(excess, 0)]: del self._jobs[old.id]
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def jobs(self):
+        with self._lock: return list(self._jobs.values())
+
+    @property
+    def pending(self):
+        # Jobs queued or running: the load on the shared pool
+        return sum(not j.finished for j in self.jobs())
+
+    def shutdown(self, cancel=True):
+        if cancel:
+            for job in self.jobs(): job.cancel()
+        self._pool.shutdown(wait=True)
+        if self._manager is not None: self._manager.shutdown()
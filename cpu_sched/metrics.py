@@ -0,0 +1,31 @@
+"""Run summaries: totals, means and tail percentiles of waiting, turnaround and response time, plus throughput."""
+
+import numpy as np
+
+from .timeline import timeline_totals
+
+PERCENTILES = (50, 95, 99)
+LATENCIES = ('wait', 'tat', 'response')
+RUN_COLUMNS = ['processes', 'makespan', 'cpu_util', 'throughput', 'slices', 'switches', 'overhead']
+SUMMARY_COLUMNS = RUN_COLUMNS + [f'{stat}_{m}' for m in LATENCIES for stat in ('sum', 'avg', *(f'p{q}' for q in PERCENTILES))]
+
+
+def summarize(final, timeline=None, cores=1):
+    # One pass over a finished ProcessTable: the three latency columns are stacked and every percentile comes from a
+    # single np.percentile call. Response time is first dispatch minus arrival. The makespan is the last completion
+    # (taken from the timeline when given) and utilization is busy time over makespan x cores, as in the UI, so
+    # context-switch overhead shows up as lost utilization. Non-preemptive engines count one switch per process.
+    n = len(final)
+    slices, overhead, makespan = timeline_totals(final if timeline is None else timeline) if n else (0, 0, 0)
+    row = {'processes': n, 'slices': slices, 'switches': n if final.switches is None else final.switches.sum().item(), 'overhead': overhead}
+    if not n:
+        return dict(row, makespan=0, cpu_util=0.0, throughput=0.0, **{c: 0.0 for c in SUMMARY_COLUMNS[len(RUN_COLUMNS):]})
+    busy = final.burst_time.sum().item()
+    lat = np.stack([final.waiting_time, final.turnaround_time, final.start_time - final.arrival_time]).astype(float)
+    sums, pct = lat.sum(axis=1), np.percentile(lat, PERCENTILES, axis=1)
+    row.update(makespan=makespan, cpu_util=busy / (makespan * cores) * 100 if makespan else 0.0,
+               throughput=n / makespan if makespan else 0.0)
+    for k, m in enumerate(LATENCIES):
+        row[f'sum_{m}'], row[f'avg_{m}'] = sums[k].item(), sums[k].item() / n
+        for j, q in enumerate(PERCENTILES): row[f'p{q}_{m}'] = pct[j, k].item()
+    return row
@@ -0,0 +1,76 @@
+"""Append-only columnar process registry for interactive frontends."""
+
+import numpy as np
+
+from .cache import fingerprint
+from .table import ProcessTable
+
+
+class Registry:
+    # Growable NumPy columns (capacity doubles) plus running aggregates, so adding a process is amortized O(1) and
+    # the KPI strip never rescans the registry. Rows are never overwritten in place: clear() and replace() start fresh
+    # buffers, so tables handed out by table() (and results cached from them) stay valid.
+    COLUMNS = ('id', 'arrival_time', 'burst_time', 'priority')
+
+    def __init__(self, capacity=64):
+        self._capacity = capacity
+        self.clear()
+
+    def __len__(self):
+        return self._n
+
+    def clear(self):
+        self._cols = {c: np.zeros(self._capacity, dtype=np.int64) for c in self.COLUMNS}
+        self._n, self.next_id, self.total_burst = 0, 1, 0
+        self._table = self._print = None
+
+    def _reserve(self, extra, dtype=np.int64):
+        size, need = len(self._cols['id']), self._n + extra
+        time_dtype = np.result_type(self._cols['arrival_time'].dtype, dtype)
+        if need <= size and time_dtype == self._cols['arrival_time'].dtype: return
+        size = max(size, 1)
+        while size < need: size *= 2
+        for c, col in self._cols.items():
+            grown = np.zeros(size, dtype=time_dtype if c in ('arrival_time', 'burst_time') else col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[c] = grown
+
+    def _added(self, k, ids, burst):
+        self._n += k
+        self.next_id = max(self.next_id, int(ids.max()) + 1)
+        self.total_burst += burst.sum().item()
+        self._table = self._print = None
+
+    def append(self, arrival_time, burst_time, priority=0):
+        # Registers one process under the next free id and returns that id
+        pid = self.next_id
+        self._reserve(1, np.asarray([arrival_time, burst_time]).dtype)
+        for c, v in zip(self.COLUMNS, (pid, arrival_time, burst_time, priority)): self._cols[c][self._n] = v
+        self._added(1, np.asarray([pid]), np.asarray([burst_time]))
+        return pid
+
+    def extend(self, table):
+        # Bulk append of a ProcessTable; a missing priority column is stored as 0
+        k = len(table)
+        if not k: return
+        self._reserve(k, table.arrival_time.dtype)
+        lo, hi = self._n, self._n + k
+        for c in self.COLUMNS:
+            col = getattr(table, c)
+            self._cols[c][lo:hi] = 0 if col is None else col
+        self._added(k, table.id, table.burst_time)
+
+    def replace(self, table):
+        self.clear()
+        self.extend(table)
+
+    def table(self):
+        # Zero-copy ProcessTable view of the registered rows, rebuilt only after a mutation
+        if self._table is None:
+            self._table = ProcessTable(*(self._cols[c][:self._n] for c in self.COLUMNS[:3]), priority=self._cols['priority'][:self._n])
+        return self._table
+
+    def fingerprint(self):
+        # Content hash for ResultCache keys, computed once per mutation instead of on every lookup
+        if self._print is None: self._print = fingerprint(self.table())
+        return self._print
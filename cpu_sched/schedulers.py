@@ -0,0 +1,159 @@
+"""Pluggable scheduler registry shared by both frontends, the batch audit and the CLI.
+
+A scheduler is a ModernProcessScheduler subclass registered under a name with register_scheduler(). It declares the
+keyword parameters it accepts (with defaults) and the CPUCore / SMPCore engines that implement it; every run goes
+through those columnar event loops and comes back as a Schedule. Menus are built from SCHEDULERS, so a newly
+registered algorithm appears in streamlit_app.py, Schedular.py, audit_batch and `cpu-sched run` without UI changes.
+"""
+
+from collections import namedtuple
+
+from .core import CPUCore
+from .metrics import summarize
+from .smp import SMPCore
+from .table import ProcessTable
+from .telemetry import engine_stats, span
+
+# final: ProcessTable with the schedule columns; timeline: CompactTimeline (FCFS / SJF: the final table); util: per-core utilization % (multi-core runs only)
+Schedule = namedtuple('Schedule', 'final timeline util', defaults=(None,))
+COST_PARAMS = ('switch_cost', 'warmup')
+
+SCHEDULERS = {}  # name -> ModernProcessScheduler subclass, in registration (menu) order
+
+
+def register_scheduler(name, cls):
+    # Registers cls under `name` (upper-cased; re-registering a name replaces it) and returns cls
+    if not (isinstance(cls, type) and issubclass(cls, ModernProcessScheduler)):
+        raise TypeError(f"Scheduler '{name}' must subclass ModernProcessScheduler")
+    cls.name = name.upper()
+    if cls.label is None: cls.label = cls.name
+    SCHEDULERS[cls.name] = cls
+    return cls
+
+
+def get_scheduler(name):
+    try: return SCHEDULERS[name.upper()]
+    except KeyError: raise ValueError(f"Unknown scheduler '{name}' (registered: {', '.join(SCHEDULERS)})") from None
+
+
+def available(fields):
+    # Registered schedulers whose required process fields a frontend supplies, in menu order
+    return {name: cls for name, cls in SCHEDULERS.items() if set(cls.requires) <= set(fields)}
+
+
+class ModernProcessScheduler:
+    # Subclasses set `engine` (single core, called as engine(table, **params)), optionally `smp` (called as
+    # smp(table, cores=k, queues=model, **params)), `params` (keyword -> default) and a menu `label`.
+    # Object use (Schedular.py): construct over a list of process dicts, call schedule(), read processes /
+    # execution_order / metrics. Table use (everything else): call run() directly. `ordering` says how the engine's
+    # final rows come back: 'registry' (input order) or 'dispatch' (first-dispatch order); incremental reruns need it.
+    # `requires` names the process fields beyond arrival / burst time the engine reads; see available().
+    name = None
+    label = None
+    params = {}
+    engine = None
+    smp = None
+    ordering = 'registry'
+    requires = ()
+
+    def __init__(self, processes, **params):
+        unknown = set(params) - set(self.params)
+        if unknown: raise TypeError(f"{type(self).__name__} got unknown parameters: {', '.join(sorted(unknown))}")
+        self.processes = processes
+        self.options = {**self.params, **params}
+        self.result = None
+        self.execution_order = []
+        self.avg_waiting_time = 0
+        self.avg_turnaround_time = 0
+        self.cpu_utilization = 0
+        self.metrics = {}
+        self.timeline = []
+
+    @classmethod
+    def costed(cls):
+        return all(k in cls.params for k in COST_PARAMS)
+
+    @classmethod
+    def tune(cls, quantum):
+        # Parameters driven by a single quantum knob (the audit's and the CLI's -q); {} for quantum-free engines
+        return {'quantum': quantum} if 'quantum' in cls.params else {}
+
+    @classmethod
+    def run(cls, processes, cores=1, queues='global', telemetry=None, progress=None, **params):
+        # With a Telemetry, the run is an `engine.<NAME>` span carrying dispatch and ready-queue statistics. progress is
+        # handed to the engine (see CPUCore), so an engine registered without that keyword only fails when one is given.
+        table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_records(processes)
+        params = {**cls.params, **params}
+        if cores > 1:
+            if cls.smp is None: raise ValueError(f"{cls.name} has no multi-core variant")
+            if any(params.pop(k, 0) for k in COST_PARAMS): raise ValueError("Context-switch costs apply to single-core runs only")
+        hook = {} if progress is None else {'progress': progress}
+        with span(telemetry, f'engine.{cls.name}', algorithm=cls.name, processes=len(table), cores=cores, params=params) as attrs:
+            result = Schedule(*cls.smp(table, cores=cores, queues=queues, **params, **hook)) if cores > 1 else Schedule(*cls.engine(table, **params, **hook))
+        if telemetry is not None: attrs.update(engine_stats(result.final, result.timeline, cores))
+        return result
+
+    def schedule(self):
+        self.result = self.run(self.processes, **self.options)
+        self.processes, self.execution_order = self.result.final.to_records(), self.result.timeline.to_records()
+        self.calculate_metrics()
+        return self.result
+
+    def calculate_metrics(self):
+        if self.result is None or not len(self.result.final):
+            return
+        self.metrics = summarize(self.result.final, self.result.timeline)
+        self.avg_waiting_time = self.metrics['avg_wait']
+        self.avg_turnaround_time = self.metrics['avg_tat']
+        self.cpu_utilization = self.metrics['cpu_util']
+
+class FCFSScheduler(ModernProcessScheduler):
+    label = 'FCFS - Sequential'
+    engine, smp = staticmethod(CPUCore.fcfs), staticmethod(SMPCore.fcfs)
+    ordering = 'dispatch'
+
+class SJFScheduler(ModernProcessScheduler):
+    label = 'SJF - Optimal Latency'
+    engine, smp = staticmethod(CPUCore.sjf), staticmethod(SMPCore.sjf)
+    ordering = 'dispatch'
+
+class SRTFScheduler(ModernProcessScheduler):
+    label = 'SRTF - Preemptive Latency'
+    params = {'switch_cost': 0, 'warmup': 0}
+    engine = staticmethod(CPUCore.srtf)
+
+class RRScheduler(ModernProcessScheduler):
+    label = 'RR - Fair Share'
+    params = {'quantum': 2, 'switch_cost': 0, 'warmup': 0}
+    engine, smp = staticmethod(CPUCore.rr), staticmethod(SMPCore.rr)
+
+    def __init__(self, processes, quantum=2, **params):
+        super().__init__(processes, quantum=quantum, **params)
+        self.quantum = quantum
+
+class MLFQScheduler(ModernProcessScheduler):
+    label = 'MLFQ - Adaptive Feedback'
+    params = {'quanta': (2, 4, 8), 'boost': None, 'switch_cost': 0, 'warmup': 0}
+    engine = staticmethod(CPUCore.mlfq)
+
+    @classmethod
+    def tune(cls, quantum):
+        # Three levels with quanta q, 2q, 4q
+        return {'quanta': (quantum, 2 * quantum, 4 * quantum)}
+
+class PriorityScheduler(ModernProcessScheduler):
+    label = 'Priority - Non-Preemptive'
+    params = {'aging': None}
+    requires = ('priority',)
+    engine = staticmethod(CPUCore.priority)
+
+class PreemptivePriorityScheduler(ModernProcessScheduler):
+    label = 'Priority - Preemptive'
+    params = {'aging': None, 'switch_cost': 0, 'warmup': 0}
+    requires = ('priority',)
+    engine = staticmethod(CPUCore.priority_preemptive)
+
+
+for _name, _cls in (('FCFS', FCFSScheduler), ('SJF', SJFScheduler), ('SRTF', SRTFScheduler), ('RR', RRScheduler), ('MLFQ', MLFQScheduler),
+                    ('PRIORITY', PriorityScheduler), ('PRIORITY-P', PreemptivePriorityScheduler)):
+    register_scheduler(_name, _cls)
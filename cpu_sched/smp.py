@@ -0,0 +1,113 @@
+"""Multi-core (SMP) variants of FCFS, SJF and RR.
+
+Two queueing models are supported: one global run queue shared by every core, or per-core run queues fed
+round-robin on arrival, where an idle core with an empty queue steals from the longest queue. RR keeps a
+preempted process on the core that ran it in per-core mode.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .core import CPUCore
+from .table import ProcessTable, SliceTable
+from .timeline import CompactTimeline
+
+QUEUE_MODELS = ('global', 'per-core')
+
+
+def _simulate(table, cores, policy, quantum=None, queues='global', steal=True, progress=None):
+    if cores < 1: raise ValueError("cores must be >= 1")
+    if queues not in QUEUE_MODELS: raise ValueError(f"queues must be one of {QUEUE_MODELS}")
+    n, arrival, burst, pid = len(table), table.arrival_time.tolist(), table.burst_time.tolist(), table.id.tolist()
+    rem, first_start, comp, busy = burst[:], [None] * n, [None] * n, [0] * cores
+    arrivals = np.argsort(table.arrival_time, kind='stable').tolist()
+    per_core = queues == 'per-core'
+    if policy == 'SJF':
+        ready = [[] for _ in range(cores if per_core else 1)]
+        push = lambda q, i: heapq.heappush(q, (burst[i], i))
+        pop = lambda q: heapq.heappop(q)[1]
+    else:
+        ready = [deque() for _ in range(cores if per_core else 1)]
+        push, pop = deque.append, deque.popleft
+    idle = list(range(cores))  # global: heap of idle core ids; per-core: plain set
+    if per_core: idle = set(idle)
+    events = []  # (end_time, core, process) for every running slice
+    s_id, s_start, s_end, s_core = [], [], [], []
+    loaded = set()  # per-core: cores whose own queue is non-empty
+    t, nxt, done, home, queued, steps = 0, 0, 0, 0, 0, 0
+
+    def run(c, i):
+        if first_start[i] is None: first_start[i] = t
+        length = rem[i] if quantum is None else min(quantum, rem[i])
+        rem[i] -= length
+        busy[c] += length
+        s_id.append(pid[i]); s_start.append(t); s_end.append(t + length); s_core.append(c)
+        heapq.heappush(events, (t + length, c, i))
+
+    while done < n:
+        steps += 1
+        if progress is not None and not steps % CPUCore.PROGRESS_STEPS: progress(done, t)
+        # Arrivals only matter at a core event or when some core is idle to take them
+        if events and (not idle or nxt == n or events[0][0] <= arrival[arrivals[nxt]]): t = events[0][0]
+        else: t = max(t, arrival[arrivals[nxt]])
+        end = nxt
+        while end < n and arrival[arrivals[end]] <= t: end += 1
+        # As in CPUCore, FCFS admits in arrival order and RR admits a batch in registry order
+        batch = sorted(arrivals[nxt:end]) if policy == 'RR' and end - nxt > 1 else arrivals[nxt:end]
+        for i in batch:
+            push(ready[home], i); queued += 1
+            if per_core: loaded.add(home); home = (home + 1) % cores
+        nxt = end
+        while events and events[0][0] == t:
+            _, c, i = heapq.heappop(events)
+            if rem[i] == 0:
+                comp[i] = t; done += 1
+                if progress is not None and not done % CPUCore.PROGRESS_EVERY: progress(done, t)
+            else:
+                push(ready[c if per_core else 0], i); queued += 1
+                if per_core: loaded.add(c)
+            if per_core: idle.add(c)
+            else: heapq.heappush(idle, c)
+        if not per_core:
+            while idle and queued:
+                queued -= 1
+                run(heapq.heappop(idle), pop(ready[0]))
+            continue
+        for c in sorted(loaded & idle):
+            idle.discard(c); queued -= 1; run(c, pop(ready[c]))
+            if not ready[c]: loaded.discard(c)
+        while steal and idle and queued:
+            c, victim = min(idle), max(loaded, key=lambda v: len(ready[v]))
+            idle.discard(c); queued -= 1; run(c, pop(ready[victim]))
+            if not ready[victim]: loaded.discard(victim)
+
+    makespan = max(s_end) if s_end else 0
+    util = np.asarray(busy, dtype=float) / makespan * 100 if makespan else np.zeros(cores)
+    timeline = CompactTimeline.encode(SliceTable(s_id, np.asarray(s_start, dtype=table.arrival_time.dtype), s_end, core=s_core))
+    return table.with_schedule(first_start, comp), timeline, util
+
+
+class SMPCore:
+    # Same calling convention as CPUCore (progress included) plus cores=k; returns (final, timeline, per-core utilization %).
+    # Dict registries come back as (final_procs, execution_order, utilization list), each slice tagged with its core.
+    # Context-switch costs are single-core only: SMP RR has no switch_cost / warmup, and a multi-core run with either
+    # nonzero raises ValueError.
+    @staticmethod
+    def _dispatch(processes, *args, **kwargs):
+        if isinstance(processes, ProcessTable): return _simulate(processes, *args, **kwargs)
+        final, timeline, util = _simulate(ProcessTable.from_records(processes), *args, **kwargs)
+        return final.to_records(), timeline.to_records(), util.tolist()
+
+    @staticmethod
+    def fcfs(processes, cores=2, queues='global', steal=True, progress=None):
+        return SMPCore._dispatch(processes, cores, 'FCFS', queues=queues, steal=steal, progress=progress)
+
+    @staticmethod
+    def sjf(processes, cores=2, queues='global', steal=True, progress=None):
+        return SMPCore._dispatch(processes, cores, 'SJF', queues=queues, steal=steal, progress=progress)
+
+    @staticmethod
+    def rr(processes, quantum, cores=2, queues='global', steal=True, progress=None):
+        return SMPCore._dispatch(processes, cores, 'RR', quantum, queues=queues, steal=steal, progress=progress)
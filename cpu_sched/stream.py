@@ -0,0 +1,150 @@
+"""Streaming engines: consume an arrival iterator and yield slices and finished processes as they happen.
+
+Memory is bounded by the ready queue, so open-ended arrival generators can be simulated. For arrivals
+sorted by time the event sequence matches the CPUCore engine of the same name.
+"""
+
+import heapq
+from collections import deque
+
+
+class RunningStats:
+    # Online aggregates, updated per event; utilization uses the same busy / last-completion ratio as the UI.
+    __slots__ = ('completed', 'wait_sum', 'tat_sum', 'busy', 'clock', 'max_ready')
+
+    def __init__(self):
+        self.completed, self.wait_sum, self.tat_sum, self.busy, self.clock, self.max_ready = 0, 0, 0, 0, 0, 0
+
+    @property
+    def mean_wait(self):
+        return self.wait_sum / self.completed if self.completed else 0.0
+
+    @property
+    def mean_tat(self):
+        return self.tat_sum / self.completed if self.completed else 0.0
+
+    @property
+    def utilization(self):
+        return self.busy / self.clock * 100 if self.clock else 0.0
+
+    def as_dict(self):
+        return {'completed': self.completed, 'mean_wait': self.mean_wait, 'mean_tat': self.mean_tat,
+                'utilization': self.utilization, 'clock': self.clock, 'max_ready': self.max_ready}
+
+
+class _Arrivals:
+    # One-item lookahead over the arrival iterator, with an ordering check.
+    def __init__(self, arrivals):
+        self._it, self.seq, self._last = iter(arrivals), 0, None
+        self.head = self._pull()
+
+    def _pull(self):
+        p = next(self._it, None)
+        if p is not None:
+            if self._last is not None and p['arrival_time'] < self._last:
+                raise ValueError(f"Arrivals must be sorted by arrival_time (got {p['arrival_time']} after {self._last})")
+            self._last = p['arrival_time']
+        return p
+
+    @property
+    def next_time(self):
+        return None if self.head is None else self.head['arrival_time']
+
+    def pop(self):
+        p, self.head = self.head, self._pull()
+        self.seq += 1
+        return [p['id'], p['arrival_time'], p['burst_time'], p['burst_time'], None, self.seq]  # id, at, bt, rem, first_start, seq
+
+    def take_until(self, t):
+        while self.head is not None and self.head['arrival_time'] <= t:
+            yield self.pop()
+
+
+def _slice(stats, p, start, end):
+    stats.busy += end - start
+    stats.clock = end
+    return ('slice', {'id': p[0], 'start_time': start, 'completion_time': end})
+
+
+def _done(stats, p, comp):
+    tat = comp - p[1]
+    stats.completed += 1
+    stats.wait_sum += tat - p[2]
+    stats.tat_sum += tat
+    return ('done', {'id': p[0], 'arrival_time': p[1], 'burst_time': p[2], 'start_time': p[4],
+                     'completion_time': comp, 'turnaround_time': tat, 'waiting_time': tat - p[2]})
+
+
+def _fcfs(src, stats, quantum):
+    t = 0
+    while src.head is not None:
+        p = src.pop()
+        t = max(t, p[1])
+        p[4] = t
+        yield _slice(stats, p, t, t + p[2])
+        t += p[2]
+        yield _done(stats, p, t)
+
+
+def _sjf(src, stats, quantum):
+    t, ready = 0, []
+    while src.head is not None or ready:
+        if not ready and src.next_time > t: t = src.next_time
+        for p in src.take_until(t): heapq.heappush(ready, (p[2], p[5], p))
+        stats.max_ready = max(stats.max_ready, len(ready))
+        _, _, p = heapq.heappop(ready)
+        p[4] = t
+        yield _slice(stats, p, t, t + p[2])
+        t += p[2]
+        yield _done(stats, p, t)
+
+
+def _rr(src, stats, quantum):
+    t, queue = 0, deque()
+    while src.head is not None or queue:
+        if not queue and src.next_time > t: t = src.next_time
+        queue.extend(src.take_until(t))
+        stats.max_ready = max(stats.max_ready, len(queue))
+        p = queue.popleft()
+        if p[4] is None: p[4] = t
+        run = min(quantum, p[3])
+        yield _slice(stats, p, t, t + run)
+        t += run
+        p[3] -= run
+        queue.extend(src.take_until(t))
+        if p[3] == 0: yield _done(stats, p, t)
+        else: queue.append(p)
+
+
+def _srtf(src, stats, quantum):
+    # A run is only emitted once it ends (completion or preemption), so each slice is already coalesced.
+    t, ready, run_p, run_start = 0, [], None, None
+    while src.head is not None or ready:
+        if not ready and src.next_time > t: t = src.next_time
+        for p in src.take_until(t): heapq.heappush(ready, (p[3], p[5], p))
+        stats.max_ready = max(stats.max_ready, len(ready))
+        p = ready[0][2]
+        if p is not run_p:
+            if run_p is not None and run_start < t: yield _slice(stats, run_p, run_start, t)
+            run_p, run_start = p, t
+        if p[4] is None: p[4] = t
+        end = t + p[3] if src.head is None else min(t + p[3], src.next_time)
+        p[3] -= end - t
+        t = end
+        if p[3] == 0:
+            heapq.heappop(ready)
+            yield _slice(stats, p, run_start, t)
+            yield _done(stats, p, t)
+            run_p = None
+        else:
+            heapq.heapreplace(ready, (p[3], p[5], p))
+
+
+STREAM_ENGINES = {'FCFS': _fcfs, 'SJF': _sjf, 'RR': _rr, 'SRTF': _srtf}
+
+
+def stream_schedule(arrivals, algorithm='FCFS', quantum=2, stats=None):
+    # Yields ('slice', {id, start_time, completion_time}) and ('done', process_record) events in time order.
+    # Pass a RunningStats to read the online aggregates while the stream is being consumed.
+    engine = STREAM_ENGINES[algorithm.upper()]
+    return engine(_Arrivals(arrivals), stats if stats is not None else RunningStats(), quantum)
@@ -0,0 +1,110 @@
+"""Round Robin quantum sweep: evaluate many quanta on one workload and recommend the best.
+
+Candidates share work. The arrival sort is done once, and until the first dispatch of a process whose burst exceeds
+the quantum, RR runs every process to completion, so its schedule is the same for every larger quantum. One
+unbounded-quantum pass snapshots the state only where a requested quantum's schedule diverges (at most one snapshot
+per quantum); each candidate resumes from its snapshot. Quanta at or above the largest burst all yield that pass's schedule and are simulated once.
+A context-switch cost does not break this: every dispatch in the shared prefix switches to a new process, whatever
+the quantum.
+"""
+
+import os
+from bisect import bisect_left
+
+from .core import CPUCore, RRState
+from .metrics import SUMMARY_COLUMNS, summarize
+from .table import ProcessTable
+from .telemetry import span
+
+SWEEP_COLUMNS = ['quantum'] + SUMMARY_COLUMNS
+
+
+def parse_quanta(spec):
+    # "2,4,8" or an inclusive range "start:stop[:step]", e.g. "1:1000" or "5:200:5"
+    if ':' in spec:
+        parts = [int(float(x)) for x in spec.split(':')]
+        if len(parts) not in (2, 3): raise ValueError(f"Bad quantum range '{spec}' (expected start:stop[:step])")
+        quanta = list(range(parts[0], parts[1] + 1, parts[2] if len(parts) == 3 else 1))
+    else:
+        quanta = [int(float(x)) for x in spec.split(',') if x.strip()]
+    if not quanta or min(quanta) < 1: raise ValueError(f"Quanta must be positive integers, got '{spec}'")
+    return sorted(set(quanta))
+
+
+def rr_prefix(table, quanta, switch_cost=0):
+    # Unbounded-quantum RR pass over sorted quanta. Returns (splits, saturated, final): splits pairs each snapshot,
+    # taken just before the first dispatch of a burst longer than some remaining quanta, with those quanta (their
+    # schedules leave the shared prefix there); saturated are the quanta at or above every burst, whose schedule is
+    # the finished pass `final` (None when there are none). At most len(quanta) snapshots are taken, and the pass stops
+    # once every quantum has one. Nothing is resumed here, so a warmup penalty never applies.
+    n, s = len(table), RRState(table)
+    arrival, arrivals, queue, rem = s.arrival, s.arrivals, s.queue, s.rem
+    splits, j = [], 0
+    while s.done < n:
+        if not queue and arrival[arrivals[s.nxt]] > s.time: s.time = arrival[arrivals[s.nxt]]
+        s.nxt = CPUCore._admit(arrival, arrivals, s.nxt, s.time, queue)
+        i = queue[0]
+        if rem[i] > quanta[j]:
+            k = bisect_left(quanta, rem[i], j)
+            splits.append((s.copy(), quanta[j:k])); j = k
+            if j == len(quanta): return splits, [], None
+        queue.popleft()
+        s.switches[i] += 1; s.last = i
+        if switch_cost: s.o_pos.append(len(s.s_id)); s.s_id.append(s.pid[i]); s.s_start.append(s.time); s.time += switch_cost; s.s_end.append(s.time)
+        s.first_start[i] = s.time
+        s.s_id.append(s.pid[i]); s.s_start.append(s.time)
+        s.time += rem[i]
+        rem[i] = 0
+        s.s_end.append(s.time)
+        s.nxt = CPUCore._admit(arrival, arrivals, s.nxt, s.time, queue)
+        s.comp[i] = s.time; s.done += 1
+    return splits, quanta[j:], s
+
+
+def _sweep_chunk(job):
+    table, state, quanta, switch_cost, warmup = job
+    return [{'quantum': q, **summarize(*CPUCore._rr_table(table, q, state, switch_cost, warmup))} for q in quanta]
+
+
+def quantum_sweep(workload, quanta, switch_cost=0, warmup=0, workers=None, chunksize=None, telemetry=None, progress=None):
+    # One row per quantum (sorted) with the metrics.summarize columns. Candidates run over a process pool in chunks
+    # that each ship the workload and their shared snapshot once. A Telemetry records sweep.* phase spans. progress is
+    # called as progress(candidates done, makespan of the latest one) after every chunk (every candidate when run
+    # in-process); an exception raised from it cancels the chunks not yet started and propagates.
+    import pandas as pd  # deferred so importing the engine stays light
+    from concurrent.futures import ProcessPoolExecutor
+    table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_records(workload)
+    table = CPUCore._costed(table, switch_cost, warmup)
+    quanta = sorted(set(quanta))
+    if not len(table) or not quanta: return pd.DataFrame(columns=SWEEP_COLUMNS)
+    with span(telemetry, 'sweep.prefix', processes=len(table)) as attrs:
+        splits, saturated, final = rr_prefix(table, quanta, switch_cost)
+        attrs['snapshots'] = len(splits)
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(quanta) // (workers * 4))
+    jobs = [(table, state, qs[i:i + chunksize], switch_cost, warmup) for state, qs in splits for i in range(0, len(qs), chunksize)]
+    if saturated: jobs.append((table, final, saturated[:1], switch_cost, warmup))
+    with span(telemetry, 'sweep.simulate', quanta=len(quanta), jobs=len(jobs), workers=min(workers, len(jobs))):
+        rows = []
+        def collect(chunk):
+            rows.extend(chunk)
+            if progress is not None: progress(len(rows), rows[-1]['makespan'])
+        if workers <= 1 or len(jobs) <= 1:
+            for table, state, qs, *costs in jobs:
+                for q in qs: collect(_sweep_chunk((table, state, [q], *costs)))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                try:
+                    for chunk in pool.map(_sweep_chunk, jobs): collect(chunk)
+                except BaseException:
+                    pool.shutdown(cancel_futures=True)
+                    raise
+    with span(telemetry, 'sweep.frame', rows=len(quanta)):
+        rows += [dict(rows[-1], quantum=q) for q in saturated[1:]] if saturated else []
+        return pd.DataFrame(rows, columns=SWEEP_COLUMNS).sort_values('quantum', ignore_index=True)
+
+
+def best_quantum(sweep, objective='avg_wait'):
+    # Quantum minimizing the objective column; ties go to fewer context switches, then the larger quantum
+    ranked = sweep.sort_values([objective, 'switches', 'quantum'], ascending=[True, True, False])
+    return ranked['quantum'].iloc[0].item()
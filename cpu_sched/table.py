@@ -0,0 +1,85 @@
+"""Columnar process and timeline tables shared by every engine."""
+
+import numpy as np
+
+
+class ProcessTable:
+    # Struct-of-arrays process registry: one NumPy column per field instead of one dict per process.
+    # priority is optional (lower value = more urgent) and only read by the priority engines. switches is filled by the
+    # preemptive engines: how many times each process was switched onto the CPU.
+    COLUMNS = ('id', 'arrival_time', 'burst_time', 'start_time', 'completion_time', 'turnaround_time', 'waiting_time', 'priority', 'switches')
+
+    def __init__(self, id, arrival_time, burst_time, start_time=None, completion_time=None, turnaround_time=None, waiting_time=None,
+                 priority=None, switches=None):
+        self.id = np.asarray(id, dtype=np.int64)
+        dtype = np.result_type(np.asarray(arrival_time), np.asarray(burst_time), np.int64)
+        self.arrival_time = np.asarray(arrival_time, dtype=dtype)
+        self.burst_time = np.asarray(burst_time, dtype=dtype)
+        for name, col in (('start_time', start_time), ('completion_time', completion_time), ('turnaround_time', turnaround_time), ('waiting_time', waiting_time)):
+            setattr(self, name, None if col is None else np.asarray(col, dtype=dtype))
+        self.priority = None if priority is None else np.asarray(priority, dtype=np.int64)
+        self.switches = None if switches is None else np.asarray(switches, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.id)
+
+    @property
+    def columns(self):
+        return [c for c in self.COLUMNS if getattr(self, c) is not None]
+
+    @classmethod
+    def from_records(cls, records):
+        priority = [p.get('priority', 0) for p in records] if any('priority' in p for p in records) else None
+        return cls([p['id'] for p in records], [p['arrival_time'] for p in records], [p['burst_time'] for p in records], priority=priority)
+
+    def to_records(self):
+        cols = self.columns
+        return [dict(zip(cols, row)) for row in zip(*(getattr(self, c).tolist() for c in cols))]
+
+    @classmethod
+    def concat(cls, tables):
+        # Row-wise concatenation; a column is kept only if every part has it
+        return cls(*(None if any(getattr(t, c) is None for t in tables) else np.concatenate([getattr(t, c) for t in tables]) for c in cls.COLUMNS))
+
+    def take(self, idx):
+        return ProcessTable(*(None if getattr(self, c) is None else getattr(self, c)[idx] for c in self.COLUMNS))
+
+    def with_schedule(self, start_time, completion_time, switches=None):
+        # Fill in the derived metric columns from start/completion arrays aligned with this table's rows
+        completion_time = np.asarray(completion_time, dtype=self.arrival_time.dtype)
+        tat = completion_time - self.arrival_time
+        return ProcessTable(self.id, self.arrival_time, self.burst_time, start_time, completion_time, tat, tat - self.burst_time, self.priority,
+                            switches)
+
+
+class SliceTable:
+    # Columnar execution timeline: one row per CPU slice. Multi-core engines also fill the core column,
+    # MLFQ the queue level each slice ran at. With a context-switch cost the engines add overhead slices (overhead=1,
+    # attributed to the incoming process) next to the work slices (overhead=0).
+    COLUMNS = ('id', 'start_time', 'completion_time', 'core', 'level', 'overhead')
+
+    def __init__(self, id, start_time, completion_time, core=None, level=None, overhead=None):
+        self.id = np.asarray(id, dtype=np.int64)
+        self.start_time = np.asarray(start_time)
+        self.completion_time = np.asarray(completion_time, dtype=self.start_time.dtype)
+        self.core = None if core is None else np.asarray(core, dtype=np.int64)
+        self.level = None if level is None else np.asarray(level, dtype=np.int64)
+        self.overhead = None if overhead is None else np.asarray(overhead, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.id)
+
+    @property
+    def columns(self):
+        return [c for c in self.COLUMNS if getattr(self, c) is not None]
+
+    @classmethod
+    def concat(cls, tables):
+        return cls(*(None if any(getattr(t, c) is None for t in tables) else np.concatenate([getattr(t, c) for t in tables]) for c in cls.COLUMNS))
+
+    def take(self, idx):
+        return SliceTable(*(None if getattr(self, c) is None else getattr(self, c)[idx] for c in self.COLUMNS))
+
+    def to_records(self):
+        cols = self.columns
+        return [dict(zip(cols, row)) for row in zip(*(getattr(self, c).tolist() for c in cols))]
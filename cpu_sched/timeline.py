@@ -0,0 +1,162 @@
+"""Compact execution timelines: run-length and delta encoding of SliceTable rows in narrow typed arrays.
+
+Consecutive slices of one process that run back to back (same core, level and overhead flag) are one run, stored as
+its id, the distance from the previous run's start, the slice length, the slice count and the last slice's length.
+All but a run's last slice have equal length, so a Round Robin process running alone for many quanta costs one run.
+Every column is stored in the narrowest integer type that holds it. Absolute start times are anchored every BLOCK
+runs, so time-range queries decode only the blocks they touch. Slices are rebuilt on demand: decode() for the
+full SliceTable, blocks() / iteration for bounded pieces, window() for a time range, runs() for merged bars.
+"""
+
+import numpy as np
+
+from .table import SliceTable
+
+EXTRA_COLUMNS = ('core', 'level', 'overhead')
+
+
+def _narrow(a):
+    # Smallest integer dtype holding every value of a; float columns (fractional-cost timelines) are kept as they are
+    a = np.asarray(a)
+    if a.dtype.kind == 'f': return a
+    if not len(a): return a.astype(np.uint8)
+    lo, hi = a.min(), a.max()
+    for dt in ((np.uint8, np.uint16, np.uint32) if lo >= 0 else (np.int8, np.int16, np.int32)):
+        info = np.iinfo(dt)
+        if info.min <= lo and hi <= info.max: return a.astype(dt)
+    return a.astype(np.int64)
+
+
+class CompactTimeline:
+    # Engines return this in place of a SliceTable. len() is the slice count; `extra` holds the optional per-run
+    # core / level / overhead columns. Row order (dispatch order, non-decreasing start) is preserved exactly.
+    BLOCK = 1024  # runs per absolute-time anchor
+
+    def __init__(self, pid, delta, step, count, tail, dtype, extra=None):
+        # Use encode() / _build(); the arrays here are already narrowed and delta[0] is the first run's start
+        self.pid, self.delta, self.step, self.count, self.tail = pid, delta, step, count, tail
+        self.dtype, self.extra = np.dtype(dtype), extra or {}
+        starts = self._run_starts()
+        self.anchor = starts[::self.BLOCK]
+        self.max_span = (self._span(0, len(pid)).max() if len(pid) else np.zeros(1, self.dtype)[0])
+        self.slices = int(count.sum(dtype=np.int64))
+
+    @classmethod
+    def _build(cls, pid, start, step, count, tail, dtype, extra):
+        # From absolute run starts
+        start = np.asarray(start, dtype=dtype)
+        delta = np.diff(start, prepend=start[:1] * 0) if len(start) else start
+        return cls(_narrow(pid), _narrow(delta), _narrow(step), _narrow(count), _narrow(tail), dtype,
+                   {c: _narrow(col) for c, col in extra.items()})
+
+    @classmethod
+    def encode(cls, table):
+        # SliceTable -> runs. A run breaks where the process, a tag column or contiguity changes, and after any
+        # slice whose length differs from the one before it, so every run decodes back to the same slices.
+        n = len(table)
+        start, end = table.start_time, table.completion_time
+        extra = {c: getattr(table, c) for c in EXTRA_COLUMNS if getattr(table, c, None) is not None}
+        if not n: return cls._build(table.id, start, start, np.zeros(0, np.int64), start, start.dtype, extra)
+        length = end - start
+        same = (table.id[1:] == table.id[:-1]) & (start[1:] == end[:-1])
+        for col in extra.values(): same &= col[1:] == col[:-1]
+        uneven = np.zeros(n - 1, dtype=bool)
+        uneven[1:] = same[:-1] & (length[1:-1] != length[:-2])
+        first = np.flatnonzero(np.concatenate(([True], ~same | uneven)))
+        last = np.concatenate((first[1:] - 1, [n - 1]))
+        return cls._build(table.id[first], start[first], length[first], last - first + 1, length[last], start.dtype,
+                          {c: col[first] for c, col in extra.items()})
+
+    @classmethod
+    def concat(cls, parts):
+        parts = [p for p in parts if len(p.pid)] or parts[:1]
+        extra = {c: np.concatenate([p.extra[c] for p in parts]) for c in parts[0].extra if all(c in p.extra for p in parts)}
+        dtype = np.result_type(*(p.dtype for p in parts))
+        return cls._build(np.concatenate([p.pid for p in parts]), np.concatenate([p._run_starts() for p in parts]),
+                          np.concatenate([p.step for p in parts]), np.concatenate([p.count for p in parts]),
+                          np.concatenate([p.tail for p in parts]), dtype, extra)
+
+    def __len__(self):
+        return self.slices
+
+    @property
+    def columns(self):
+        return ['id', 'start_time', 'completion_time', *self.extra]
+
+    @property
+    def nbytes(self):
+        arrays = (self.pid, self.delta, self.step, self.count, self.tail, self.anchor, *self.extra.values())
+        return sum(a.nbytes for a in arrays)
+
+    def _run_starts(self, lo=0, hi=None):
+        # Absolute starts of runs lo..hi-1, summed from the nearest anchor at or before lo
+        hi = len(self.pid) if hi is None else hi
+        base = lo - lo % self.BLOCK
+        if base == 0: starts = np.cumsum(self.delta[:hi], dtype=self.dtype)
+        else: starts = self.anchor[base // self.BLOCK] + np.cumsum(np.concatenate(([0], self.delta[base + 1:hi])), dtype=self.dtype)
+        return starts[lo - base:]
+
+    def _span(self, lo, hi):
+        return (self.count[lo:hi].astype(np.int64) - 1) * self.step[lo:hi] + self.tail[lo:hi]
+
+    def _decode(self, lo, hi):
+        # SliceTable of the slices in runs lo..hi-1
+        count = self.count[lo:hi].astype(np.int64)
+        k = int(count.sum())
+        starts, step = self._run_starts(lo, hi), self.step[lo:hi].astype(self.dtype)
+        offset = np.arange(k) - np.repeat(np.cumsum(count) - count, count)
+        s = np.repeat(starts, count) + offset * np.repeat(step, count)
+        length = np.where(offset == np.repeat(count - 1, count), np.repeat(self.tail[lo:hi].astype(self.dtype), count), np.repeat(step, count))
+        return SliceTable(np.repeat(self.pid[lo:hi].astype(np.int64), count), s, s + length,
+                          **{c: np.repeat(col[lo:hi].astype(np.int64), count) for c, col in self.extra.items()})
+
+    def decode(self):
+        return self._decode(0, len(self.pid))
+
+    def runs(self):
+        # One row per run: back-to-back slices merged into a single bar, the form Gantt charts draw
+        hi = len(self.pid)
+        starts = self._run_starts()
+        return SliceTable(self.pid.astype(np.int64), starts, starts + self._span(0, hi).astype(self.dtype),
+                          **{c: col.astype(np.int64) for c, col in self.extra.items()})
+
+    def blocks(self, runs=BLOCK * 64):
+        # Decoded SliceTables covering up to `runs` runs each, in order
+        for lo in range(0, len(self.pid), runs): yield self._decode(lo, min(lo + runs, len(self.pid)))
+
+    def __iter__(self):
+        for block in self.blocks(): yield from block.to_records()
+
+    def to_records(self):
+        return self.decode().to_records()
+
+    def window(self, t0, t1):
+        # Slices overlapping [t0, t1) (zero-length slices count if they start inside it). Runs are start-ordered and
+        # none spans more than max_span, so only the anchor blocks between t0 - max_span and t1 are decoded.
+        lo = max(np.searchsorted(self.anchor, t0 - self.max_span, side='right') - 1, 0) * self.BLOCK
+        hi = min(np.searchsorted(self.anchor, t1, side='left') * self.BLOCK, len(self.pid))
+        if lo >= hi: return self._decode(0, 0)
+        part = self._decode(lo, hi)
+        keep = (part.start_time < t1) & ((part.completion_time > t0) | (part.start_time >= t0))
+        return part.take(keep)
+
+    def before(self, t):
+        # Runs starting before t, as a CompactTimeline (incremental reruns keep the prefix ahead of a checkpoint)
+        starts = self._run_starts()
+        k = np.searchsorted(starts, t, side='left')
+        return type(self)._build(self.pid[:k], starts[:k], self.step[:k], self.count[:k], self.tail[:k], self.dtype,
+                                 {c: col[:k] for c, col in self.extra.items()})
+
+
+def timeline_totals(timeline):
+    # (work slices, overhead time, last completion) of a SliceTable, ProcessTable or CompactTimeline
+    if isinstance(timeline, CompactTimeline):
+        runs, over = timeline.runs(), timeline.extra.get('overhead')
+        dur = runs.completion_time - runs.start_time
+        if over is None: return len(timeline), 0, runs.completion_time.max().item()
+        over = over.astype(bool)
+        return int(timeline.count[~over].sum()), dur[over].sum().item(), runs.completion_time.max().item()
+    over = getattr(timeline, 'overhead', None)
+    slices = len(timeline) - (0 if over is None else int(over.sum()))
+    overhead = 0 if over is None else (timeline.completion_time - timeline.start_time)[over.astype(bool)].sum().item()
+    return slices, overhead, timeline.completion_time.max().item()
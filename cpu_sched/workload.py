@@ -0,0 +1,194 @@
+"""Synthetic workloads: Poisson / MMPP arrivals, exponential / Pareto / lognormal bursts and priority mixes.
+
+Generation is vectorized and chunked, so 10**8-process traces stream into the engines or straight to disk in bounded
+memory. Every random component draws from its own child stream of the seed, so a workload depends only on its
+parameters and seed, not on the chunk size it was produced in.
+"""
+
+import math
+
+import numpy as np
+
+from .io import TRACE_HEADER, TRACE_MAGIC, TRACE_PRIORITY, TRACE_VERSION, _format, _require_parquet, table_to_frame, write_table
+from .table import ProcessTable
+
+ARRIVALS = ('poisson', 'mmpp')
+BURSTS = ('exponential', 'pareto', 'lognormal')
+CHUNK = 1 << 20  # processes per generated chunk
+# MMPP phases as (rate multiplier, mean dwell in mean inter-arrival times), cycled in order: a hot phase with 1.75x
+# the base rate and a quiet phase with 0.25x, equally long on average, so the offered load stays `load`
+MMPP_PHASES = ((1.75, 200.0), (0.25, 200.0))
+
+
+def parse_mix(spec):
+    # "0:1,5:3,9:1" (level:weight) or "0,1,2" (equal weights) -> {level: weight}
+    mix, error = {}, ValueError(f"Bad priority mix '{spec}' (expected level[:weight],...)")
+    for part in (p.strip() for p in spec.split(',') if p.strip()):
+        level, _, weight = part.partition(':')
+        try: mix[int(level)] = float(weight) if weight else 1.0
+        except ValueError: raise error from None
+    if not mix or min(mix.values()) < 0 or not sum(mix.values()): raise error
+    return mix
+
+
+def _bursts(rng, m, burst, mean_burst, shape, max_burst):
+    # Continuous draws with the requested mean, rounded up to whole time units
+    if burst == 'exponential':
+        x = rng.exponential(mean_burst, m)
+    elif burst == 'pareto':
+        alpha = shape or 1.5
+        if alpha <= 1: raise ValueError("Pareto bursts need shape > 1 for a finite mean")
+        x = (rng.pareto(alpha, m) + 1) * (mean_burst * (alpha - 1) / alpha)
+    elif burst == 'lognormal':
+        sigma = shape or 1.0
+        x = rng.lognormal(np.log(mean_burst) - sigma ** 2 / 2, sigma, m)
+    else:
+        raise ValueError(f"Unknown burst distribution '{burst}' (expected {', '.join(BURSTS)})")
+    return np.clip(np.ceil(x), 1, max_burst).astype(np.int64)
+
+
+def _survival(burst, mean_burst, shape):
+    # P(X > x) of the continuous draw in _bursts, as a vectorized function of x
+    if burst == 'exponential':
+        return lambda x: np.exp(-x / mean_burst)
+    if burst == 'pareto':
+        alpha = shape or 1.5
+        if alpha <= 1: raise ValueError("Pareto bursts need shape > 1 for a finite mean")
+        scale = mean_burst * (alpha - 1) / alpha
+        return lambda x: np.minimum(1.0, (scale / x) ** alpha)
+    if burst == 'lognormal':
+        sigma = shape or 1.0
+        mu, erfc = math.log(mean_burst) - sigma ** 2 / 2, np.vectorize(math.erfc)
+        return lambda x: 0.5 * erfc((np.log(x) - mu) / (sigma * math.sqrt(2)))
+    raise ValueError(f"Unknown burst distribution '{burst}' (expected {', '.join(BURSTS)})")
+
+
+def effective_mean(burst='exponential', mean_burst=5.0, shape=None, max_burst=10**6, exact=1 << 16):
+    # Mean of the bursts _bursts actually yields: rounding up and clipping to [1, max_burst] shift it away from
+    # mean_burst (by about +0.5 for small means). E[clip(ceil X)] = 1 + sum of P(X > k) for k = 1 .. max_burst - 1;
+    # the first `exact` terms are summed directly and the rest, where P(X > x) varies slowly, integrated.
+    survival, top = _survival(burst, mean_burst, shape), int(max_burst) - 1
+    if top < 1: return 1.0
+    k = min(top, exact)
+    total = 1.0 + survival(np.arange(1, k + 1, dtype=float)).sum()
+    if top > k:
+        x = np.geomspace(k + 0.5, top + 0.5, 4097)
+        y = survival(x)
+        total += ((y[1:] + y[:-1]) * np.diff(x)).sum() / 2
+    return float(total)
+
+
+def _poisson_times(rng, rate):
+    clock = 0.0
+    def take(m):
+        nonlocal clock
+        gaps = rng.exponential(1 / rate, m)
+        gaps[0] += clock  # chained into one cumsum so results do not depend on where chunks split
+        t = np.cumsum(gaps)
+        clock = t[-1]
+        return t
+    return take
+
+
+def _mmpp_times(rngs, rate, phases):
+    # Sojourns cycle through the phases with exponential lengths; given a sojourn's Poisson count its arrivals are
+    # uniform over it, so each batch of sojourns is one poisson draw, one uniform draw and one sort. Arrivals past
+    # the requested count wait in `pending` for the next chunk.
+    r_dwell, r_count, r_place = rngs
+    mult, dwell = (np.array(c, dtype=float) for c in zip(*phases))
+    mult, dwell = mult * rate, dwell / rate
+    per_cycle = (mult * dwell).sum()
+    clock, phase, pending = 0.0, 0, np.empty(0)
+    def take(m):
+        nonlocal clock, phase, pending
+        while len(pending) < m:
+            k = max(len(phases), int(np.ceil((m - len(pending)) / per_cycle * len(phases) * 1.1)))
+            states = (phase + np.arange(k)) % len(phases)
+            phase = (phase + k) % len(phases)
+            dur = r_dwell.exponential(dwell[states])
+            edges = np.cumsum(np.concatenate(([clock], dur)))
+            counts = r_count.poisson(mult[states] * dur)
+            times = np.repeat(edges[:-1], counts) + r_place.random(counts.sum()) * np.repeat(dur, counts)
+            pending, clock = np.concatenate((pending, np.sort(times))), edges[-1]
+        t, pending = pending[:m], pending[m:]
+        return t
+    return take
+
+
+def generate_chunks(n, arrival='poisson', burst='exponential', mean_burst=5.0, shape=None, load=0.9, rate=None, phases=MMPP_PHASES,
+                    priorities=None, max_burst=10**6, seed=0, chunk=CHUNK, start_id=1):
+    # Yields ProcessTables of up to `chunk` rows with consecutive ids and non-decreasing integer arrivals. `rate` is
+    # arrivals per time unit and defaults to load / effective_mean(), so the offered load of the rounded and clipped
+    # bursts is `load`; `shape` is the Pareto alpha or the lognormal sigma.
+    # `priorities` is a {level: weight} mix (or a sequence of equally likely levels); None leaves no priority column.
+    # seed=None draws fresh entropy.
+    if n < 0 or chunk < 1: raise ValueError("n must be >= 0 and chunk >= 1")
+    if mean_burst <= 0: raise ValueError("Arrival rate and mean burst must be positive")
+    rate = rate or load / effective_mean(burst, mean_burst, shape, max_burst)
+    if rate <= 0: raise ValueError("Arrival rate and mean burst must be positive")
+    r_arrival, r_burst, r_prio, *r_mmpp = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(6))
+    if arrival == 'poisson': times = _poisson_times(r_arrival, rate)
+    elif arrival == 'mmpp': times = _mmpp_times(r_mmpp, rate, phases)
+    else: raise ValueError(f"Unknown arrival process '{arrival}' (expected {', '.join(ARRIVALS)})")
+    if priorities is not None:
+        mix = priorities if isinstance(priorities, dict) else dict.fromkeys(priorities, 1.0)
+        levels, weights = np.array(list(mix), dtype=np.int64), np.array(list(mix.values()), dtype=float)
+        weights /= weights.sum()
+    for lo in range(0, n, chunk):
+        m = min(chunk, n - lo)
+        prio = levels[r_prio.choice(len(levels), m, p=weights)] if priorities is not None else None
+        yield ProcessTable(np.arange(start_id + lo, start_id + lo + m), np.floor(times(m)).astype(np.int64),
+                           _bursts(r_burst, m, burst, mean_burst, shape, max_burst), priority=prio)
+
+
+def generate(n, **spec):
+    # Whole workload as one ProcessTable, filled chunk by chunk into preallocated columns
+    cols, lo = {c: np.empty(n, dtype=np.int64) for c in ('id', 'arrival_time', 'burst_time', 'priority')}, 0
+    for part in generate_chunks(n, **spec):
+        for c, col in cols.items():
+            if getattr(part, c) is not None: col[lo:lo + len(part)] = getattr(part, c)
+        lo += len(part)
+    return ProcessTable(cols['id'], cols['arrival_time'], cols['burst_time'], priority=cols['priority'] if spec.get('priorities') is not None else None)
+
+
+def iter_records(n, **spec):
+    # Process dicts in arrival order, for stream_schedule
+    for part in generate_chunks(n, **spec):
+        yield from part.to_records()
+
+
+def write_workload(path, n, fmt=None, **spec):
+    # Streams a generated workload to disk one chunk at a time; the format follows the extension as in io.write_table.
+    # Binary traces are preallocated and filled through a memory map, since their columns are stored back to back.
+    fmt = fmt or _format(path)
+    if not n:
+        write_table(generate(0, **spec), path, fmt)
+        return 0
+    chunks = generate_chunks(n, **spec)
+    if fmt == 'trace':
+        k = 4 if spec.get('priorities') is not None else 3
+        raw = np.memmap(path, dtype=np.uint8, mode='w+', shape=TRACE_HEADER.itemsize + k * n * 8)
+        raw[:TRACE_HEADER.itemsize] = np.array([(TRACE_MAGIC, TRACE_VERSION, TRACE_PRIORITY if k == 4 else 0, n)], dtype=TRACE_HEADER).view(np.uint8)
+        cols, lo = raw[TRACE_HEADER.itemsize:].view('<i8').reshape(k, n), 0
+        for part in chunks:
+            for j, c in enumerate(('id', 'arrival_time', 'burst_time', 'priority')[:k]): cols[j, lo:lo + len(part)] = getattr(part, c)
+            lo += len(part)
+        raw.flush()
+        del cols, raw
+    elif fmt == 'parquet':
+        _require_parquet()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        for part in chunks:
+            batch = pa.Table.from_pandas(table_to_frame(part), preserve_index=False)
+            if writer is None: writer = pq.ParquetWriter(path, batch.schema)
+            writer.write_table(batch)
+        writer.close()
+    else:
+        with open(path, 'w', newline='') as f:
+            for i, part in enumerate(chunks):
+                df = table_to_frame(part)
+                if fmt == 'csv': df.to_csv(f, index=False, header=i == 0)
+                else: df.to_json(f, orient='records', lines=True)
+    return n
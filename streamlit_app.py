@@ -1,388 +1,595 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import time
-import random
-
-# ================== SCHEDULER ENGINE V4.0 ==================
-
-class CPUCore:
-    @staticmethod
-    def fcfs(processes):
-        ready = sorted([p.copy() for p in processes], key=lambda x: x['arrival_time'])
-        current_time, execution_order = 0, []
-        for p in ready:
-            if current_time < p['arrival_time']: current_time = p['arrival_time']
-            start = current_time
-            comp = start + p['burst_time']
-            p.update({'start_time': start, 'completion_time': comp, 'turnaround_time': comp - p['arrival_time'], 'waiting_time': (comp - p['arrival_time']) - p['burst_time']})
-            execution_order.append(p.copy())
-            current_time = comp
-        return ready, execution_order
-
-    @staticmethod
-    def sjf(processes):
-        current_time, completed, execution_order = 0, [], []
-        remaining = [p.copy() for p in processes]
-        while remaining:
-            arrived = [p for p in remaining if p['arrival_time'] <= current_time]
-            if not arrived:
-                current_time = min(p['arrival_time'] for p in remaining)
-                continue
-            p = min(arrived, key=lambda x: x['burst_time'])
-            remaining.remove(p)
-            start = current_time
-            comp = start + p['burst_time']
-            p.update({'start_time': start, 'completion_time': comp, 'turnaround_time': comp - p['arrival_time'], 'waiting_time': (comp - p['arrival_time']) - p['burst_time']})
-            execution_order.append(p.copy())
-            current_time = comp
-            completed.append(p)
-        return completed, execution_order
-
-    @staticmethod
-    def rr(processes, quantum):
-        proc_list = [{'id': p['id'], 'arrival_time': p['arrival_time'], 'burst_time': p['burst_time'], 'rem': p['burst_time'], 'first_start': None, 'comp': None} for p in processes]
-        current_time, queue, completed, execution_order = 0, [], [], []
-        while len(completed) < len(proc_list):
-            for p in proc_list:
-                if p not in queue and p not in completed and p['arrival_time'] <= current_time: queue.append(p)
-            if not queue:
-                future = [p for p in proc_list if p not in completed]
-                if future: current_time = min(p['arrival_time'] for p in future); continue
-            p = queue.pop(0)
-            if p['first_start'] is None: p['first_start'] = current_time
-            exec_t = min(quantum, p['rem'])
-            start = current_time
-            current_time += exec_t
-            p['rem'] -= exec_t
-            execution_order.append({'id': p['id'], 'start_time': start, 'completion_time': current_time})
-            for next_p in proc_list:
-                if next_p not in queue and next_p not in completed and next_p['arrival_time'] <= current_time and next_p != p: queue.append(next_p)
-            if p['rem'] == 0: p['comp'] = current_time; completed.append(p)
-            else: queue.append(p)
-        
-        final_procs = []
-        for p in proc_list:
-            tat = p['comp'] - p['arrival_time']
-            final_procs.append({'id': p['id'], 'arrival_time': p['arrival_time'], 'burst_time': p['burst_time'], 'start_time': p['first_start'], 'completion_time': p['comp'], 'turnaround_time': tat, 'waiting_time': tat - p['burst_time']})
-        return final_procs, execution_order
-
-# ================== ICON SYSTEM (SVG) ==================
-
-ICONS = {
-    'cpu': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="4" y="4" width="16" height="16" rx="2" ry="2"></rect><rect x="9" y="9" width="6" height="6"></rect><line x1="9" y1="1" x2="9" y2="4"></line><line x1="15" y1="1" x2="15" y2="4"></line><line x1="9" y1="20" x2="9" y2="23"></line><line x1="15" y1="20" x2="15" y2="23"></line><line x1="20" y1="9" x2="23" y2="9"></line><line x1="20" y1="15" x2="23" y2="15"></line><line x1="1" y1="9" x2="4" y2="9"></line><line x1="1" y1="15" x2="4" y2="15"></line></svg>',
-    'list': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="8" y1="6" x2="21" y2="6"></line><line x1="8" y1="12" x2="21" y2="12"></line><line x1="8" y1="18" x2="21" y2="18"></line><line x1="3" y1="6" x2="3.01" y2="6"></line><line x1="3" y1="12" x2="3.01" y2="12"></line><line x1="3" y1="18" x2="3.01" y2="18"></line></svg>',
-    'plus': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="12" y1="5" x2="12" y2="19"></line><line x1="5" y1="12" x2="19" y2="12"></line></svg>',
-    'chart': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="18" y1="20" x2="18" y2="10"></line><line x1="12" y1="20" x2="12" y2="4"></line><line x1="6" y1="20" x2="6" y2="14"></line></svg>',
-    'pulse': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="22 12 18 12 15 21 9 3 6 12 2 12"></polyline></svg>',
-    'settings': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="3"></circle><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"></path></svg>'
-}
-
-# ================== DESIGN SYSTEM V4.0 ==================
-
-st.set_page_config(page_title="CPU-PRO CORE // V4.0", layout="wide", page_icon="✨")
-
-st.markdown(f"""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=IBM+Plex+Mono&display=swap');
-
-    :root {{
-        --bg-main: #050508;
-        --surface: #0a0a0f;
-        --card: #13131a;
-        --primary: #6366f1;
-        --primary-glow: rgba(99, 102, 241, 0.4);
-        --accent: #22d3ee;
-        --success: #10b981;
-        --text-1: #e2e8f0;
-        --text-2: #94a3b8;
-        --border: rgba(255, 255, 255, 0.05);
-    }}
-
-    .stApp {{
-        background: var(--bg-main);
-        color: var(--text-1);
-        font-family: 'Space Grotesk', sans-serif;
-    }}
-
-    .platinum-header {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 1.5rem 3rem;
-        background: rgba(10, 10, 15, 0.95);
-        border-bottom: 2px solid var(--border);
-        margin-bottom: 2rem;
-        position: sticky;
-        top: 0;
-        z-index: 1001;
-    }}
-
-    .brand {{
-        display: flex;
-        align-items: center;
-        gap: 15px;
-        font-size: 1.6rem;
-        font-weight: 700;
-        letter-spacing: -1px;
-        color: #fff;
-    }}
-
-    .brand-accent {{
-        background: linear-gradient(135deg, #6366f1 0%, #a855f7 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }}
-
-    .icon-box {{
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        padding: 10px;
-        background: rgba(255, 255, 255, 0.03);
-        border: 1px solid var(--border);
-        border-radius: 12px;
-        color: var(--primary);
-    }}
-
-    .custom-card {{
-        background: var(--card);
-        border: 1px solid var(--border);
-        border-radius: 24px;
-        padding: 2rem;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 30px rgba(0, 0, 0, 0.3);
-    }}
-
-    .card-label {{
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        font-size: 0.9rem;
-        font-weight: 600;
-        color: var(--text-2);
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        margin-bottom: 2rem;
-    }}
-
-    /* Global Overrides for Professionalism */
-    .stMetric {{ background: transparent !important; padding: 0 !important; border: none !important; }}
-    .stMetric label {{ color: var(--text-2) !important; font-size: 0.8rem !important; text-transform: uppercase !important; letter-spacing: 1px !important; }}
-    .stMetric value {{ font-size: 2rem !important; font-weight: 700 !important; font-family: 'Space Grotesk' !important; }}
-
-    .stButton button {{
-        background: var(--primary) !important;
-        border-radius: 12px !important;
-        border: none !important;
-        font-weight: 600 !important;
-        text-transform: none !important;
-        transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        color: white !important;
-        padding: 0.6rem 2rem !important;
-    }}
-
-    .stButton button:hover {{
-        background: #4f46e5 !important;
-        transform: translateY(-1px);
-        box-shadow: 0 8px 20px var(--primary-glow);
-    }}
-
-    section[data-testid="stSidebar"] {{ display: none !important; }}
-    
-    ::-webkit-scrollbar {{ width: 4px; height: 4px; }}
-    ::-webkit-scrollbar-thumb {{ background: rgba(255, 255, 255, 0.1); border-radius: 10px; }}
-    
-    .status-dot {{
-        height: 8px;
-        width: 8px;
-        background-color: var(--success);
-        border-radius: 50%;
-        display: inline-block;
-        margin-right: 8px;
-        box-shadow: 0 0 10px var(--success);
-    }}
-</style>
-""", unsafe_allow_html=True)
-
-# App Shell
-st.markdown(f"""
-<div class="platinum-header">
-    <div class="brand">
-        <div class="icon-box">{ICONS['cpu']}</div>
-        CPU-PRO <span class="brand-accent">PLATINUM V4.0</span>
-    </div>
-    <div style="display: flex; align-items: center; gap: 30px;">
-        <div style="font-size: 0.8rem; color: var(--text-2); border-right: 1px solid var(--border); padding-right: 20px;">
-            <span class="status-dot"></span> SYSTEM READY
-        </div>
-        <div style="font-family: 'IBM Plex Mono', monospace; font-size: 0.75rem; color: #6366f1;">
-            BUILD_ID_2026.02_CORE
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-# Initialization
-if 'procs' not in st.session_state: st.session_state.procs = []
-if 'p_count' not in st.session_state: st.session_state.p_count = 1
-if 'results' not in st.session_state: st.session_state.results = None
-
-# KPI Summary Strip
-if st.session_state.procs:
-    k1, k2, k3, k4 = st.columns(4)
-    with k1: st.metric("ACTIVE_THREADS", len(st.session_state.procs))
-    with k2: st.metric("QUEUE_LOAD", f"{sum(p['burst_time'] for p in st.session_state.procs)} U")
-    with k3: st.metric("COMPUTE_NODES", "CORE_01")
-    with k4: st.metric("PLATFORM_STATE", "NOMINAL")
-
-# 2-Column Desktop Grid
-col_config, col_visuals = st.columns([1, 1.4], gap="large")
-
-with col_config:
-    # INPUT HUB
-    st.markdown(f"""<div class="custom-card"><div class="card-label">
-        <span style="color:var(--primary);">{ICONS['plus']}</span> THREAD CONFIGURATION
-    </div>""", unsafe_allow_html=True)
-    
-    with st.form("add_proc", clear_on_submit=True):
-        f_at = st.number_input("Arrival Offset (t)", min_value=0, step=1, value=0)
-        f_bt = st.number_input("Burst Duration (ms)", min_value=1, step=1, value=5)
-        if st.form_submit_button("COMMIT TO QUEUE"):
-            st.session_state.procs.append({'id': st.session_state.p_count, 'arrival_time': f_at, 'burst_time': f_bt})
-            st.session_state.p_count += 1
-            st.rerun()
-    
-    st.markdown('<div style="margin-top: 2rem;"></div>', unsafe_allow_html=True)
-    
-    # GLOBAL ACTIONS
-    a1, a2 = st.columns(2)
-    if a1.button("🎲 SYNC RANDOM_5"):
-        for _ in range(5):
-            st.session_state.procs.append({'id': st.session_state.p_count, 'arrival_time': random.randint(0, 10), 'burst_time': random.randint(1, 15)})
-            st.session_state.p_count += 1
-        st.rerun()
-    if a2.button("🗑️ PURGE ALL"):
-        st.session_state.procs, st.session_state.p_count, st.session_state.results = [], 1, None
-        st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
-
-    # QUEUE REGISTRY
-    st.markdown(f"""<div class="custom-card"><div class="card-label">
-        <span style="color:var(--primary);">{ICONS['list']}</span> QUEUE REGISTRY (ACTIVE)
-    </div>""", unsafe_allow_html=True)
-    if st.session_state.procs:
-        st.dataframe(pd.DataFrame(st.session_state.procs).set_index('id'), use_container_width=True, height=350)
-    else:
-        st.markdown('<p style="color:var(--text-2); font-size:0.9rem;">No active threads in registry.</p>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col_visuals:
-    # ANALYTICS DASHBOARD
-    st.markdown(f"""<div class="custom-card"><div class="card-label">
-        <span style="color:var(--primary);">{ICONS['chart']}</span> ANALYTICS & EXECUTION ENGINE
-    </div>""", unsafe_allow_html=True)
-    
-    e1, e2 = st.columns([1.5, 1])
-    engine = e1.selectbox("Select Core Algorithm", ["FCFS - Sequential", "SJF - Optimal Latency", "RR - Fair Share", "Full Benchmark Audit"])
-    quantum = e2.number_input("Quantum (T)", min_value=1, value=2, disabled=("RR" not in engine and "Audit" not in engine))
-    
-    if st.button("IGNITE SIMULATION ENGINE"):
-        if not st.session_state.procs:
-            st.error("Engine Halt: Thread registry is empty.")
-        else:
-            with st.spinner("Quantum alignment in progress..."):
-                time.sleep(0.8)
-                if "FCFS" in engine: res = CPUCore.fcfs(st.session_state.procs); st.session_state.results = ('FCFS', res)
-                elif "SJF" in engine: res = CPUCore.sjf(st.session_state.procs); st.session_state.results = ('SJF', res)
-                elif "RR" in engine: res = CPUCore.rr(st.session_state.procs, quantum); st.session_state.results = ('RR', res)
-                else:
-                    d1 = CPUCore.fcfs(st.session_state.procs)
-                    d2 = CPUCore.sjf(st.session_state.procs)
-                    d3 = CPUCore.rr(st.session_state.procs, quantum)
-                    st.session_state.results = ('AUDIT', (d1, d2, d3))
-    
-    st.divider()
-
-    if st.session_state.results:
-        rtype, rdata = st.session_state.results
-        
-        if rtype == 'AUDIT':
-            t1, t2 = st.tabs(["Performance Comparison", "Strategy Recommendation"])
-            (f_p, f_o), (s_p, s_o), (r_p, r_o) = rdata
-            
-            with t1:
-                comp_df = pd.DataFrame({
-                    'Metric': ['Avg Wait', 'Avg Wait', 'Avg Wait', 'Avg Turnaround', 'Avg Turnaround', 'Avg Turnaround'],
-                    'Value': [pd.DataFrame(f_p)['waiting_time'].mean(), pd.DataFrame(s_p)['waiting_time'].mean(), pd.DataFrame(r_p)['waiting_time'].mean(),
-                              pd.DataFrame(f_p)['turnaround_time'].mean(), pd.DataFrame(s_p)['turnaround_time'].mean(), pd.DataFrame(r_p)['turnaround_time'].mean()],
-                    'Algorithm': ['FCFS', 'SJF', 'RR', 'FCFS', 'SJF', 'RR']
-                })
-                fig = px.bar(comp_df, x='Algorithm', y='Value', color='Metric', barmode='group', 
-                             template="plotly_dark", color_discrete_sequence=['#6366f1', '#22d3ee'])
-                fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
-                                  font_family='Space Grotesk', margin=dict(l=0,r=0,t=20,b=0))
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with t2:
-                best = min([('FCFS', pd.DataFrame(f_p)['waiting_time'].mean()), ('SJF', pd.DataFrame(s_p)['waiting_time'].mean()), ('RR', pd.DataFrame(r_p)['waiting_time'].mean())], key=lambda x: x[1])
-                st.markdown(f"""
-                <div style="background:rgba(16,185,129,0.1); border-left:4px solid #10b981; padding:20px; border-radius:12px;">
-                    <h3 style="color:#10b981; margin:0;">AUDIT WINNER: {best[0]}</h3>
-                    <p style="color:var(--text-2); margin-top:10px;">Optimal latency achieved with <b>{best[1]:.2f} units</b> average wait time.</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-        else:
-            final_p, exec_o = rdata
-            stats_df = pd.DataFrame(final_p)
-            
-            # KPI Strip
-            m1, m2, m3 = st.columns(3)
-            m1.metric("AVG_WAIT_TIME", f"{stats_df['waiting_time'].mean():.2f}")
-            m2.metric("AVG_TAT", f"{stats_df['turnaround_time'].mean():.2f}")
-            total_time = pd.DataFrame(exec_o)['completion_time'].max()
-            util = (sum(p['burst_time'] for p in st.session_state.procs) / total_time * 100)
-            m3.metric("CPU_UTILIZATION", f"{util:.1f}%")
-            
-            # GANTT CHART
-            st.markdown('<div style="margin-top:2rem;"></div>', unsafe_allow_html=True)
-            fig_g = px.timeline([dict(Task=f"P{x['id']}", Start=x['start_time'], Finish=x['completion_time'], Color=f"P{x['id']}") for x in exec_o],
-                                 x_start="Start", x_end="Finish", y="Task", color="Color", template="plotly_dark",
-                                 title="Visual Execution Sequence (Gantt Chart)", color_discrete_sequence=px.colors.qualitative.G10)
-            
-            fig_g.layout.xaxis.type = 'linear'
-            for i in range(len(fig_g.data)):
-                d = exec_o[i]
-                fig_g.data[i].x = [d['completion_time'] - d['start_time']]
-                fig_g.data[i].base = d['start_time']
-                
-            fig_g.update_layout(showlegend=False, height=350, margin=dict(l=0, r=0, t=40, b=0),
-                                paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-                                xaxis_title="Core Cycles (t)", yaxis_title="")
-            st.plotly_chart(fig_g, use_container_width=True)
-
-            # DEEP METRICS
-            with st.expander("DEEP_KERNEL_METRIC_REPORT"):
-                st.dataframe(stats_df.set_index('id'), use_container_width=True)
-
-    else:
-        st.markdown('<p style="color:var(--text-2); border:1px dashed var(--border); padding:40px; text-align:center; border-radius:20px;">Ready for simulation. Ignite engine to visualize data.</p>', unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-
-# Footer
-st.markdown(f"""
-<div style="text-align: center; margin-top: 5rem; padding: 3rem; color: #475569; border-top: 1px solid var(--border);">
-    <div style="display: flex; justify-content: center; gap: 40px; margin-bottom: 1.5rem;">
-        <div style="font-weight: 700; color: #64748b;">LATEST REVISION: FEB 2026</div>
-        <div style="color: #64748b;">INTEGRATED SCHEDULING SYSTEM</div>
-        <div style="color: #64748b;">PLATINUM LICENSE: 0x48291A</div>
-    </div>
-    <div style="font-family: 'IBM Plex Mono', monospace; font-size: 0.7rem; letter-spacing: 0.2em; opacity: 0.5;">
-        CORE_KERNEL_LOADED // ALL_SYSTEMS_OPTIMAL // STABLE_READY
-    </div>
-</div>
-""", unsafe_allow_html=True)
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import hashlib
+import os
+import random
+from io import BytesIO
+
+from cpu_sched import CompactTimeline, Registry, ResultCache, Schedule, Telemetry, available, summarize
+from cpu_sched.io import read_workload, table_to_frame, write_table
+from cpu_sched.gantt import gantt_plan
+from cpu_sched.incremental import extend_schedule
+from cpu_sched.jobs import JobRunner
+from cpu_sched.sweep import best_quantum, parse_quanta, quantum_sweep
+from cpu_sched.telemetry import engine_stats, span
+from cpu_sched.workload import ARRIVALS, BURSTS, generate, parse_mix
+
+# ================== ICON SYSTEM (SVG) ==================
+
+ICONS = {
+    'cpu': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="4" y="4" width="16" height="16" rx="2" ry="2"></rect><rect x="9" y="9" width="6" height="6"></rect><line x1="9" y1="1" x2="9" y2="4"></line><line x1="15" y1="1" x2="15" y2="4"></line><line x1="9" y1="20" x2="9" y2="23"></line><line x1="15" y1="20" x2="15" y2="23"></line><line x1="20" y1="9" x2="23" y2="9"></line><line x1="20" y1="15" x2="23" y2="15"></line><line x1="1" y1="9" x2="4" y2="9"></line><line x1="1" y1="15" x2="4" y2="15"></line></svg>',
+    'list': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="8" y1="6" x2="21" y2="6"></line><line x1="8" y1="12" x2="21" y2="12"></line><line x1="8" y1="18" x2="21" y2="18"></line><line x1="3" y1="6" x2="3.01" y2="6"></line><line x1="3" y1="12" x2="3.01" y2="12"></line><line x1="3" y1="18" x2="3.01" y2="18"></line></svg>',
+    'plus': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="12" y1="5" x2="12" y2="19"></line><line x1="5" y1="12" x2="19" y2="12"></line></svg>',
+    'chart': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="18" y1="20" x2="18" y2="10"></line><line x1="12" y1="20" x2="12" y2="4"></line><line x1="6" y1="20" x2="6" y2="14"></line></svg>',
+    'pulse': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="22 12 18 12 15 21 9 3 6 12 2 12"></polyline></svg>',
+    'settings': '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="3"></circle><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"></path></svg>'
+}
+
+# ================== VISUAL ENGINE ==================
+
+def render_gantt(exec_o, title, lanes=False):
+    # Coalesced bars in one trace, colored per process; past the render budget, occupancy bands in a single heatmap
+    plan = gantt_plan(exec_o, lanes=lanes)
+    label = (lambda r: [f"CORE_{c + 1:02d}" for c in r]) if lanes else (lambda r: [f"P{i}" for i in r])
+    if plan.mode == 'bars':
+        palette = px.colors.qualitative.G10
+        fig = go.Figure()
+        if plan.bars:
+            # Trace count stays at one however many processes there are; Plotly's cost grows with traces, not bars
+            fig.add_trace(go.Bar(orientation='h', y=label(np.concatenate([b.row for b in plan.bars]).tolist()),
+                                 base=np.concatenate([b.start for b in plan.bars]), x=np.concatenate([b.duration for b in plan.bars]),
+                                 customdata=np.concatenate([np.full(len(b.start), b.id) for b in plan.bars]),
+                                 marker_color=[palette[n % len(palette)] for n, b in enumerate(plan.bars) for _ in range(len(b.start))],
+                                 hovertemplate="P%{customdata}<br>start %{base}, %{x} units<extra></extra>"))
+        rows = label(np.unique(np.concatenate([b.row for b in plan.bars])).tolist()[::-1]) if plan.bars else []
+        if plan.overhead is not None:
+            o = plan.overhead
+            fig.add_trace(go.Bar(name="SWITCH", orientation='h', y=["SWITCH"] * len(o.start), base=o.start, x=o.duration, marker_color='#64748b',
+                                 hovertemplate="context switch<br>start %{base}, %{x} units<extra></extra>"))
+            rows = ["SWITCH"] + rows
+        fig.update_layout(barmode='overlay', yaxis=dict(categoryorder='array', categoryarray=rows))
+    else:
+        rows = plan.rows
+        fig = go.Figure(go.Heatmap(z=plan.occupancy, x=(plan.edges[:-1] + plan.edges[1:]) / 2, y=rows, zmin=0, zmax=1,
+                                   colorscale=[[0, 'rgba(0,0,0,0)'], [1, '#6366f1']], colorbar=dict(title='busy')))
+        title += f" · {plan.slices:,} slices, occupancy view"
+    fig.update_layout(template="plotly_dark", title=title, showlegend=False, height=max(350, min(900, 22 * len(rows))),
+                      margin=dict(l=0, r=0, t=40, b=0), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      xaxis_title="Core Cycles (t)", yaxis_title="")
+    return fig
+
+# ================== DESIGN SYSTEM V4.0 ==================
+
+st.set_page_config(page_title="CPU-PRO CORE // V4.0", layout="wide", page_icon="✨")
+
+st.markdown(f"""
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=IBM+Plex+Mono&display=swap');
+
+    :root {{
+        --bg-main: #050508;
+        --surface: #0a0a0f;
+        --card: #13131a;
+        --primary: #6366f1;
+        --primary-glow: rgba(99, 102, 241, 0.4);
+        --accent: #22d3ee;
+        --success: #10b981;
+        --text-1: #e2e8f0;
+        --text-2: #94a3b8;
+        --border: rgba(255, 255, 255, 0.05);
+    }}
+
+    .stApp {{
+        background: var(--bg-main);
+        color: var(--text-1);
+        font-family: 'Space Grotesk', sans-serif;
+    }}
+
+    .platinum-header {{
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        padding: 1.5rem 3rem;
+        background: rgba(10, 10, 15, 0.95);
+        border-bottom: 2px solid var(--border);
+        margin-bottom: 2rem;
+        position: sticky;
+        top: 0;
+        z-index: 1001;
+    }}
+
+    .brand {{
+        display: flex;
+        align-items: center;
+        gap: 15px;
+        font-size: 1.6rem;
+        font-weight: 700;
+        letter-spacing: -1px;
+        color: #fff;
+    }}
+
+    .brand-accent {{
+        background: linear-gradient(135deg, #6366f1 0%, #a855f7 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }}
+
+    .icon-box {{
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        padding: 10px;
+        background: rgba(255, 255, 255, 0.03);
+        border: 1px solid var(--border);
+        border-radius: 12px;
+        color: var(--primary);
+    }}
+
+    .custom-card {{
+        background: var(--card);
+        border: 1px solid var(--border);
+        border-radius: 24px;
+        padding: 2rem;
+        margin-bottom: 2rem;
+        box-shadow: 0 4px 30px rgba(0, 0, 0, 0.3);
+    }}
+
+    .card-label {{
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        font-size: 0.9rem;
+        font-weight: 600;
+        color: var(--text-2);
+        text-transform: uppercase;
+        letter-spacing: 0.1em;
+        margin-bottom: 2rem;
+    }}
+
+    /* Global Overrides for Professionalism */
+    .stMetric {{ background: transparent !important; padding: 0 !important; border: none !important; }}
+    .stMetric label {{ color: var(--text-2) !important; font-size: 0.8rem !important; text-transform: uppercase !important; letter-spacing: 1px !important; }}
+    .stMetric value {{ font-size: 2rem !important; font-weight: 700 !important; font-family: 'Space Grotesk' !important; }}
+
+    .stButton button {{
+        background: var(--primary) !important;
+        border-radius: 12px !important;
+        border: none !important;
+        font-weight: 600 !important;
+        text-transform: none !important;
+        transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        color: white !important;
+        padding: 0.6rem 2rem !important;
+    }}
+
+    .stButton button:hover {{
+        background: #4f46e5 !important;
+        transform: translateY(-1px);
+        box-shadow: 0 8px 20px var(--primary-glow);
+    }}
+
+    section[data-testid="stSidebar"] {{ display: none !important; }}
+    
+    ::-webkit-scrollbar {{ width: 4px; height: 4px; }}
+    ::-webkit-scrollbar-thumb {{ background: rgba(255, 255, 255, 0.1); border-radius: 10px; }}
+    
+    .status-dot {{
+        height: 8px;
+        width: 8px;
+        background-color: var(--success);
+        border-radius: 50%;
+        display: inline-block;
+        margin-right: 8px;
+        box-shadow: 0 0 10px var(--success);
+    }}
+</style>
+""", unsafe_allow_html=True)
+
+# App Shell
+st.markdown(f"""
+<div class="platinum-header">
+    <div class="brand">
+        <div class="icon-box">{ICONS['cpu']}</div>
+        CPU-PRO <span class="brand-accent">PLATINUM V4.0</span>
+    </div>
+    <div style="display: flex; align-items: center; gap: 30px;">
+        <div style="font-size: 0.8rem; color: var(--text-2); border-right: 1px solid var(--border); padding-right: 20px;">
+            <span class="status-dot"></span> SYSTEM READY
+        </div>
+        <div style="font-family: 'IBM Plex Mono', monospace; font-size: 0.75rem; color: #6366f1;">
+            BUILD_ID_2026.02_CORE
+        </div>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+@st.cache_resource
+def job_runner():
+    # One bounded worker pool for every session; CPU_PRO_WORKERS sets its size
+    return JobRunner(workers=int(os.environ.get('CPU_PRO_WORKERS', 2)))
+
+@st.cache_resource
+def result_cache():
+    # Shared across sessions and reruns; set CPU_PRO_CACHE_DIR to also keep results on disk
+    return ResultCache(maxsize=64, directory=os.environ.get('CPU_PRO_CACHE_DIR'))
+
+EXPORT_FORMATS = {'CSV': ('csv', 'text/csv'), 'Parquet': ('parquet', 'application/octet-stream'),
+                  'JSONL': ('jsonl', 'application/x-ndjson'), 'Binary Trace': ('trace', 'application/octet-stream')}
+
+PAGE_SIZE = 200  # rows sent to the browser per table page
+
+def export_bytes(table, fmt):
+    # Passed to download buttons as a callable, so files are only serialized when a download is clicked
+    buf = BytesIO()
+    write_table(table, buf, fmt)
+    return buf.getvalue()
+
+def paged_dataframe(table, key, **kwargs):
+    # Only the selected page is turned into a DataFrame and serialized, so render cost is flat in the table size
+    pages = max(1, -(-len(table) // PAGE_SIZE))
+    page = st.number_input(f"Page (1-{pages}, {len(table):,} rows)", min_value=1, max_value=pages, value=1, key=key) if pages > 1 else 1
+    rows = table.take(slice((page - 1) * PAGE_SIZE, page * PAGE_SIZE))
+    st.dataframe(table_to_frame(rows).set_index('id'), use_container_width=True, **kwargs)
+
+def param_key(params):
+    # Short stable tag of a scheduler's parameters, used as the ResultCache key's parameter slot
+    return hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=8).hexdigest() if params else None
+
+@st.fragment(run_every=0.5)
+def job_monitor(job):
+    # Polls the background run without rerunning the page; once it finishes the whole app reruns to collect it
+    if job.finished: st.rerun()
+    done = f"{job.done:,} / {job.total:,} processes" if job.total else "running"
+    clock = f" · t = {job.time:,.0f}" if job.time is not None else ""
+    st.progress(job.fraction or 0.0, text=f"{job.label}: {done}{clock} · {job.elapsed:.1f}s" if job.status == 'running'
+                else f"{job.label}: queued behind {job_runner().pending - 1} job(s)")
+    if st.button("⏹ CANCEL SIMULATION"): job.cancel()
+
+def render_telemetry(tel):
+    # Phase timings (nested spans indented), per-engine dispatch / queue statistics and the span exports
+    with st.expander("ENGINE TELEMETRY", expanded=True):
+        phases = pd.DataFrame(tel.phases())
+        phases['phase'] = ['· ' * d + p for d, p in zip(phases['depth'], phases['phase'])]
+        st.dataframe(phases.drop(columns='depth' if tel.memory else ['depth', 'peak_mb']).set_index('phase'), use_container_width=True)
+        engines = [a for a in tel.find('engine.') + tel.find('simulate') if 'dispatches' in a]
+        if engines:
+            st.dataframe(pd.DataFrame([{k: a[k] for k in ('algorithm', 'dispatches', 'switches', 'queue.max', 'queue.mean')} for a in engines]).set_index('algorithm'),
+                         use_container_width=True)
+            hist = pd.DataFrame([(a['algorithm'], b, c) for a in engines for b, c in a['queue.hist'].items()], columns=['Algorithm', 'Ready queue length', 'Dispatches'])
+            fig = px.bar(hist, x='Ready queue length', y='Dispatches', color='Algorithm', barmode='group', template="plotly_dark")
+            fig.update_layout(height=250, margin=dict(l=0, r=0, t=20, b=0), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+            st.plotly_chart(fig, use_container_width=True)
+        y1, y2 = st.columns(2)
+        y1.download_button("📤 TELEMETRY (JSON)", lambda: tel.dumps('json'), file_name="telemetry.json", mime="application/json")
+        y2.download_button("📤 SPANS (OTLP)", lambda: tel.dumps('otlp'), file_name="telemetry.otlp.json", mime="application/json")
+
+# Initialization
+if 'registry' not in st.session_state: st.session_state.registry = Registry()
+if 'results' not in st.session_state: st.session_state.results = None
+# Last single-core run per algorithm as (param key, table, Schedule): reruns after COMMIT TO QUEUE resume from it
+if 'runs' not in st.session_state: st.session_state.runs = {}
+registry = st.session_state.registry
+
+# KPI Summary Strip
+if len(registry):
+    k1, k2, k3, k4 = st.columns(4)
+    with k1: st.metric("ACTIVE_THREADS", len(registry))
+    with k2: st.metric("QUEUE_LOAD", f"{registry.total_burst} U")
+    with k3: st.metric("COMPUTE_NODES", "CORE_01" if st.session_state.get('cores', 1) == 1 else f"CORE_01-{st.session_state.cores:02d}")
+    with k4: st.metric("PLATFORM_STATE", "NOMINAL")
+
+# 2-Column Desktop Grid
+col_config, col_visuals = st.columns([1, 1.4], gap="large")
+
+with col_config:
+    # INPUT HUB
+    st.markdown(f"""<div class="custom-card"><div class="card-label">
+        <span style="color:var(--primary);">{ICONS['plus']}</span> THREAD CONFIGURATION
+    </div>""", unsafe_allow_html=True)
+    
+    with st.form("add_proc", clear_on_submit=True):
+        f_at = st.number_input("Arrival Offset (t)", min_value=0, step=1, value=0)
+        f_bt = st.number_input("Burst Duration (ms)", min_value=1, step=1, value=5)
+        f_pr = st.number_input("Priority (0 = most urgent)", min_value=0, step=1, value=0)
+        if st.form_submit_button("COMMIT TO QUEUE"):
+            registry.append(f_at, f_bt, f_pr)
+            st.rerun()
+    
+    st.markdown('<div style="margin-top: 2rem;"></div>', unsafe_allow_html=True)
+    
+    # GLOBAL ACTIONS
+    a1, a2 = st.columns(2)
+    if a1.button("🎲 SYNC RANDOM_5"):
+        for _ in range(5): registry.append(random.randint(0, 10), random.randint(1, 15), random.randint(0, 9))
+        st.rerun()
+    if a2.button("🗑️ PURGE ALL"):
+        registry.clear()
+        st.session_state.results, st.session_state.runs = None, {}
+        st.rerun()
+
+    # SYNTHETIC WORKLOADS
+    with st.expander("SYNTHETIC WORKLOAD GENERATOR"):
+        g1, g2, g3 = st.columns(3)
+        g_n = g1.number_input("Processes", min_value=1, max_value=10**7, value=1000, step=1000)
+        g_arrival = g2.selectbox("Arrival process", ARRIVALS, format_func=str.upper)
+        g_burst = g3.selectbox("Burst distribution", BURSTS, format_func=str.capitalize)
+        g4, g5, g6 = st.columns(3)
+        g_mean = g4.number_input("Mean burst", min_value=1.0, value=5.0, step=1.0)
+        g_load = g5.number_input("Offered load", min_value=0.05, max_value=5.0, value=0.9, step=0.05, help="Arrival rate x mean burst; above 1 the queue grows without bound.")
+        g_seed = g6.number_input("Seed", min_value=0, value=0, step=1)
+        g_mix = st.text_input("Priority mix (level:weight, blank = none)", value="0:1,5:3,9:1")
+        if st.button("⚙️ GENERATE INTO REGISTRY"):
+            try:
+                table = generate(int(g_n), arrival=g_arrival, burst=g_burst, mean_burst=g_mean, load=g_load,
+                                 priorities=parse_mix(g_mix) if g_mix.strip() else None, seed=int(g_seed))
+            except ValueError as e:
+                st.error(f"Generator rejected: {e}")
+            else:
+                registry.replace(table)
+                st.session_state.results, st.session_state.runs = None, {}
+                st.rerun()
+
+    # BULK I/O
+    with st.expander("BULK IMPORT / EXPORT"):
+        upload = st.file_uploader("Workload file (replaces the registry)", type=['csv', 'txt', 'parquet', 'pq', 'jsonl', 'ndjson', 'trace', 'bin'])
+        if upload is not None and st.button("📥 LOAD INTO REGISTRY"):
+            try:
+                table = read_workload(upload)
+            except ValueError as e:
+                st.error(f"Import rejected: {e}")
+            else:
+                registry.replace(table)
+                st.session_state.results, st.session_state.runs = None, {}
+                st.rerun()
+        if len(registry):
+            x1, x2 = st.columns([1, 1])
+            reg_fmt = x1.selectbox("Registry format", list(EXPORT_FORMATS), key='registry_fmt')
+            ext, mime = EXPORT_FORMATS[reg_fmt]
+            x2.download_button("📤 EXPORT REGISTRY", lambda: export_bytes(registry.table(), ext), file_name=f"workload.{ext}", mime=mime)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # QUEUE REGISTRY
+    st.markdown(f"""<div class="custom-card"><div class="card-label">
+        <span style="color:var(--primary);">{ICONS['list']}</span> QUEUE REGISTRY (ACTIVE)
+    </div>""", unsafe_allow_html=True)
+    if len(registry):
+        paged_dataframe(registry.table(), 'registry_page', height=350)
+    else:
+        st.markdown('<p style="color:var(--text-2); font-size:0.9rem;">No active threads in registry.</p>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col_visuals:
+    # ANALYTICS DASHBOARD
+    st.markdown(f"""<div class="custom-card"><div class="card-label">
+        <span style="color:var(--primary);">{ICONS['chart']}</span> ANALYTICS & EXECUTION ENGINE
+    </div>""", unsafe_allow_html=True)
+    
+    e1, e2 = st.columns([1.5, 1])
+    # Every registered scheduler whose required fields the registry holds gets a menu entry; its declared parameters
+    # decide which inputs are shown
+    labels = {cls.label: cls for cls in available(Registry.COLUMNS).values()}
+    engine = e1.selectbox("Select Core Algorithm", [*labels, "RR - Quantum Sweep", "Full Benchmark Audit"])
+    sched, sweep, audit = labels.get(engine), "Sweep" in engine, "Audit" in engine
+    quantum = e2.number_input("Quantum (T)", min_value=1, value=2, disabled=not (audit or (sched and sched.tune(1))))
+    smp_capable = sched is not None and sched.smp is not None
+    if sweep:
+        w1, w2 = st.columns([1.5, 1])
+        sweep_text = w1.text_input("Quanta (list or start:stop[:step])", value="1:50")
+        objective = w2.selectbox("Optimize", ["avg_wait", "p95_wait", "p99_wait", "avg_tat", "avg_response", "p99_response"])
+    params = dict(sched.tune(quantum)) if sched else {}
+    if sched and 'quanta' in sched.params:
+        f1, f2 = st.columns([1.5, 1])
+        # The level quanta default to the scheduler's tuning of the Quantum input (q, 2q, 4q for MLFQ), so that input
+        # still steers the run unless the levels are edited by hand
+        default = params.get('quanta', sched.params['quanta'])
+        quanta_text = f1.text_input("Level Quanta (top → bottom)", value=",".join(map(str, default)))
+        try: params['quanta'] = tuple(int(q) for q in quanta_text.split(',') if q.strip())
+        except ValueError: params['quanta'] = ()
+        if 'boost' in sched.params: params['boost'] = f2.number_input("Priority Boost Period (0 = off)", min_value=0, value=0) or None
+    if sched and 'aging' in sched.params:
+        params['aging'] = st.number_input("Aging Interval (0 = off)", min_value=0, value=0, help="Every N units of waiting lower a process's priority value by 1.") or None
+    c1, c2 = st.columns([1, 1.5])
+    cores = c1.number_input("Compute Cores (k)", min_value=1, max_value=128, value=1, key='cores', disabled=not smp_capable)
+    queue_model = c2.selectbox("Run Queue Model", ["Global Run Queue", "Per-Core Queues + Work Stealing"], disabled=not smp_capable or cores == 1)
+    costed = (sweep or audit or (sched is not None and sched.costed())) and not (smp_capable and cores > 1)
+    o1, o2 = st.columns([1, 1.5])
+    switch_cost = o1.number_input("Context Switch Cost", min_value=0.0, value=0.0, step=0.5, disabled=not costed, help="CPU time lost each time a different process is switched in.")
+    warmup = o2.number_input("Cache Warmup Penalty", min_value=0.0, value=0.0, step=0.5, disabled=not costed, help="Extra time when a process resumes after being displaced.")
+    if not costed: switch_cost = warmup = 0.0
+    costs, ctag = (switch_cost, warmup), f'+cs{switch_cost:g},{warmup:g}' if switch_cost or warmup else ''
+    if sched and sched.costed() and ctag: params.update(switch_cost=switch_cost, warmup=warmup)
+    
+    t1c, t2c = st.columns([1, 1.5])
+    telemetry_on = t1c.toggle("Engine telemetry", help="Time each phase (simulation, summaries, rendering) and record dispatch and ready-queue statistics.")
+    trace_memory = t2c.checkbox("Trace peak memory", disabled=not telemetry_on, help="Uses tracemalloc, which slows Python-level phases down.")
+    ignite = st.button("IGNITE SIMULATION ENGINE")
+    # Runs execute on the shared job pool. `tel` is set again on the rerun that collects the finished job, so the
+    # summary and render spans below join the simulation spans in one trace.
+    tel = None
+    if ignite:
+        if not len(registry):
+            st.error("Engine Halt: Thread registry is empty.")
+        elif 'quanta' in params and (not params['quanta'] or min(params['quanta']) < 1):
+            st.error("MLFQ quanta must be positive integers, e.g. 2,4,8.")
+        else:
+            try: quanta = parse_quanta(sweep_text) if sweep else None
+            except ValueError as e: st.error(str(e))
+            else:
+                if st.session_state.get('job'): st.session_state.job[0].cancel()
+                # Everything the job reads is captured here: it runs off the script thread, where st.* is unavailable,
+                # and the registry may grow while it runs
+                job_tel = Telemetry(memory=trace_memory) if telemetry_on else None
+                cache, procs, digest, runs = result_cache(), registry.table(), registry.fingerprint(), dict(st.session_state.runs)
+                def run(algo, fn, q=None):
+                    with span(job_tel, 'simulate', algorithm=algo) as attrs:
+                        fresh = []
+                        value = cache.get_or_compute(digest, algo, q, lambda: fresh.append(True) or fn())
+                        attrs['cache'] = 'miss' if fresh else 'hit'
+                        # A cache hit skips the engine span, so its dispatch statistics are read off the cached schedule
+                        if job_tel and not fresh and isinstance(value, Schedule):
+                            attrs.update(engine_stats(value.final, value.timeline, 1 if value.util is None else len(value.util)))
+                    return value
+                def simulate(cls, p, progress, k=1, queues='global'):
+                    # Single-core runs resume from this session's last schedule of the same algorithm and parameters;
+                    # extend_schedule falls back to a full run unless the registry only grew since then and the new arrivals land
+                    # near a checkpoint
+                    algo, key = cls.name + (f'@{k}:{queues}' if k > 1 else ''), param_key(p)
+                    last = runs.get(algo) if k == 1 else None
+                    value = run(algo, lambda: extend_schedule(cls, last[1], last[2], procs, telemetry=job_tel, progress=progress, **p) if last and last[0] == key
+                                else cls.run(procs, k, queues, telemetry=job_tel, progress=progress, **p), key)
+                    if k == 1: runs[algo] = (key, procs, value)
+                    return value
+                if sweep:
+                    qkey = hashlib.blake2b(str(quanta).encode(), digest_size=8).hexdigest()
+                    work, total = lambda progress: ('SWEEP', (run('RR-SWEEP' + ctag, lambda: quantum_sweep(procs, quanta, *costs, telemetry=job_tel, progress=progress), qkey), objective)), None
+                elif audit:
+                    cost = dict(switch_cost=switch_cost, warmup=warmup) if ctag else {}
+                    jobs = {name: (cls, dict(cls.tune(quantum), **(cost if cls.costed() else {}))) for name, cls in available(Registry.COLUMNS).items()}
+                    def work(progress):
+                        results = {}
+                        for name, (cls, p) in jobs.items():
+                            results[name] = simulate(cls, p, progress)
+                            progress.advance(len(procs))
+                        return 'AUDIT', results
+                    total = len(procs) * len(jobs)
+                else:
+                    k, queues = (cores, 'global' if queue_model.startswith('Global') else 'per-core') if smp_capable and cores > 1 else (1, 'global')
+                    work, total = lambda progress: (sched.name, simulate(sched, params, progress, k, queues)), len(procs)
+                label = 'Quantum sweep' if sweep else 'Benchmark audit' if audit else sched.name
+                job = job_runner().submit(lambda progress: (work(progress), runs), total=total, label=label)
+                st.session_state.job = (job, job_tel)
+
+    job = st.session_state.get('job')
+    if job and job[0].finished:
+        # Collect the finished run; results only change here, on the script thread
+        job, tel = job
+        st.session_state.job = None
+        if job.status == 'done':
+            st.session_state.results, runs = job.result()
+            st.session_state.runs.update(runs)
+        elif job.status == 'cancelled': st.warning("Simulation cancelled.")
+        else: st.error(f"Simulation failed: {job.error}")
+    elif job:
+        job_monitor(job[0])
+    
+    st.divider()
+
+    if st.session_state.results:
+        rtype, rdata = st.session_state.results
+        
+        if rtype == 'AUDIT':
+            t1, t2 = st.tabs(["Performance Comparison", "Strategy Recommendation"])
+            # One summary per engine; the chart, the table and the recommendation all read from these
+            with span(tel, 'summarize', runs=len(rdata)):
+                summary = pd.DataFrame([summarize(r.final, r.timeline) for r in rdata.values()], index=list(rdata))
+            
+            with t1, span(tel, 'render.chart'):
+                shown = {'avg_wait': 'Avg Wait', 'p95_wait': 'P95 Wait', 'avg_tat': 'Avg Turnaround', 'p95_tat': 'P95 Turnaround'}
+                comp_df = summary[list(shown)].rename(columns=shown).rename_axis('Algorithm').reset_index().melt('Algorithm', var_name='Metric', value_name='Value')
+                fig = px.bar(comp_df, x='Algorithm', y='Value', color='Metric', barmode='group', 
+                             template="plotly_dark", color_discrete_sequence=['#6366f1', '#a855f7', '#22d3ee', '#10b981'])
+                fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', 
+                                  font_family='Space Grotesk', margin=dict(l=0,r=0,t=20,b=0))
+                st.plotly_chart(fig, use_container_width=True)
+                st.dataframe(summary[['avg_wait', 'p50_wait', 'p95_wait', 'p99_wait', 'avg_tat', 'p99_tat', 'avg_response', 'p99_response', 'throughput', 'cpu_util', 'switches', 'overhead']],
+                             use_container_width=True)
+            
+            with t2:
+                best = (summary['avg_wait'].idxmin(), summary['avg_wait'].min())
+                st.markdown(f"""
+                <div style="background:rgba(16,185,129,0.1); border-left:4px solid #10b981; padding:20px; border-radius:12px;">
+                    <h3 style="color:#10b981; margin:0;">AUDIT WINNER: {best[0]}</h3>
+                    <p style="color:var(--text-2); margin-top:10px;">Optimal latency achieved with <b>{best[1]:.2f} units</b> average wait time (p99 {summary.loc[best[0], 'p99_wait']:.2f}).</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        elif rtype == 'SWEEP':
+            sweep_df, objective = rdata
+            with span(tel, 'render.chart', quanta=len(sweep_df)):
+                best = best_quantum(sweep_df, objective)
+                row = sweep_df[sweep_df['quantum'] == best].iloc[0]
+                fig = go.Figure([go.Scatter(x=sweep_df['quantum'], y=sweep_df[c], name=label, mode='lines', line_color=color)
+                                 for c, label, color in ((objective, objective.upper(), '#6366f1'), ('avg_tat', 'AVG_TAT', '#22d3ee'))]
+                                + [go.Scatter(x=sweep_df['quantum'], y=sweep_df['switches'], name='CONTEXT_SWITCHES', mode='lines',
+                                              line=dict(color='#a855f7', dash='dot'), yaxis='y2')])
+                fig.add_vline(x=best, line_color='#10b981', line_dash='dash')
+                fig.update_layout(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font_family='Space Grotesk',
+                                  margin=dict(l=0, r=0, t=20, b=0), xaxis_title="Quantum (T)", yaxis2=dict(overlaying='y', side='right', showgrid=False))
+                st.plotly_chart(fig, use_container_width=True)
+            st.markdown(f"""
+            <div style="background:rgba(16,185,129,0.1); border-left:4px solid #10b981; padding:20px; border-radius:12px;">
+                <h3 style="color:#10b981; margin:0;">OPTIMAL QUANTUM: {best}</h3>
+                <p style="color:var(--text-2); margin-top:10px;"><b>{row[objective]:.2f}</b> {objective} with {row['switches']:.0f} context switches
+                over {len(sweep_df)} candidates.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        else:
+            final_p, exec_o, core_util = rdata
+            
+            with span(tel, 'summarize', processes=len(final_p)):
+                m = summarize(final_p, exec_o, 1 if core_util is None else len(core_util))
+            
+            # KPI Strip
+            m1, m2, m3 = st.columns(3)
+            m1.metric("AVG_WAIT_TIME", f"{m['avg_wait']:.2f}")
+            m2.metric("AVG_TAT", f"{m['avg_tat']:.2f}")
+            m3.metric("CPU_UTILIZATION", f"{m['cpu_util']:.1f}%")
+            m4, m5, m6, m7 = st.columns(4)
+            m4.metric("P95_WAIT", f"{m['p95_wait']:.2f}")
+            m5.metric("P99_WAIT", f"{m['p99_wait']:.2f}")
+            m6.metric("AVG_RESPONSE", f"{m['avg_response']:.2f}")
+            lost = m['overhead'] / m['makespan'] * 100 if m['makespan'] else 0.0
+            m7.metric("CTX_SWITCHES", f"{m['switches']:,}", f"-{lost:.1f}% CPU overhead" if m['overhead'] else None)
+            
+            # GANTT CHART
+            st.markdown('<div style="margin-top:2rem;"></div>', unsafe_allow_html=True)
+            with span(tel, 'render.gantt', slices=len(exec_o)):
+                st.plotly_chart(render_gantt(exec_o, "Visual Execution Sequence (Gantt Chart)" if core_util is None else "Per-Core Execution Timeline", lanes=core_util is not None), use_container_width=True)
+            if core_util is not None:
+                fig_u = px.bar(x=[f"CORE_{c + 1:02d}" for c in range(len(core_util))], y=core_util, template="plotly_dark",
+                               labels={'x': '', 'y': 'Utilization %'}, color_discrete_sequence=['#22d3ee'])
+                fig_u.update_layout(height=250, margin=dict(l=0, r=0, t=20, b=0), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+                st.plotly_chart(fig_u, use_container_width=True)
+
+            # DEEP METRICS
+            with st.expander("DEEP_KERNEL_METRIC_REPORT"):
+                with span(tel, 'render.table'): paged_dataframe(final_p, 'metrics_page')
+                x1, x2, x3 = st.columns([1, 1, 1])
+                res_fmt = x1.selectbox("Export format", [f for f in EXPORT_FORMATS if f != 'Binary Trace'], key='results_fmt')
+                ext, mime = EXPORT_FORMATS[res_fmt]
+                x2.download_button("📤 PROCESS METRICS", lambda: export_bytes(final_p, ext), file_name=f"{rtype.lower()}_metrics.{ext}", mime=mime)
+                x3.download_button("📤 EXECUTION ORDER", lambda: export_bytes(exec_o, ext), file_name=f"{rtype.lower()}_timeline.{ext}", mime=mime)
+                if isinstance(exec_o, CompactTimeline) and len(exec_o):
+                    # Time-range query: only the timeline blocks around the window are decoded
+                    w1, w2 = st.columns(2)
+                    end = float(m['makespan'])
+                    t0 = w1.number_input("Slice window start (T)", min_value=0.0, max_value=end, value=0.0, key='window_t0')
+                    t1 = w2.number_input("Slice window end (T)", min_value=0.0, max_value=end, value=min(end, 100.0), key='window_t1')
+                    with span(tel, 'render.window'): paged_dataframe(exec_o.window(t0, t1), 'window_page')
+
+    else:
+        st.markdown('<p style="color:var(--text-2); border:1px dashed var(--border); padding:40px; text-align:center; border-radius:20px;">Ready for simulation. Ignite engine to visualize data.</p>', unsafe_allow_html=True)
+
+    # ENGINE TELEMETRY (kept from the last instrumented run, shown while the toggle is on)
+    if tel is not None: st.session_state.telemetry = tel
+    if telemetry_on and st.session_state.get('telemetry'): render_telemetry(st.session_state.telemetry)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Footer
+st.markdown(f"""
+<div style="text-align: center; margin-top: 5rem; padding: 3rem; color: #475569; border-top: 1px solid var(--border);">
+    <div style="display: flex; justify-content: center; gap: 40px; margin-bottom: 1.5rem;">
+        <div style="font-weight: 700; color: #64748b;">LATEST REVISION: FEB 2026</div>
+        <div style="color: #64748b;">INTEGRATED SCHEDULING SYSTEM</div>
+        <div style="color: #64748b;">PLATINUM LICENSE: 0x48291A</div>
+    </div>
+    <div style="font-family: 'IBM Plex Mono', monospace; font-size: 0.7rem; letter-spacing: 0.2em; opacity: 0.5;">
+        CORE_KERNEL_LOADED // ALL_SYSTEMS_OPTIMAL // STABLE_READY
+    </div>
+</div>
+""", unsafe_allow_html=True)
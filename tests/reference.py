@@ -0,0 +1,99 @@
+"""Reference engines: the original list-scanning FCFS, SJF and RR from the first streamlit_app.py, kept verbatim.
+
+They are quadratic and only meant for small randomized workloads, as the ground truth the optimized engines in
+cpu_sched must reproduce slice for slice. Helpers for seeded workloads and timeline invariants live here too.
+"""
+
+import random
+
+import numpy as np
+
+
+def fcfs(processes):
+    ready = sorted([p.copy() for p in processes], key=lambda x: x['arrival_time'])
+    current_time, execution_order = 0, []
+    for p in ready:
+        if current_time < p['arrival_time']: current_time = p['arrival_time']
+        start = current_time
+        comp = start + p['burst_time']
+        p.update({'start_time': start, 'completion_time': comp, 'turnaround_time': comp - p['arrival_time'], 'waiting_time': (comp - p['arrival_time']) - p['burst_time']})
+        execution_order.append(p.copy())
+        current_time = comp
+    return ready, execution_order
+
+
+def sjf(processes):
+    current_time, completed, execution_order = 0, [], []
+    remaining = [p.copy() for p in processes]
+    while remaining:
+        arrived = [p for p in remaining if p['arrival_time'] <= current_time]
+        if not arrived:
+            current_time = min(p['arrival_time'] for p in remaining)
+            continue
+        p = min(arrived, key=lambda x: x['burst_time'])
+        remaining.remove(p)
+        start = current_time
+        comp = start + p['burst_time']
+        p.update({'start_time': start, 'completion_time': comp, 'turnaround_time': comp - p['arrival_time'], 'waiting_time': (comp - p['arrival_time']) - p['burst_time']})
+        execution_order.append(p.copy())
+        current_time = comp
+        completed.append(p)
+    return completed, execution_order
+
+
+def rr(processes, quantum):
+    proc_list = [{'id': p['id'], 'arrival_time': p['arrival_time'], 'burst_time': p['burst_time'], 'rem': p['burst_time'], 'first_start': None, 'comp': None} for p in processes]
+    current_time, queue, completed, execution_order = 0, [], [], []
+    while len(completed) < len(proc_list):
+        for p in proc_list:
+            if p not in queue and p not in completed and p['arrival_time'] <= current_time: queue.append(p)
+        if not queue:
+            future = [p for p in proc_list if p not in completed]
+            if future: current_time = min(p['arrival_time'] for p in future); continue
+        p = queue.pop(0)
+        if p['first_start'] is None: p['first_start'] = current_time
+        exec_t = min(quantum, p['rem'])
+        start = current_time
+        current_time += exec_t
+        p['rem'] -= exec_t
+        execution_order.append({'id': p['id'], 'start_time': start, 'completion_time': current_time})
+        for next_p in proc_list:
+            if next_p not in queue and next_p not in completed and next_p['arrival_time'] <= current_time and next_p != p: queue.append(next_p)
+        if p['rem'] == 0: p['comp'] = current_time; completed.append(p)
+        else: queue.append(p)
+
+    final_procs = []
+    for p in proc_list:
+        tat = p['comp'] - p['arrival_time']
+        final_procs.append({'id': p['id'], 'arrival_time': p['arrival_time'], 'burst_time': p['burst_time'], 'start_time': p['first_start'], 'completion_time': p['comp'], 'turnaround_time': tat, 'waiting_time': tat - p['burst_time']})
+    return final_procs, execution_order
+
+
+def random_workload(seed, n=None, span=None, max_burst=9, priorities=None):
+    # Small registry of process dicts in registry order (not sorted by arrival); tight arrivals force ties and overlap
+    rng = random.Random(seed)
+    n = rng.randint(1, 30) if n is None else n
+    span = rng.choice([0, 5, 20, 60]) if span is None else span
+    procs = [{'id': i + 1, 'arrival_time': rng.randint(0, span), 'burst_time': rng.randint(1, max_burst)} for i in range(n)]
+    if priorities:
+        for p in procs: p['priority'] = rng.randint(0, priorities - 1)
+    return procs
+
+
+def project(records, keys):
+    return [{k: r[k] for k in keys} for r in records]
+
+
+def check_timeline(final, timeline):
+    # Invariants of any single-core schedule: slices never overlap, no process runs before it arrives, each process
+    # gets exactly its burst of CPU, and its first / last slices match its start / completion times
+    start, end, ids = timeline.start_time, timeline.completion_time, timeline.id
+    over = getattr(timeline, 'overhead', None)
+    assert np.all(end >= start)
+    assert np.all(start[1:] >= end[:-1]), "slices overlap"
+    work = np.ones(len(ids), dtype=bool) if over is None else over == 0
+    for k, pid in enumerate(final.id.tolist()):
+        mine = (ids == pid) & work
+        assert (end[mine] - start[mine]).sum() == final.burst_time[k]
+        assert start[mine].min() == final.start_time[k] >= final.arrival_time[k]
+        assert end[mine].max() == final.completion_time[k]
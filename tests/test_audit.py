@@ -0,0 +1,42 @@
+"""audit_batch: importable and runnable without Streamlit, parallel results equal to serial ones."""
+
+import subprocess
+import sys
+
+import pytest
+
+from cpu_sched import ResultCache, audit_batch, generate
+from reference import random_workload
+
+
+def test_audit_imports_headless():
+    # With streamlit unimportable, the audit module (and its pool workers, which import it) must still load
+    code = "import sys; sys.modules['streamlit'] = None; from cpu_sched.audit import audit_batch; print('ok')"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'ok'
+
+
+def test_audit_pool_matches_serial():
+    workloads = [random_workload(seed, n=25) for seed in range(6)] + [generate(300, seed=1)]
+    serial = audit_batch(workloads, quanta=(1, 4), workers=1)
+    pooled = audit_batch(workloads, quanta=(1, 4), workers=2, chunksize=3)
+    assert serial.equals(pooled)
+    # One row per (workload, algorithm, quantum); quantum-free engines run once per workload
+    per_workload = serial.groupby('workload').size()
+    assert (per_workload == per_workload.iloc[0]).all()
+    assert set(serial.loc[serial.algorithm == 'RR', 'quantum']) == {1, 4}
+    assert serial.loc[serial.algorithm == 'FCFS', 'quantum'].isna().all()
+
+
+def test_audit_cache_reuses_rows():
+    cache = ResultCache()
+    workloads = [random_workload(seed, n=20) for seed in range(3)]
+    first = audit_batch(workloads, algorithms=['FCFS', 'RR'], workers=1, cache=cache)
+    hits = cache.hits
+    again = audit_batch(workloads, algorithms=['FCFS', 'RR'], workers=1, cache=cache)
+    assert first.equals(again) and cache.hits > hits
+
+
+def test_audit_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        audit_batch([random_workload(0)], algorithms=['NOPE'], workers=1)
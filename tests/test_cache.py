@@ -0,0 +1,34 @@
+"""ResultCache: LRU behaviour, the disk tier and hit / miss accounting under concurrent use."""
+
+import threading
+
+from cpu_sched import CPUCore, ResultCache, generate
+
+
+def test_lru_evicts_oldest():
+    cache = ResultCache(maxsize=2)
+    for k in 'abc': cache.put(k, k.upper())
+    assert cache.get('a') is None and cache.get('b') == 'B' and cache.get('c') == 'C'
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    table = generate(500, seed=1)
+    first = ResultCache(directory=tmp_path)
+    value = first.get_or_compute(table, 'RR', 3, lambda: CPUCore.rr(table, 3)[0])
+    second = ResultCache(directory=tmp_path)
+    again = second.get_or_compute(table, 'RR', 3, lambda: 1 / 0)
+    assert (second.hits, second.misses) == (1, 0)
+    assert (again.completion_time == value.completion_time).all()
+
+
+def test_counters_are_exact_under_threads(tmp_path):
+    cache = ResultCache(maxsize=4, directory=tmp_path)
+    for k in range(8): cache.put(f'k{k}', k)
+    per_thread, threads = 2000, 8
+    def hammer(seed):
+        for i in range(per_thread): cache.get(f'k{(seed + i) % 12}')
+    workers = [threading.Thread(target=hammer, args=(s,)) for s in range(threads)]
+    for w in workers: w.start()
+    for w in workers: w.join()
+    assert cache.hits + cache.misses == per_thread * threads
@@ -0,0 +1,140 @@
+"""cpu-sched command line: every algorithm through `run`, the file format flags, the other subcommands and error exits."""
+
+import json
+import re
+
+import pytest
+
+from cpu_sched import SCHEDULERS, ProcessTable, best_quantum, summarize
+from cpu_sched.cli import main
+from cpu_sched.io import read_frame, read_workload, write_table
+from reference import random_workload
+
+
+@pytest.fixture
+def workload(tmp_path):
+    path = tmp_path / 'w.csv'
+    write_table(ProcessTable.from_records(random_workload(3, n=40)), str(path))
+    return path
+
+
+def fields(line):
+    return dict(re.findall(r'(\w+)=([\d.]+)', line))
+
+
+def cli(capsys, *argv):
+    code = main([str(a) for a in argv])
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+@pytest.mark.parametrize('name', list(SCHEDULERS))
+def test_run_every_algorithm(capsys, workload, name):
+    code, out, err = cli(capsys, 'run', workload, '-a', name.lower(), '-q', 3)
+    assert code == 0 and not err and out.startswith(f'{name}: 40 processes')
+    cls = SCHEDULERS[name]
+    final, timeline, _ = cls.run(read_workload(str(workload)), **cls.tune(3))
+    m = summarize(final, timeline)
+    got = fields(out)
+    assert float(got['avg_wait']) == pytest.approx(m['avg_wait'], abs=1e-3) and int(got['makespan']) == m['makespan']
+    assert int(got['switches']) == m['switches']
+
+
+def test_run_mlfq_options(capsys, workload):
+    code, out, _ = cli(capsys, 'run', workload, '-a', 'MLFQ', '--quanta', '1,2', '--boost', 20)
+    final, timeline, _ = SCHEDULERS['MLFQ'].run(read_workload(str(workload)), quanta=(1, 2), boost=20)
+    assert code == 0 and int(fields(out)['switches']) == summarize(final, timeline)['switches']
+
+
+def test_run_costs_and_cores(capsys, workload):
+    code, out, _ = cli(capsys, 'run', workload, '-a', 'RR', '--switch-cost', 1, '--warmup', 0.5)
+    assert code == 0 and float(fields(out)['overhead']) > 0
+    code, out, _ = cli(capsys, 'run', workload, '-a', 'RR', '-c', 2, '--queues', 'per-core')
+    assert code == 0 and out.startswith('RR: 40 processes')
+
+
+@pytest.mark.parametrize('ext', ['csv', 'jsonl', 'trace', 'parquet'])
+def test_run_writes_metrics_and_timeline(capsys, tmp_path, workload, ext):
+    if ext == 'parquet': pytest.importorskip('pyarrow')
+    metrics, timeline = tmp_path / f'm.{ext}', tmp_path / f't.{ext}'
+    code, _, _ = cli(capsys, 'run', workload, '-a', 'SJF', '-m', metrics, '-t', timeline)
+    assert code == 0
+    final = SCHEDULERS['SJF'].run(read_workload(str(workload))).final
+    if ext == 'trace':
+        assert read_workload(str(metrics)).id.tolist() == final.id.tolist()
+    else:
+        frame = read_frame(str(metrics))
+        assert frame['completion_time'].tolist() == final.completion_time.tolist()
+        assert len(read_frame(str(timeline))) == 40
+
+
+@pytest.mark.parametrize('fmt', ['json', 'otlp'])
+def test_run_telemetry(capsys, tmp_path, workload, fmt):
+    path = tmp_path / 'tel.json'
+    code, _, _ = cli(capsys, 'run', workload, '-a', 'RR', '--telemetry', path, '--telemetry-format', fmt, '--trace-memory')
+    doc = json.loads(path.read_text())
+    assert code == 0
+    if fmt == 'json':
+        assert [s['name'] for s in doc['spans']] == ['load', 'engine.RR', 'write'] and doc['spans'][0]['attributes']['processes'] == 40
+        assert all(s['peak_mb'] is not None for s in doc['spans'])
+    else:
+        assert [s['name'] for s in doc['resourceSpans'][0]['scopeSpans'][0]['spans']] == ['load', 'engine.RR', 'write']
+
+
+@pytest.mark.parametrize('target', ['w.jsonl', 'w.trace'])
+def test_convert_round_trips(capsys, tmp_path, workload, target):
+    code, out, _ = cli(capsys, 'convert', workload, tmp_path / target)
+    assert code == 0 and out.startswith('wrote 40 processes')
+    back = read_workload(str(tmp_path / target))
+    assert back.arrival_time.tolist() == read_workload(str(workload)).arrival_time.tolist()
+
+
+def test_generate(capsys, tmp_path):
+    path = tmp_path / 'g.csv'
+    code, out, _ = cli(capsys, 'generate', path, '-n', '1.5e3', '--burst', 'pareto', '--priorities', '0:1,5:3', '--seed', 2, '--chunk', 400)
+    table = read_workload(str(path))
+    assert code == 0 and out.strip() == f'wrote 1500 processes to {path}'
+    assert len(table) == 1500 and set(table.priority.tolist()) <= {0, 5}
+
+
+def test_sweep(capsys, tmp_path, workload):
+    out_path = tmp_path / 'sweep.csv'
+    code, out, _ = cli(capsys, 'sweep', workload, '-q', '1:6', '--objective', 'p99_wait', '-w', 1, '-o', out_path)
+    frame = read_frame(str(out_path))
+    assert code == 0 and out.startswith('RR sweep over 6 quanta: best quantum=')
+    best = int(fields(out)['quantum'])
+    assert frame['quantum'].tolist() == list(range(1, 7)) and best_quantum(frame, 'p99_wait') == best
+
+
+def test_bench_and_compare(capsys, tmp_path):
+    base, slow = tmp_path / 'base.json', tmp_path / 'slow.json'
+    code, out, _ = cli(capsys, 'bench', '-o', base, '--sizes', 50, '--engines', 'FCFS,RR', '--workloads', 'uniform', '--repeat', 1, '--no-memory')
+    assert code == 0 and out.splitlines()[-1] == f'wrote 2 results to {base}'
+    assert cli(capsys, 'bench-compare', base, base)[:2] == (0, 'no regressions\n')
+    report = json.loads(base.read_text())
+    for r in report['results']: r['wall_s'] = max(r['wall_s'], 0.01) * 3
+    slow.write_text(json.dumps(report))
+    code, out, _ = cli(capsys, 'bench-compare', base, slow)
+    assert code == 1 and out.count('REGRESSION') == 2
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['run', 'missing.csv'], 'No such file'),
+    (['run', 'w.xlsx'], 'Unsupported workload format'),
+    (['run', '{w}', '-a', 'FCFS', '--switch-cost', '1'], 'Context-switch costs apply to'),
+    (['run', '{w}', '-a', 'SRTF', '-c', '2'], 'no multi-core variant'),
+    (['sweep', '{w}', '-q', '0:3'], 'Quanta must be positive'),
+    (['sweep', '{w}', '-w', '1', '--objective', 'nope'], "Unknown objective 'nope'"),
+    (['bench', '--engines', 'NOPE'], 'Unknown engine/workload: NOPE'),
+])
+def test_errors_exit_1(capsys, monkeypatch, tmp_path, workload, argv, message):
+    monkeypatch.chdir(tmp_path)
+    code, out, err = cli(capsys, *(a.format(w=workload) for a in argv))
+    assert code == 1 and not out and err.startswith('cpu-sched: error: ') and message in err
+
+
+def test_usage_errors_exit_2(capsys):
+    for argv in ([], ['run'], ['run', 'w.csv', '-a', 'nope']):
+        with pytest.raises(SystemExit) as exc: main(argv)
+        assert exc.value.code == 2
+    assert 'usage: cpu-sched' in capsys.readouterr().err
@@ -0,0 +1,47 @@
+"""Context-switch costs on the preemptive engines: overhead charged inside a preempted dispatch, and start times."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, ProcessTable
+from reference import random_workload
+
+COSTED = {'SRTF': {}, 'PRIORITY-P': {}, 'MLFQ': {'quanta': (1, 2, 4)}}
+
+
+def test_arrival_inside_overhead_preempts_before_work():
+    # P2 arrives during P1's switch-in and outranks it: P1 pays the overhead but first runs at t=9
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 10}, {'id': 2, 'arrival_time': 1, 'burst_time': 3}]
+    final, timeline = SCHEDULERS['SRTF'].run(procs, switch_cost=2)[:2]
+    assert timeline.decode().to_records() == [
+        {'id': 1, 'start_time': 0, 'completion_time': 2, 'overhead': 1}, {'id': 2, 'start_time': 2, 'completion_time': 4, 'overhead': 1},
+        {'id': 2, 'start_time': 4, 'completion_time': 7, 'overhead': 0}, {'id': 1, 'start_time': 7, 'completion_time': 9, 'overhead': 1},
+        {'id': 1, 'start_time': 9, 'completion_time': 19, 'overhead': 0}]
+    assert final.start_time.tolist() == [9, 4]
+
+
+def test_non_preempting_arrival_inside_overhead_keeps_one_slice():
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 3}, {'id': 2, 'arrival_time': 1, 'burst_time': 9}]
+    final, timeline = SCHEDULERS['SRTF'].run(procs, switch_cost=2)[:2]
+    work = timeline.decode().take(timeline.decode().overhead == 0)
+    assert work.to_records()[0] == {'id': 1, 'start_time': 2, 'completion_time': 5, 'overhead': 0}
+
+
+@pytest.mark.parametrize('seed', range(120))
+@pytest.mark.parametrize('name', list(COSTED))
+def test_no_empty_work_slices(seed, name):
+    table = ProcessTable.from_records(random_workload(seed, priorities=5))
+    final, timeline = SCHEDULERS[name].run(table, switch_cost=2, warmup=1, **COSTED[name])[:2]
+    slices = timeline.decode()
+    work = slices.take(slices.overhead == 0)
+    assert (work.completion_time > work.start_time).all()
+    # start_time is the first work slice, never an overhead slice that was preempted before any work ran
+    first = {}
+    for pid, start in zip(work.id.tolist(), work.start_time.tolist()): first.setdefault(pid, start)
+    assert dict(zip(final.id.tolist(), final.start_time.tolist())) == first
+
+
+def test_smp_rejects_costs():
+    procs = ProcessTable.from_records(random_workload(0))
+    with pytest.raises(ValueError): SCHEDULERS['RR'].run(procs, cores=2, switch_cost=1)
+    with pytest.raises(ValueError): SCHEDULERS['RR'].run(procs, cores=2, warmup=1)
@@ -0,0 +1,72 @@
+"""gantt_plan: coalesced bars under the budget, occupancy bands over it, overhead bands and SMP lanes."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, CPUCore, SliceTable, generate
+from cpu_sched.gantt import GANTT_MAX_ROWS, coalesce, gantt_plan, occupancy, timeline_columns
+
+
+def busy_time(timeline):
+    runs = timeline.runs() if hasattr(timeline, 'runs') else timeline
+    work = runs if getattr(runs, 'overhead', None) is None else runs.take(runs.overhead == 0)
+    return (work.completion_time - work.start_time).sum()
+
+
+def test_timeline_columns_accepts_every_form():
+    table = SliceTable([1, 2], [0, 3], [3, 5])
+    records = table.to_records()
+    legacy = [{'id': 1, 'burst_time': 3, 'completion_time': 3}, {'id': 2, 'burst_time': 2, 'completion_time': 5}]
+    for form in (table, records, legacy):
+        ids, start, end, core = timeline_columns(form)
+        assert ids.tolist() == [1, 2] and start.tolist() == [0, 3] and end.tolist() == [3, 5] and core is None
+    assert len(timeline_columns([])[0]) == 0
+
+
+def test_coalesce_merges_back_to_back_slices_only():
+    ids, start, end, _ = coalesce(np.array([1, 1, 2, 1, 1]), np.array([0, 2, 4, 6, 9]), np.array([2, 4, 6, 8, 10]))
+    assert ids.tolist() == [1, 2, 1, 1] and start.tolist() == [0, 4, 6, 9] and end.tolist() == [4, 6, 8, 10]
+
+
+def test_bars_cover_the_schedule():
+    final, timeline = SCHEDULERS['RR'].run(generate(40, seed=3), quantum=2)[:2]
+    plan = gantt_plan(timeline)
+    assert plan.mode == 'bars' and plan.overhead is None
+    assert sorted(b.id for b in plan.bars) == sorted(final.id.tolist())
+    assert sum(b.duration.sum() for b in plan.bars) == busy_time(timeline)
+    for b in plan.bars: assert (b.row == b.id).all()
+
+
+def test_overhead_gets_its_own_band():
+    final, timeline = SCHEDULERS['RR'].run(generate(40, seed=3), quantum=2, switch_cost=1)[:2]
+    plan = gantt_plan(timeline)
+    assert plan.overhead.duration.sum() == final.switches.sum()
+    bands = gantt_plan(timeline, budget=10)
+    assert bands.rows[-1] == 'SWITCH'
+
+
+@pytest.mark.parametrize('n', [30, 300])
+def test_bands_over_budget(n):
+    final, timeline = CPUCore.rr(generate(n, load=0.7, seed=1), 1)
+    plan = gantt_plan(timeline, budget=50, bins=200)
+    assert plan.mode == 'bands' and plan.bars is None
+    assert len(plan.rows) == min(n, GANTT_MAX_ROWS) and plan.occupancy.shape == (len(plan.rows), 200)
+    # Single core: occupancy integrates back to the busy time, and no instant is more than fully busy
+    assert (plan.occupancy * np.diff(plan.edges)).sum() == pytest.approx(busy_time(timeline))
+    assert plan.occupancy.sum(axis=0).max() <= 1 + 1e-9
+
+
+@pytest.mark.parametrize('lanes', [False, True])
+def test_smp_occupancy_is_a_fraction(lanes):
+    result = SCHEDULERS['RR'].run(generate(3000, load=3.5, seed=1), cores=4, quantum=2)
+    plan = gantt_plan(result.timeline, lanes=lanes)
+    assert plan.mode == 'bands' and 0 <= plan.occupancy.min() and plan.occupancy.max() <= 1 + 1e-9
+    if lanes:
+        assert plan.rows == ['CORE_01', 'CORE_02', 'CORE_03', 'CORE_04']
+        assert (plan.occupancy * np.diff(plan.edges)).sum() == pytest.approx(busy_time(result.timeline))
+
+
+def test_occupancy_counts_overlap_once():
+    # Two slices of one row overlapping on [2, 4) cover [0, 6) exactly once
+    edges, occ = occupancy(np.array([0, 0]), np.array([0.0, 2.0]), np.array([4.0, 6.0]), 1, 3)
+    assert occ.tolist() == [[1.0, 1.0, 1.0]]
@@ -0,0 +1,86 @@
+"""extend_schedule against a full run of the grown workload, for every single-core scheduler and cost setting."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, CompactTimeline, ProcessTable, Telemetry, extend_schedule, generate
+from cpu_sched import incremental
+from cpu_sched.incremental import checkpoints, resume_point
+
+PARAMS = {'FCFS': [{}], 'SJF': [{}], 'SRTF': [{}, {'switch_cost': 1, 'warmup': 2}, {'switch_cost': 0.5}],
+          'RR': [{'quantum': 1}, {'quantum': 3, 'switch_cost': 1, 'warmup': 1}, {'quantum': 2, 'switch_cost': 0.5}],
+          'MLFQ': [{}, {'boost': 7}, {'quanta': (1, 3), 'boost': 5, 'switch_cost': 1, 'warmup': 0.5}],
+          'PRIORITY': [{}, {'aging': 3}], 'PRIORITY-P': [{}, {'aging': 2, 'switch_cost': 1}, {'warmup': 1.5}]}
+CASES = [(name, p) for name, plist in PARAMS.items() for p in plist]
+
+
+def assert_same(a, b):
+    decode = lambda t: t.decode() if isinstance(t, CompactTimeline) else t
+    for x, y in ((a.final, b.final), (decode(a.timeline), decode(b.timeline))):
+        assert x.columns == y.columns
+        for c in x.columns:
+            u, v = getattr(x, c), getattr(y, c)
+            assert u.dtype == v.dtype and np.array_equal(u, v), c
+
+
+def appended(trial):
+    # A workload and the same workload with a few rows appended: scattered, late, or all at one existing arrival
+    rng = np.random.default_rng(trial)
+    n, k = int(rng.integers(1, 40)), int(rng.integers(1, 6))
+    old = generate(n, mean_burst=4, load=[0.3, 0.8, 1.5][trial % 3], priorities=range(5), seed=trial)
+    span = int(old.arrival_time.max()) + 30
+    arrival = [rng.integers(0, span, k), rng.integers(span - 30, span + 20, k), np.full(k, int(rng.choice(old.arrival_time)))][trial % 3 if trial % 4 else 0]
+    new = ProcessTable(np.arange(n + 1, n + k + 1), np.sort(arrival) if trial % 2 else arrival, rng.integers(1, 9, k), priority=rng.integers(0, 5, k))
+    return old, ProcessTable.concat([old, new])
+
+
+@pytest.mark.parametrize('trial', range(60))
+@pytest.mark.parametrize('name, params', CASES, ids=[f'{n}-{i}' for n, plist in PARAMS.items() for i in range(len(plist))])
+def test_extend_matches_full_run(monkeypatch, trial, name, params):
+    # Splice whatever the suffix length, so every case goes through the resume path
+    monkeypatch.setattr(incremental, 'RESUME_MAX_FRACTION', 1.0)
+    cls = SCHEDULERS[name]
+    old, grown = appended(trial)
+    assert_same(extend_schedule(cls, old, cls.run(old, **params), grown, **params), cls.run(grown, **params))
+
+
+def test_edits_fall_back_to_full_run_and_no_change_is_free():
+    cls = SCHEDULERS['RR']
+    old = generate(30, priorities=range(5), seed=2)
+    edited = ProcessTable(old.id, old.arrival_time, old.burst_time + 1, priority=old.priority)
+    previous = cls.run(old)
+    assert_same(extend_schedule(cls, old, previous, edited), cls.run(edited))
+    assert extend_schedule(cls, old, previous, old) is previous
+
+
+def test_long_suffix_falls_back_to_full_run():
+    # Overloaded, so the only checkpoint is the first arrival: a late append would re-simulate everything
+    cls, tel = SCHEDULERS['RR'], Telemetry()
+    old = generate(300, load=1.5, seed=3)
+    late = ProcessTable.concat([old, ProcessTable([301], [old.arrival_time.max()], [4])])
+    assert_same(extend_schedule(cls, old, cls.run(old), late, telemetry=tel), cls.run(late))
+    (attrs,) = tel.find('resume.RR')
+    assert attrs['fallback'] == 'suffix' and attrs['resimulated'] == 301 and tel.find('engine.RR')[0]['processes'] == 301
+
+
+def test_resume_span_reports_resimulated_suffix():
+    # Light load, new arrivals after the old ones: only the appended rows are re-simulated
+    cls, tel = SCHEDULERS['RR'], Telemetry()
+    old = generate(200, load=0.3, seed=1)
+    grown = ProcessTable.concat([old, ProcessTable([201, 202], [old.arrival_time.max() + 50] * 2, [3, 1])])
+    assert_same(extend_schedule(cls, old, cls.run(old), grown, telemetry=tel), cls.run(grown))
+    (attrs,) = tel.find('resume.RR')
+    assert 'fallback' not in attrs and attrs['resimulated'] == 2 and attrs['resumed_at'] == old.arrival_time.max() + 50
+    extend_schedule(cls, grown, cls.run(grown, cores=2), grown, telemetry=tel)
+    extend_schedule(cls, old, cls.run(old), grown.take(slice(1, None)), telemetry=tel)
+    assert [a.get('fallback') for a in tel.find('resume.')] == [None, 'multi-core', 'edited']
+
+
+def test_resume_point_is_a_checkpoint():
+    final = SCHEDULERS['RR'].run(generate(200, load=0.7, seed=5)).final
+    marks = checkpoints(final)
+    for t in (marks[len(marks) // 2] + 1, final.arrival_time.max() + 1):
+        at = resume_point(final, t)
+        assert at <= t
+        done_before = final.completion_time[final.arrival_time < at]
+        assert (done_before <= at).all()
@@ -0,0 +1,86 @@
+"""Workload files: binary trace round trips and validation, file-object uploads, and chunked write_workload output."""
+
+import builtins
+import io
+
+import numpy as np
+import pytest
+
+from cpu_sched import ProcessTable, generate, write_workload
+from cpu_sched.io import TRACE_HEADER, read_trace, read_workload, write_table, write_trace
+
+
+def assert_same(a, b):
+    for c in ('id', 'arrival_time', 'burst_time', 'priority'):
+        x, y = getattr(a, c), getattr(b, c)
+        assert (x is None) == (y is None), c
+        if x is not None: assert np.array_equal(x, y), c
+
+
+@pytest.mark.parametrize('dtype', [np.int64, np.int32, np.uint16])
+@pytest.mark.parametrize('priority', [False, True])
+def test_trace_round_trip(tmp_path, dtype, priority):
+    table = generate(1000, priorities=range(5) if priority else None, seed=2)
+    table = ProcessTable(table.id.astype(dtype), table.arrival_time.astype(dtype), table.burst_time.astype(dtype),
+                         priority=None if table.priority is None else table.priority.astype(dtype))
+    write_trace(table, tmp_path / 'w.trace')
+    back = read_trace(str(tmp_path / 'w.trace'))
+    assert_same(back, table)
+    assert back.arrival_time.dtype == np.dtype('<i8') and isinstance(back.arrival_time.base, np.memmap)
+
+
+def test_trace_rejects_float_times(tmp_path):
+    table = ProcessTable([1, 2], [0.5, 1.0], [1, 2])
+    with pytest.raises(ValueError, match='integer'): write_trace(table, tmp_path / 'f.trace')
+    # Text formats keep fractional times
+    write_table(table, tmp_path / 'f.csv')
+    assert read_workload(tmp_path / 'f.csv').arrival_time.tolist() == [0.5, 1.0]
+
+
+def test_trace_file_objects():
+    table = generate(300, priorities={0: 1, 3: 2}, seed=4)
+    buf = io.BytesIO()
+    write_trace(table, buf)
+    upload = io.BytesIO(buf.getvalue())
+    upload.name = 'upload.trace'  # the dashboard's uploads carry the original file name
+    assert_same(read_workload(upload), table)
+
+
+def test_bad_and_truncated_traces(tmp_path):
+    good = io.BytesIO()
+    write_trace(generate(50, seed=1), good)
+    data = good.getvalue()
+    cases = {'short': data[:TRACE_HEADER.itemsize - 1], 'magic': b'NOTTRACE' + data[8:], 'truncated': data[:-8],
+             'version': data[:8] + (99).to_bytes(4, 'little') + data[12:]}
+    for name, blob in cases.items():
+        (tmp_path / f'{name}.trace').write_bytes(blob)
+        with pytest.raises(ValueError): read_trace(str(tmp_path / f'{name}.trace'))
+        with pytest.raises(ValueError): read_trace(io.BytesIO(blob))
+
+
+def test_unknown_extension():
+    with pytest.raises(ValueError, match='Unsupported'): read_workload('workload.xlsx')
+
+
+@pytest.mark.parametrize('ext', ['csv', 'jsonl', 'trace', 'parquet'])
+@pytest.mark.parametrize('priorities', [None, range(4)])
+def test_write_workload_chunked(tmp_path, ext, priorities):
+    if ext == 'parquet': pytest.importorskip('pyarrow')
+    spec = dict(priorities=priorities, seed=6)
+    path = tmp_path / f'w.{ext}'
+    assert write_workload(str(path), 2500, chunk=700, **spec) == 2500
+    assert_same(read_workload(str(path)), generate(2500, **spec))
+
+
+def test_write_workload_empty(tmp_path):
+    assert write_workload(str(tmp_path / 'e.csv'), 0) == 0
+
+
+def test_parquet_without_pyarrow_is_a_clear_error(tmp_path, monkeypatch):
+    real_import = builtins.__import__
+    def no_pyarrow(name, *args, **kwargs):
+        if name.split('.')[0] == 'pyarrow': raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+    monkeypatch.setattr(builtins, '__import__', no_pyarrow)
+    with pytest.raises(ImportError, match=r'cpu-sched\[parquet\]'): write_workload(str(tmp_path / 'w.parquet'), 10)
+    with pytest.raises(ImportError, match=r'cpu-sched\[parquet\]'): write_table(generate(10), str(tmp_path / 'w.parquet'))
@@ -0,0 +1,90 @@
+"""JobRunner: job status and progress, cancellation of queued and running jobs, eviction, and process workers."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from cpu_sched import SCHEDULERS, JobCancelled, JobRunner, generate
+
+
+def simulate(n, progress):
+    # Module level so process workers can unpickle it
+    return len(SCHEDULERS['RR'].run(generate(n, seed=1), quantum=1, progress=progress).final)
+
+
+def blocker(event, progress):
+    # Runs until released, reporting progress so a cancel lands at the next report
+    while not event.wait(0.01): progress(0, 0)
+    return 'released'
+
+
+@pytest.fixture
+def runner():
+    r = JobRunner(workers=1, keep=4)
+    yield r
+    r.shutdown()
+
+
+def test_job_runs_and_reports(runner):
+    job = runner.submit(simulate, 5000, total=5000, label='rr')
+    assert job.result(timeout=30) == 5000
+    assert job.status == 'done' and job.fraction == 1.0 and job.error is None
+    assert job.done > 0 and job.time is not None and job.label == 'rr'
+    assert runner.get(job.id) is job and runner.pending == 0
+
+
+def test_failed_job_keeps_its_error(runner):
+    job = runner.submit(lambda progress: 1 / 0)
+    with pytest.raises(ZeroDivisionError): job.result(timeout=30)
+    assert job.status == 'failed' and isinstance(job.error, ZeroDivisionError)
+
+
+def test_cancel_running_and_queued(runner):
+    release = threading.Event()
+    running = runner.submit(blocker, release)
+    queued = runner.submit(simulate, 100)
+    assert queued.status == 'queued'
+    queued.cancel(); running.cancel()
+    with pytest.raises(JobCancelled): running.result(timeout=30)
+    with pytest.raises(JobCancelled): queued.result(timeout=30)
+    assert running.status == queued.status == 'cancelled'
+
+
+def test_eviction_skips_unfinished_jobs():
+    # One long job at the head of the list must not pin every later finished job in memory
+    runner, release = JobRunner(workers=2, keep=4), threading.Event()
+    try:
+        head = runner.submit(blocker, release)
+        finished = []
+        for _ in range(10):
+            finished.append(runner.submit(simulate, 50))
+            finished[-1].result(timeout=30)
+        kept = runner.jobs()
+        assert head in kept and len(kept) == 4
+        assert kept[1:] == finished[-3:] and runner.get(finished[0].id) is None
+    finally:
+        release.set()
+        runner.shutdown(cancel=False)
+    assert head.result(timeout=30) == 'released'
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='relies on fork for the test module functions')
+def test_process_workers():
+    runner = JobRunner(workers=2, processes=True)
+    try:
+        jobs = [runner.submit(simulate, n, total=n) for n in (300, 600)]
+        assert [j.result(timeout=60) for j in jobs] == [300, 600]
+        assert all(j.status == 'done' and j.fraction == 1.0 for j in jobs)
+    finally:
+        runner.shutdown()
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError): JobRunner(workers=0)
+
+
+def test_import_does_not_load_multiprocessing():
+    code = "import sys, cpu_sched; print(sorted(m for m in ('multiprocessing', 'concurrent.futures') if m in sys.modules))"
+    assert subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip() == '[]'
@@ -0,0 +1,79 @@
+"""MLFQ: degenerate configurations reduce to RR / FCFS, per-level allotments hold, boosts and preemption behave."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import CPUCore, ProcessTable, SCHEDULERS
+from reference import check_timeline, random_workload
+
+SLICE_KEYS = ('id', 'start_time', 'completion_time')
+
+
+def slices(timeline):
+    return [(s['id'], s['start_time'], s['completion_time'], s['level']) for s in timeline]
+
+
+@pytest.mark.parametrize('seed', range(150))
+@pytest.mark.parametrize('quantum', [1, 3])
+def test_single_level_is_round_robin(seed, quantum):
+    procs = random_workload(seed)
+    final, timeline = CPUCore.mlfq(procs, quanta=(quantum,))
+    rr_final, rr_timeline = CPUCore.rr(procs, quantum)
+    assert [{k: s[k] for k in SLICE_KEYS} for s in timeline] == [{k: s[k] for k in SLICE_KEYS} for s in rr_timeline]
+    assert [(p['id'], p['completion_time']) for p in final] == [(p['id'], p['completion_time']) for p in rr_final]
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_unbounded_single_level_runs_to_completion(seed):
+    # Every dispatch runs to completion, admitting arrivals the RR way (registry order within a batch)
+    procs = random_workload(seed)
+    final, timeline = CPUCore.mlfq(procs, quanta=(None,))
+    _, rr_timeline = CPUCore.rr(procs, max(p['burst_time'] for p in procs))
+    assert len(timeline) == len(procs)
+    assert [{k: s[k] for k in SLICE_KEYS} for s in timeline] == [{k: s[k] for k in SLICE_KEYS} for s in rr_timeline]
+
+
+@pytest.mark.parametrize('seed', range(150))
+@pytest.mark.parametrize('quanta', [(1, 2, 4), (2, 5), (1, 3, None)])
+def test_level_allotments(seed, quanta):
+    # Without boosts a process only moves down, and it leaves a non-last level after using exactly that level's
+    # quantum there (or completes within it)
+    table = ProcessTable.from_records(random_workload(seed, n=25, span=20))
+    final, timeline = SCHEDULERS['MLFQ'].run(table, quanta=quanta)[:2]
+    sl = timeline.decode()
+    check_timeline(final, sl)
+    for k, pid in enumerate(final.id.tolist()):
+        mine = sl.id == pid
+        lv, dur = sl.level[mine], (sl.completion_time - sl.start_time)[mine]
+        assert np.all(np.diff(lv) >= 0)
+        for level in np.unique(lv)[:-1]:
+            assert dur[lv == level].sum() == quanta[level]
+        last = lv[-1]
+        if quanta[last] is not None and last < len(quanta) - 1: assert dur[lv == last].sum() <= quanta[last]
+
+
+def test_arrival_preempts_lower_level_and_allotment_resumes():
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 10}, {'id': 2, 'arrival_time': 3, 'burst_time': 1}]
+    _, timeline = CPUCore.mlfq(procs, quanta=(2, 8))
+    assert slices(timeline) == [(1, 0, 2, 0), (1, 2, 3, 1), (2, 3, 4, 0), (1, 4, 11, 1)]
+
+
+def test_last_level_round_robins():
+    _, timeline = CPUCore.mlfq([{'id': 1, 'arrival_time': 0, 'burst_time': 10}], quanta=(2, 4))
+    assert slices(timeline) == [(1, 0, 2, 0), (1, 2, 6, 1), (1, 6, 10, 1)]
+
+
+def test_boost_returns_processes_to_top_level():
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 20}, {'id': 2, 'arrival_time': 0, 'burst_time': 20}]
+    _, plain = CPUCore.mlfq(procs, quanta=(1, 2, 4))
+    _, boosted = CPUCore.mlfq(procs, quanta=(1, 2, 4), boost=10)
+    assert max(s['level'] for s in plain if s['start_time'] >= 10) == 2
+    # Right after each boost the next dispatch runs at level 0
+    for t in (10, 20, 30):
+        after = [s for s in boosted if s['start_time'] >= t]
+        if after: assert after[0]['level'] == 0
+
+
+def test_needs_a_level():
+    with pytest.raises(ValueError):
+        CPUCore.mlfq(random_workload(0), quanta=())
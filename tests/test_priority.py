@@ -0,0 +1,87 @@
+"""Priority engines (with and without preemption and aging) against a unit-step brute-force simulation."""
+
+import pytest
+
+from cpu_sched import CPUCore, ProcessTable, SCHEDULERS
+from reference import check_timeline, random_workload
+
+
+def unit_priority(procs, preemptive, aging=None):
+    # Lower value first, ties to the earlier arrival (then registry position). A waiting process gains one level per
+    # `aging` units waited since it was last queued, down to 0, and keeps what it gained once dispatched. Preemption
+    # only happens when a ready process is strictly ahead of the runner. Returns merged slices and {id: (start, end)}.
+    order = sorted(range(len(procs)), key=lambda k: procs[k]['arrival_time'])
+    rank = {procs[k]['id']: r for r, k in enumerate(order)}
+    arrival = {p['id']: p['arrival_time'] for p in procs}
+    rem = {p['id']: p['burst_time'] for p in procs}
+    base = {p['id']: p.get('priority', 0) for p in procs}
+    since, running, t, slices, first, comp = {}, None, 0, [], {}, {}
+
+    def prio(i):
+        if not aging or i not in since: return base[i]
+        return max(0, base[i] - (t - since[i]) // aging)
+
+    def dispatch():
+        i = min(since, key=lambda i: (prio(i), rank[i]))
+        base[i] = prio(i); del since[i]
+        return i
+
+    while rem:
+        for i in rem:
+            if arrival[i] == t: since[i] = t
+        if running is None:
+            if not since: t += 1; continue
+            running = dispatch()
+        elif preemptive and since and min(prio(i) for i in since) < base[running]:
+            since[running] = t
+            running = dispatch()
+        i = running
+        first.setdefault(i, t)
+        if slices and slices[-1][0] == i and slices[-1][2] == t: slices[-1][2] = t + 1
+        else: slices.append([i, t, t + 1])
+        t += 1
+        rem[i] -= 1
+        if not rem[i]: del rem[i]; comp[i] = t; running = None
+    return [tuple(s) for s in slices], {i: (first[i], comp[i]) for i in first}
+
+
+def run(procs, preemptive, aging):
+    return CPUCore.priority_preemptive(procs, aging) if preemptive else CPUCore.priority(procs, aging)
+
+
+@pytest.mark.parametrize('seed', range(150))
+@pytest.mark.parametrize('preemptive', [False, True])
+@pytest.mark.parametrize('aging', [None, 1, 4])
+def test_priority_matches_unit_step(seed, preemptive, aging):
+    procs = random_workload(seed, priorities=6)
+    final, timeline = run(procs, preemptive, aging)
+    slices, times = unit_priority(procs, preemptive, aging)
+    assert [(s['id'], s['start_time'], s['completion_time']) for s in timeline] == slices
+    assert {p['id']: (p['start_time'], p['completion_time']) for p in final} == times
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_equal_priorities_are_fcfs(seed):
+    procs = random_workload(seed)
+    fcfs = {p['id']: p['completion_time'] for p in CPUCore.fcfs(procs)[0]}
+    for preemptive in (False, True):
+        final, _ = run(procs, preemptive, None)
+        assert {p['id']: p['completion_time'] for p in final} == fcfs
+
+
+def test_aging_prevents_starvation():
+    # A steady stream of priority-0 work starves the priority-5 process unless it ages
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 2, 'priority': 5}] + \
+            [{'id': k, 'arrival_time': 2 * (k - 2), 'burst_time': 2, 'priority': 0} for k in range(2, 40)]
+    starved = {p['id']: p for p in CPUCore.priority_preemptive(procs)[0]}[1]
+    aged = {p['id']: p for p in CPUCore.priority_preemptive(procs, aging=3)[0]}[1]
+    assert starved['completion_time'] == 78 and aged['completion_time'] < 30
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_preemptive_switch_costs(seed):
+    table = ProcessTable.from_records(random_workload(seed, priorities=4))
+    final, timeline = SCHEDULERS['PRIORITY-P'].run(table, aging=2, switch_cost=1, warmup=1)[:2]
+    sl = timeline.decode()
+    check_timeline(final, sl)
+    assert sl.overhead.sum() == final.switches.sum()
@@ -0,0 +1,76 @@
+"""Engine and sweep progress reports: by completions, by scheduling steps for long processes, and cancellation."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, CPUCore, generate
+from cpu_sched.sweep import quantum_sweep
+from cpu_sched.table import ProcessTable
+
+
+class Stop(Exception):
+    pass
+
+
+def recorder():
+    calls = []
+    def progress(done, time): calls.append((done, time))
+    return calls, progress
+
+
+def long_bursts(n=3, burst=20000):
+    # Few processes, many slices: completions alone would report at most once
+    return ProcessTable(np.arange(1, n + 1), np.zeros(n, np.int64), np.full(n, burst), priority=np.arange(n))
+
+
+@pytest.mark.parametrize('name, params', [('RR', {'quantum': 1}), ('MLFQ', {'quanta': (1, 1)})])
+def test_step_reports_without_completions(name, params):
+    calls, progress = recorder()
+    final, _ = SCHEDULERS[name].engine(long_bursts(), progress=progress, **params)
+    assert len(calls) >= 2
+    assert [d for d, _ in calls] == sorted(d for d, _ in calls)
+    assert [t for _, t in calls] == sorted(t for _, t in calls)
+    assert calls[-1][1] <= final.completion_time.max()
+
+
+def test_step_reports_smp():
+    calls, progress = recorder()
+    SCHEDULERS['RR'].run(long_bursts(4), cores=2, quantum=1, progress=progress)
+    assert len(calls) >= 2
+
+
+def test_fcfs_reports_in_blocks():
+    table = generate(50000, seed=7)
+    plain = CPUCore.fcfs(table)[0]
+    calls, progress = recorder()
+    final = CPUCore.fcfs(table, progress=progress)[0]
+    assert np.array_equal(final.completion_time, plain.completion_time) and np.array_equal(final.start_time, plain.start_time)
+    assert [d for d, _ in calls] == [*range(CPUCore.PROGRESS_STEPS, 50000, CPUCore.PROGRESS_STEPS), 50000]
+    assert calls[-1][1] == plain.completion_time.max()
+
+
+@pytest.mark.parametrize('name', list(SCHEDULERS))
+def test_raising_callback_aborts(name):
+    def progress(done, time): raise Stop()
+    cls = SCHEDULERS[name]
+    with pytest.raises(Stop):
+        cls.run(generate(20000, mean_burst=2, priorities=range(4), seed=1), progress=progress, **cls.tune(1))
+
+
+def test_sweep_reports_each_candidate():
+    table = generate(2000, seed=3)
+    calls, progress = recorder()
+    result = quantum_sweep(table, range(1, 9), workers=1, progress=progress)
+    assert [d for d, _ in calls] == list(range(1, len(calls) + 1)) and len(calls) >= 7
+    assert calls[-1][1] in set(result['makespan'])
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_sweep_cancels_between_candidates(workers):
+    calls = []
+    def progress(done, time):
+        calls.append(done)
+        if done >= 2: raise Stop()
+    with pytest.raises(Stop):
+        quantum_sweep(generate(2000, seed=3), range(1, 40), workers=workers, chunksize=1, progress=progress)
+    assert calls[-1] == 2
@@ -0,0 +1,92 @@
+"""FCFS, SJF and RR against the original list-scanning engines, slice for slice, on seeded random workloads."""
+
+import pytest
+
+import reference
+from cpu_sched import CPUCore, ProcessTable, RRScheduler, SCHEDULERS, summarize
+from reference import check_timeline, project, random_workload
+
+METRIC_KEYS = ('id', 'arrival_time', 'burst_time', 'start_time', 'completion_time', 'turnaround_time', 'waiting_time')
+SLICE_KEYS = ('id', 'start_time', 'completion_time')
+SEEDS = range(200)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('quantum', [1, 2, 3, 7])
+def test_rr_matches_reference(seed, quantum):
+    procs = random_workload(seed)
+    final, timeline = CPUCore.rr(procs, quantum)
+    ref_final, ref_timeline = reference.rr(procs, quantum)
+    assert project(timeline, SLICE_KEYS) == ref_timeline
+    assert project(final, METRIC_KEYS) == ref_final
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('engine', ['fcfs', 'sjf'])
+def test_nonpreemptive_matches_reference(seed, engine):
+    procs = random_workload(seed)
+    final, timeline = getattr(CPUCore, engine)(procs)
+    ref_final, ref_timeline = getattr(reference, engine)(procs)
+    assert project(final, METRIC_KEYS) == project(ref_final, METRIC_KEYS)
+    assert project(timeline, SLICE_KEYS) == project(ref_timeline, SLICE_KEYS)
+
+
+def large_workload(seed, n, kind):
+    # Above CPUCore.VECTOR_MIN, so FCFS takes its closed-form path: idle gaps between bursts of arrivals, many equal
+    # arrival times, or fractional times (quarter units, so every sum is exact in floating point)
+    procs = random_workload(seed, n=n, span={'gaps': 40 * n, 'ties': n // 8, 'float': 3 * n}[kind])
+    if kind == 'float':
+        for p in procs: p['arrival_time'], p['burst_time'] = p['arrival_time'] / 4, p['burst_time'] * 1.25
+    return procs
+
+
+@pytest.mark.parametrize('seed', range(25))
+@pytest.mark.parametrize('n', [CPUCore.VECTOR_MIN, CPUCore.VECTOR_MIN + 1, 500])
+@pytest.mark.parametrize('kind', ['gaps', 'ties', 'float'])
+def test_fcfs_closed_form_matches_reference(seed, n, kind):
+    procs = large_workload(seed, n, kind)
+    final, timeline = CPUCore.fcfs(procs)
+    ref_final, ref_timeline = reference.fcfs(procs)
+    assert project(final, METRIC_KEYS) == project(ref_final, METRIC_KEYS)
+    assert project(timeline, SLICE_KEYS) == project(ref_timeline, SLICE_KEYS)
+
+
+@pytest.mark.parametrize('kind', ['gaps', 'ties', 'float'])
+def test_fcfs_blocked_closed_form_matches_reference(kind):
+    # With a progress callback the closed form runs in blocks of PROGRESS_STEPS rows, carrying the clock across them
+    procs = large_workload(7, 3 * CPUCore.PROGRESS_STEPS + 17, kind)
+    final, _ = CPUCore.fcfs(ProcessTable.from_records(procs), progress=lambda done, time: None)
+    ref_final, _ = reference.fcfs(procs)
+    assert project(final.to_records(), METRIC_KEYS) == project(ref_final, METRIC_KEYS)
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_registry_schedulers_match_reference(seed):
+    # The object API both frontends use, including the metrics it reports
+    procs = random_workload(seed)
+    for name, ref in (('FCFS', reference.fcfs), ('SJF', reference.sjf), ('RR', lambda p: reference.rr(p, 2))):
+        s = SCHEDULERS[name](procs)
+        s.schedule()
+        ref_final, _ = ref(procs)
+        assert project(s.processes, METRIC_KEYS) == project(ref_final, METRIC_KEYS)
+        n = len(ref_final)
+        assert s.avg_waiting_time == pytest.approx(sum(p['waiting_time'] for p in ref_final) / n)
+        assert s.avg_turnaround_time == pytest.approx(sum(p['turnaround_time'] for p in ref_final) / n)
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_rr_table_invariants(seed):
+    procs = random_workload(seed, n=60, span=100)
+    final, timeline = RRScheduler.run(ProcessTable.from_records(procs), quantum=3)[:2]
+    check_timeline(final, timeline.decode())
+    m = summarize(final, timeline)
+    assert m['slices'] == len(reference.rr(procs, 3)[1])
+
+
+def test_rr_tie_breaking():
+    # P2 arrives while P1 runs its first quantum, so it queues ahead of the preempted P1; P3 and P4 arrive together
+    # and keep registry order
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 4}, {'id': 2, 'arrival_time': 1, 'burst_time': 2},
+             {'id': 4, 'arrival_time': 3, 'burst_time': 1}, {'id': 3, 'arrival_time': 3, 'burst_time': 1}]
+    _, timeline = CPUCore.rr(procs, 2)
+    assert [(s['id'], s['start_time']) for s in timeline] == [(1, 0), (2, 2), (1, 4), (4, 6), (3, 7)]
@@ -0,0 +1,40 @@
+"""Scheduler registry: registration, required fields, and registered algorithms reaching the audit and the benchmark."""
+
+import pytest
+
+from cpu_sched import SCHEDULERS, CPUCore, ModernProcessScheduler, audit_batch, available, get_scheduler, register_scheduler
+from cpu_sched.bench import bench_engines, run_suite
+from reference import random_workload
+
+
+@pytest.fixture
+def lottery():
+    class LotteryScheduler(ModernProcessScheduler):
+        params = {'quantum': 2}
+        requires = ('tickets',)
+        engine = staticmethod(lambda table, quantum, **hook: CPUCore.rr(table, quantum, **hook))
+    register_scheduler('lottery', LotteryScheduler)
+    yield LotteryScheduler
+    del SCHEDULERS['LOTTERY']
+
+
+def test_register_and_lookup(lottery):
+    assert get_scheduler('Lottery') is lottery and lottery.name == lottery.label == 'LOTTERY'
+    with pytest.raises(ValueError): get_scheduler('nope')
+    with pytest.raises(TypeError): register_scheduler('bad', object)
+
+
+def test_available_filters_on_required_fields(lottery):
+    assert 'LOTTERY' not in available(('arrival_time', 'burst_time', 'priority'))
+    assert 'LOTTERY' in available(('arrival_time', 'burst_time', 'tickets'))
+    basic = available(('arrival_time', 'burst_time'))
+    assert 'PRIORITY' not in basic and 'PRIORITY-P' not in basic and {'FCFS', 'SJF', 'RR'} <= set(basic)
+    assert list(available(('arrival_time', 'burst_time', 'priority'))) == [n for n in SCHEDULERS if n != 'LOTTERY']
+
+
+def test_registered_scheduler_is_benchmarked_and_audited(lottery):
+    assert {'LOTTERY', 'LOTTERY.records'} <= set(bench_engines())
+    report = run_suite(sizes=(50,), engines=['LOTTERY', 'LOTTERY.records', 'PRIORITY'], workloads=('uniform',), repeat=1, memory=False)
+    assert [r['engine'] for r in report['results']] == ['LOTTERY', 'LOTTERY.records', 'PRIORITY']
+    rows = audit_batch([random_workload(1)], algorithms=['lottery', 'RR'], workers=1)
+    assert rows.loc[rows.algorithm == 'LOTTERY', 'avg_wait'].item() == rows.loc[rows.algorithm == 'RR', 'avg_wait'].item()
@@ -0,0 +1,87 @@
+"""Registry: capacity growth, dtype promotion, running totals, fingerprint invalidation and zero-copy views."""
+
+import numpy as np
+
+from cpu_sched import ProcessTable, Registry, fingerprint
+
+
+def test_append_grows_capacity_and_keeps_rows():
+    reg = Registry(capacity=2)
+    ids = [reg.append(i, i + 1, i % 3) for i in range(9)]
+    assert ids == list(range(1, 10)) and len(reg) == 9 and reg.next_id == 10
+    assert len(reg._cols['id']) == 16
+    table = reg.table()
+    assert table.arrival_time.tolist() == list(range(9)) and table.burst_time.tolist() == list(range(1, 10))
+    assert table.priority.tolist() == [i % 3 for i in range(9)]
+
+
+def test_zero_capacity_still_grows():
+    reg = Registry(capacity=0)
+    reg.append(0, 1)
+    assert len(reg) == 1 and reg.table().id.tolist() == [1]
+
+
+def test_float_time_promotes_columns():
+    reg = Registry()
+    reg.append(0, 3)
+    reg.append(1.5, 2.25)
+    table = reg.table()
+    assert table.arrival_time.dtype == table.burst_time.dtype == np.float64
+    assert table.arrival_time.tolist() == [0.0, 1.5] and table.burst_time.tolist() == [3.0, 2.25]
+    assert table.id.dtype == table.priority.dtype == np.int64 and reg.total_burst == 5.25
+
+
+def test_extend_promotes_and_defaults_priority():
+    reg = Registry()
+    reg.append(0, 2, 4)
+    reg.extend(ProcessTable([7, 8], [0.5, 1.0], [1.0, 3.5]))
+    table = reg.table()
+    assert table.arrival_time.dtype == np.float64 and table.id.tolist() == [1, 7, 8]
+    assert table.priority.tolist() == [4, 0, 0] and reg.next_id == 9
+    reg.extend(ProcessTable([], [], []))
+    assert len(reg) == 3
+
+
+def test_running_totals():
+    reg = Registry()
+    for bt in (3, 5, 2): reg.append(0, bt)
+    reg.extend(ProcessTable([10, 11], [1, 2], [4, 6]))
+    assert reg.total_burst == 20 == reg.table().burst_time.sum()
+    reg.replace(ProcessTable([1], [0], [9]))
+    assert reg.total_burst == 9 and reg.next_id == 2 and len(reg) == 1
+    reg.clear()
+    assert reg.total_burst == 0 and reg.next_id == 1 and len(reg) == 0
+
+
+def test_fingerprint_invalidates_on_mutation():
+    reg = Registry()
+    reg.append(0, 3)
+    first = reg.fingerprint()
+    assert first == fingerprint(reg.table()) and reg.fingerprint() is first
+    reg.append(1, 2)
+    second = reg.fingerprint()
+    assert second != first and second == fingerprint(reg.table())
+    reg.clear()
+    assert reg.fingerprint() != second
+    reg.append(0, 3)
+    assert reg.fingerprint() == first
+
+
+def test_table_is_a_zero_copy_view():
+    reg = Registry()
+    for i in range(10): reg.append(i, 1)
+    table = reg.table()
+    assert reg.table() is table
+    assert all(np.shares_memory(getattr(table, c), reg._cols[c]) for c in Registry.COLUMNS)
+    page = table.take(slice(4, 8))
+    assert page.id.tolist() == [5, 6, 7, 8] and np.shares_memory(page.arrival_time, reg._cols['arrival_time'])
+
+
+def test_handed_out_tables_survive_mutation():
+    reg = Registry(capacity=4)
+    for i in range(4): reg.append(i, 2)
+    before = reg.table()
+    reg.append(9, 9)
+    reg.clear()
+    reg.append(5, 5)
+    assert before.id.tolist() == [1, 2, 3, 4] and before.burst_time.tolist() == [2, 2, 2, 2]
@@ -0,0 +1,69 @@
+"""SMP engines: one core reproduces the single-core engines; k cores keep per-core and per-process invariants."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import CPUCore, ProcessTable, SMPCore
+from reference import random_workload
+
+SLICE_KEYS = ('id', 'start_time', 'completion_time')
+METRIC_KEYS = ('id', 'start_time', 'completion_time', 'turnaround_time', 'waiting_time')
+ENGINES = {'fcfs': ((), ()), 'sjf': ((), ()), 'rr': ((2,), (2,))}
+
+
+def by_id(records):
+    return sorted(({k: r[k] for k in METRIC_KEYS} for r in records), key=lambda r: r['id'])
+
+
+@pytest.mark.parametrize('seed', range(150))
+@pytest.mark.parametrize('engine', list(ENGINES))
+@pytest.mark.parametrize('queues', ['global', 'per-core'])
+def test_single_core_matches_cpucore(seed, engine, queues):
+    procs = random_workload(seed)
+    args, smp_args = ENGINES[engine]
+    final, timeline = getattr(CPUCore, engine)(procs, *args)
+    s_final, s_timeline, util = getattr(SMPCore, engine)(procs, *smp_args, cores=1, queues=queues)
+    assert by_id(s_final) == by_id(final)
+    assert [{k: s[k] for k in SLICE_KEYS} for s in s_timeline] == [{k: s[k] for k in SLICE_KEYS} for s in timeline]
+    assert all(s['core'] == 0 for s in s_timeline)
+    assert len(util) == 1
+
+
+@pytest.mark.parametrize('seed', range(100))
+@pytest.mark.parametrize('engine', list(ENGINES))
+@pytest.mark.parametrize('queues', ['global', 'per-core'])
+@pytest.mark.parametrize('cores', [2, 4])
+def test_multi_core_invariants(seed, engine, queues, cores):
+    table = ProcessTable.from_records(random_workload(seed, n=40, span=30))
+    final, timeline, util = getattr(SMPCore, engine)(table, *ENGINES[engine][1], cores=cores, queues=queues)
+    sl = timeline.decode()
+    assert sl.core.min() >= 0 and sl.core.max() < cores
+    for c in range(cores):
+        mine = sl.core == c
+        start, end = sl.start_time[mine], sl.completion_time[mine]
+        order = np.argsort(start, kind='stable')
+        assert np.all(start[order][1:] >= end[order][:-1]), "slices overlap on one core"
+        busy = (end - start).sum()
+        makespan = sl.completion_time.max()
+        assert util[c] == pytest.approx(busy / makespan * 100)
+    for k, pid in enumerate(final.id.tolist()):
+        mine = sl.id == pid
+        start, end = sl.start_time[mine], sl.completion_time[mine]
+        order = np.argsort(start, kind='stable')
+        assert np.all(start[order][1:] >= end[order][:-1]), "a process ran on two cores at once"
+        assert (end - start).sum() == final.burst_time[k]
+        assert start.min() == final.start_time[k] >= final.arrival_time[k]
+        assert end.max() == final.completion_time[k]
+
+
+def test_global_queue_fills_idle_cores():
+    # Four equal jobs at t=0 on two cores: two waves, never a core idle while work waits
+    procs = [{'id': i, 'arrival_time': 0, 'burst_time': 3} for i in range(1, 5)]
+    final, _, util = SMPCore.fcfs(procs, cores=2)
+    assert sorted(p['completion_time'] for p in final) == [3, 3, 6, 6]
+    assert list(util) == [100.0, 100.0]
+
+
+def test_invalid_core_count():
+    with pytest.raises(ValueError):
+        SMPCore.fcfs(random_workload(0), cores=0)
@@ -0,0 +1,64 @@
+"""SRTF against a unit-step brute-force simulation, plus context-switch overhead invariants."""
+
+import pytest
+
+from cpu_sched import CPUCore, ProcessTable, SCHEDULERS, summarize
+from reference import check_timeline, random_workload
+
+
+def unit_srtf(procs):
+    # One time unit at a time: run the arrived process with the least remaining work, earliest arrival (then registry
+    # position) first. Returns merged (id, start, end) slices and {id: (first start, completion)}.
+    rank = {p['id']: k for k, p in enumerate(sorted(procs, key=lambda p: p['arrival_time']))}
+    rem = {p['id']: p['burst_time'] for p in procs}
+    arrival = {p['id']: p['arrival_time'] for p in procs}
+    t, slices, first, comp = 0, [], {}, {}
+    while rem:
+        ready = [i for i in rem if arrival[i] <= t]
+        if not ready: t = min(arrival[i] for i in rem); continue
+        i = min(ready, key=lambda i: (rem[i], rank[i]))
+        first.setdefault(i, t)
+        if slices and slices[-1][0] == i and slices[-1][2] == t: slices[-1][2] = t + 1
+        else: slices.append([i, t, t + 1])
+        t += 1
+        rem[i] -= 1
+        if not rem[i]: del rem[i]; comp[i] = t
+    return [tuple(s) for s in slices], {i: (first[i], comp[i]) for i in first}
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_srtf_matches_unit_step(seed):
+    procs = random_workload(seed)
+    final, timeline = CPUCore.srtf(procs)
+    slices, times = unit_srtf(procs)
+    assert [(s['id'], s['start_time'], s['completion_time']) for s in timeline] == slices
+    assert {p['id']: (p['start_time'], p['completion_time']) for p in final} == times
+    for p in final: assert p['waiting_time'] == p['turnaround_time'] - p['burst_time']
+
+
+def test_srtf_preempts_for_shorter_arrival():
+    procs = [{'id': 1, 'arrival_time': 0, 'burst_time': 8}, {'id': 2, 'arrival_time': 1, 'burst_time': 4},
+             {'id': 3, 'arrival_time': 2, 'burst_time': 9}, {'id': 4, 'arrival_time': 3, 'burst_time': 5}]
+    final, timeline = CPUCore.srtf(procs)
+    assert [(s['id'], s['start_time'], s['completion_time']) for s in timeline] == [(1, 0, 1), (2, 1, 5), (4, 5, 10), (1, 10, 17), (3, 17, 26)]
+    assert sum(p['waiting_time'] for p in final) / 4 == 6.5
+
+
+@pytest.mark.parametrize('seed', range(100))
+@pytest.mark.parametrize('costs', [{'switch_cost': 1}, {'switch_cost': 1, 'warmup': 2}, {'switch_cost': 0.5}])
+def test_srtf_switch_costs(seed, costs):
+    table = ProcessTable.from_records(random_workload(seed))
+    final, timeline = SCHEDULERS['SRTF'].run(table, **costs)[:2]
+    plain = SCHEDULERS['SRTF'].run(table)
+    slices = timeline.decode()
+    check_timeline(final, slices)
+    over = slices.overhead.astype(bool)
+    # One overhead slice per dispatch: switch_cost each, plus warmup whenever a process that has already run resumes
+    assert over.sum() == final.switches.sum()
+    ran, resumes = set(), 0
+    for pid, is_over in zip(slices.id.tolist(), over.tolist()):
+        if is_over: resumes += pid in ran
+        else: ran.add(pid)
+    assert summarize(final, timeline)['overhead'] == pytest.approx(over.sum() * costs['switch_cost'] + resumes * costs.get('warmup', 0))
+    # Overhead is extra work for a work-conserving CPU, so it can only push the last completion later
+    assert final.completion_time.max() >= plain.final.completion_time.max()
@@ -0,0 +1,52 @@
+"""stream_schedule against the batch engines on arrival-sorted workloads, and its online aggregates."""
+
+import pytest
+
+from cpu_sched import CPUCore, RunningStats, generate, stream_schedule, summarize
+from cpu_sched.workload import iter_records
+from reference import random_workload
+
+BATCH = {'FCFS': lambda p, q: CPUCore.fcfs(p), 'SJF': lambda p, q: CPUCore.sjf(p), 'RR': CPUCore.rr, 'SRTF': lambda p, q: CPUCore.srtf(p)}
+
+
+def sorted_workload(seed):
+    # The stream needs arrival order; registry order then breaks arrival ties the same way in both engines
+    procs = sorted(random_workload(seed), key=lambda p: p['arrival_time'])
+    return [dict(p, id=k + 1) for k, p in enumerate(procs)]
+
+
+@pytest.mark.parametrize('seed', range(150))
+@pytest.mark.parametrize('algorithm', list(BATCH))
+def test_stream_matches_batch(seed, algorithm):
+    procs = sorted_workload(seed)
+    stats = RunningStats()
+    events = list(stream_schedule(iter(procs), algorithm, 3, stats))
+    final, timeline = BATCH[algorithm](procs, 3)
+    assert [e for kind, e in events if kind == 'slice'] == [{k: s[k] for k in ('id', 'start_time', 'completion_time')} for s in timeline]
+    done = {e['id']: e for kind, e in events if kind == 'done'}
+    assert done == {p['id']: {k: p[k] for k in done[p['id']]} for p in final}
+    # Events come out in time order: every process is done no later than any slice that follows it
+    clock = 0
+    for kind, e in events:
+        t = e['completion_time']
+        assert t >= clock if kind == 'slice' else t == clock
+        clock = t
+    assert stats.completed == len(procs)
+    assert stats.mean_wait == pytest.approx(sum(p['waiting_time'] for p in final) / len(procs))
+    assert stats.mean_tat == pytest.approx(sum(p['turnaround_time'] for p in final) / len(procs))
+
+
+def test_stream_stats_match_summary():
+    table = generate(3000, seed=4)
+    stats = RunningStats()
+    for _ in stream_schedule(iter_records(3000, seed=4), 'RR', 4, stats): pass
+    m = summarize(*CPUCore.rr(table, 4))
+    assert stats.mean_wait == pytest.approx(m['avg_wait'])
+    assert stats.mean_tat == pytest.approx(m['avg_tat'])
+    assert stats.utilization == pytest.approx(m['cpu_util'])
+
+
+def test_stream_rejects_unsorted_arrivals():
+    procs = [{'id': 1, 'arrival_time': 5, 'burst_time': 1}, {'id': 2, 'arrival_time': 2, 'burst_time': 1}]
+    with pytest.raises(ValueError):
+        list(stream_schedule(iter(procs), 'FCFS'))
@@ -0,0 +1,54 @@
+"""quantum_sweep against one direct Round Robin run per quantum: the shared-prefix snapshots must not change a row."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import CPUCore, ProcessTable, generate, summarize
+from cpu_sched.sweep import best_quantum, parse_quanta, quantum_sweep, rr_prefix
+from reference import random_workload
+
+COSTS = [(0, 0), (1, 0), (1, 2), (0.5, 1)]
+
+
+def direct(table, q, switch_cost, warmup):
+    return {'quantum': q, **summarize(*CPUCore.rr(table, q, switch_cost, warmup))}
+
+
+@pytest.mark.parametrize('seed', range(40))
+@pytest.mark.parametrize('costs', COSTS, ids=lambda c: f'sw{c[0]}-wu{c[1]}')
+def test_sweep_matches_direct_runs(seed, costs):
+    table = ProcessTable.from_records(random_workload(seed, max_burst=12))
+    top = int(table.burst_time.max())
+    # Quanta below, across and above the burst range, including several that saturate
+    quanta = sorted({1, 2, 3, top - 1, top, top + 1, top + 7, 5 * top} - {0})
+    result = quantum_sweep(table, quanta, *costs, workers=1)
+    assert list(result['quantum']) == quanta
+    for row in result.to_dict('records'):
+        assert row == pytest.approx(direct(table, row['quantum'], *costs)), row['quantum']
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_sweep_pool_matches_direct_runs(seed):
+    table = generate(400, mean_burst=6, load=1.1, seed=seed)
+    quanta = [1, 2, 4, 8, 16, 64, 10**6]
+    result = quantum_sweep(table, quanta, 1, 1, workers=2, chunksize=1)
+    for row in result.to_dict('records'):
+        assert row == pytest.approx(direct(table, row['quantum'], 1, 1))
+
+
+def test_prefix_snapshots_are_bounded_by_quanta():
+    # Strictly increasing bursts set a new record at every dispatch; only the requested quanta may cost a snapshot
+    n = 3000
+    table = ProcessTable(np.arange(1, n + 1), np.zeros(n, np.int64), np.arange(1, n + 1))
+    splits, saturated, final = rr_prefix(table, [5, 50, 500])
+    assert [qs for _, qs in splits] == [[5], [50], [500]] and saturated == [] and final is None
+    splits, saturated, final = rr_prefix(table, [5, n, n + 1])
+    assert [qs for _, qs in splits] == [[5]] and saturated == [n, n + 1] and final.done == n
+
+
+def test_best_quantum_and_parse():
+    assert parse_quanta('5:20:5') == [5, 10, 15, 20] and parse_quanta('8,2,2') == [2, 8]
+    with pytest.raises(ValueError): parse_quanta('0,2')
+    sweep = quantum_sweep(generate(300, seed=1), [1, 2, 4, 8, 10**6], workers=1)
+    best = best_quantum(sweep)
+    assert sweep.loc[sweep['quantum'] == best, 'avg_wait'].item() == sweep['avg_wait'].min()
@@ -0,0 +1,111 @@
+"""Telemetry: span nesting and timing, find, peak memory, JSON / OTLP export and engine statistics."""
+
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, ProcessTable, SliceTable, Telemetry, generate
+from cpu_sched.telemetry import engine_stats, queue_histogram, span
+
+
+def test_spans_nest_and_time():
+    tel = Telemetry()
+    with tel.span('outer', a=1) as attrs:
+        with tel.span('inner'): time.sleep(0.02)
+        with tel.span('inner2'): pass
+        attrs['b'] = 2
+    outer, inner, inner2 = tel.spans
+    assert [s['depth'] for s in tel.spans] == [0, 1, 1]
+    assert outer['parent_id'] is None and inner['parent_id'] == inner2['parent_id'] == outer['span_id']
+    assert outer['attributes'] == {'a': 1, 'b': 2}
+    assert inner['wall_s'] >= 0.02 and outer['wall_s'] >= inner['wall_s'] + inner2['wall_s']
+    assert outer['start_ns'] <= inner['start_ns'] <= inner['end_ns'] <= outer['end_ns']
+    assert [p['phase'] for p in tel.phases()] == ['outer', 'inner', 'inner2'] and tel.phases()[1]['wall_ms'] >= 20
+
+
+def test_span_closes_on_error():
+    tel = Telemetry()
+    with pytest.raises(RuntimeError):
+        with tel.span('boom'): raise RuntimeError
+    with tel.span('after'): pass
+    assert 'wall_s' in tel.spans[0] and tel.spans[1]['depth'] == 0
+
+
+def test_span_helper_without_telemetry():
+    with span(None, 'noop', x=1) as attrs: attrs['y'] = 2
+    assert attrs == {'x': 1, 'y': 2}
+
+
+def test_find_matches_prefix():
+    tel = Telemetry()
+    SCHEDULERS['RR'].run(generate(50, seed=1), quantum=2, telemetry=tel)
+    SCHEDULERS['FCFS'].run(generate(50, seed=1), telemetry=tel)
+    assert [a['algorithm'] for a in tel.find('engine.')] == ['RR', 'FCFS']
+    assert tel.find('engine.RR')[0]['params'] == {'quantum': 2, 'switch_cost': 0, 'warmup': 0}
+    assert tel.find('sweep.') == []
+
+
+def test_peak_memory_reaches_parent():
+    tel = Telemetry(memory=True)
+    with tel.span('outer'):
+        with tel.span('alloc'): block = np.ones(4 * 2**20 // 8)
+        del block
+        with tel.span('small'): pass
+    outer, alloc, small = tel.spans
+    assert alloc['peak_mb'] >= 4 and outer['peak_mb'] >= alloc['peak_mb'] and small['peak_mb'] < 4
+    # The telemetry started tracing, so it stops once the outermost span closes
+    assert not tracemalloc.is_tracing()
+
+
+def test_json_export():
+    tel = Telemetry(service='svc')
+    with tel.span('run', count=np.int64(3), quanta=(1, 2)): pass
+    doc = json.loads(tel.dumps())
+    assert doc['service'] == 'svc' and doc['trace_id'] == tel.trace_id and len(doc['trace_id']) == 32
+    (rec,) = doc['spans']
+    assert rec['name'] == 'run' and rec['attributes'] == {'count': 3, 'quanta': [1, 2]}
+    assert not any(k.startswith('_') for k in rec)
+    with pytest.raises(ValueError): tel.dumps('xml')
+
+
+def test_otlp_export(tmp_path):
+    tel = Telemetry(memory=True)
+    with tel.span('root', n=2, ok=True, ratio=0.5, tags=['a'], info={'k': 'v'}, skip=None):
+        with tel.span('child'): pass
+    path = tmp_path / 'trace.json'
+    tel.save(path, 'otlp')
+    (resource,) = json.loads(path.read_text())['resourceSpans']
+    assert resource['resource']['attributes'] == [{'key': 'service.name', 'value': {'stringValue': 'cpu-pro'}}]
+    (scope,) = resource['scopeSpans']
+    root, child = scope['spans']
+    assert scope['scope']['name'] == 'cpu_sched' and 'parentSpanId' not in root and child['parentSpanId'] == root['spanId']
+    assert root['traceId'] == child['traceId'] == tel.trace_id and int(root['endTimeUnixNano']) >= int(root['startTimeUnixNano'])
+    values = {a['key']: a['value'] for a in root['attributes']}
+    assert values['n'] == {'intValue': '2'} and values['ok'] == {'boolValue': True} and values['ratio'] == {'doubleValue': 0.5}
+    assert values['tags'] == {'arrayValue': {'values': [{'stringValue': 'a'}]}}
+    assert values['info'] == {'kvlistValue': {'values': [{'key': 'k', 'value': {'stringValue': 'v'}}]}}
+    assert 'skip' not in values and 'doubleValue' in values['memory.peak_mb']
+
+
+def test_engine_stats_by_hand():
+    # P1 runs [0, 4); P2 and P3 arrive at 1 and 2 and wait, so the dispatches at 4 and 6 see queues of 1 and 0
+    final = ProcessTable([1, 2, 3], [0, 1, 2], [4, 2, 1], completion_time=[4, 6, 7])
+    stats = engine_stats(final, SliceTable([1, 2, 3], [0, 4, 6], [4, 6, 7]))
+    assert stats == {'dispatches': 3, 'switches': 3, 'queue.max': 1, 'queue.mean': pytest.approx(1 / 3), 'queue.hist': {'0': 2, '1': 1}}
+
+
+def test_engine_stats_skip_overhead_and_decode_compact():
+    tel = Telemetry()
+    result = SCHEDULERS['RR'].run(generate(200, load=0.9, seed=4), quantum=2, switch_cost=1, telemetry=tel)
+    (attrs,) = tel.find('engine.RR')
+    timeline = result.timeline.decode()
+    assert attrs['dispatches'] == (timeline.overhead == 0).sum() and attrs['switches'] == result.final.switches.sum()
+    assert sum(attrs['queue.hist'].values()) == attrs['dispatches'] and attrs['queue.max'] >= attrs['queue.mean']
+
+
+def test_queue_histogram_buckets():
+    assert queue_histogram([0, 0, 1, 2, 3, 4, 7, 8]) == {'0': 2, '1': 1, '2-3': 2, '4-7': 2, '8-15': 1}
+    assert queue_histogram([]) == {}
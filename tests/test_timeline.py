@@ -0,0 +1,77 @@
+"""CompactTimeline: exact round trips, windows, blocks, concat / before, and engine summaries from the compact form."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from cpu_sched import SCHEDULERS, CompactTimeline, SliceTable, generate, summarize
+
+
+def assert_equal(a, b):
+    for c in SliceTable.COLUMNS:
+        x, y = getattr(a, c, None), getattr(b, c, None)
+        assert (x is None) == (y is None), c
+        if x is not None: assert np.array_equal(x, y), c
+
+
+def random_slices(trial):
+    # Back-to-back and gapped slices of a few processes, zero-length and (odd trials) fractional lengths, tag columns
+    rng = np.random.default_rng(trial)
+    n = int(rng.integers(0, 3000))
+    lens = rng.choice([0, 1, 2, 3, 2.5] if trial % 2 else [0, 1, 2, 3], n)
+    start = np.cumsum(rng.choice([0, 0, 0, 1], n) + np.r_[0, lens[:-1]]).astype(lens.dtype) if n else np.zeros(0)
+    extra = {}
+    if trial % 3 == 0: extra['overhead'] = rng.integers(0, 2, n)
+    if trial % 5 == 0: extra['level'] = rng.integers(0, 3, n)
+    return SliceTable(rng.integers(0, 4, n), start, start + lens, **extra), rng
+
+
+@pytest.mark.parametrize('trial', range(150))
+def test_round_trip_and_queries(trial):
+    table, rng = random_slices(trial)
+    compact = CompactTimeline.encode(table)
+    assert len(compact) == len(table)
+    assert_equal(compact.decode(), table)
+    assert list(compact) == table.to_records()
+    if not len(table): return
+    assert_equal(SliceTable.concat(list(compact.blocks(runs=7))), table)
+    for _ in range(5):
+        a, b = sorted(rng.uniform(-1, table.start_time[-1] + 5, 2))
+        keep = (table.start_time < b) & ((table.completion_time > a) | (table.start_time >= a))
+        assert_equal(compact.window(a, b), table.take(keep))
+
+
+@pytest.mark.parametrize('trial', range(0, 150, 7))
+def test_before_and_concat(trial):
+    table, rng = random_slices(trial)
+    if not len(table): return
+    compact = CompactTimeline.encode(table)
+    runs = compact.runs()
+    t = rng.uniform(0, table.start_time[-1] + 1)
+    assert_equal(compact.before(t).runs(), runs.take(runs.start_time < t))
+    cut = int(rng.integers(0, len(table) + 1))
+    parts = [CompactTimeline.encode(table.take(slice(0, cut))), CompactTimeline.encode(table.take(slice(cut, len(table))))]
+    assert_equal(CompactTimeline.concat(parts).decode(), table)
+
+
+def test_round_robin_run_is_one_run():
+    # A process running alone for many quanta costs one run, not one per slice
+    final, timeline = SCHEDULERS['RR'].engine(generate(1, mean_burst=10**5, seed=0), quantum=2)
+    assert len(timeline.pid) == 1 and len(timeline) == -(-final.burst_time[0] // 2)
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('name', list(SCHEDULERS))
+def test_engine_summaries_match_decoded(seed, name):
+    cls = SCHEDULERS[name]
+    w = generate(int(np.random.default_rng(seed).integers(50, 2500)), priorities=range(4), seed=seed)
+    settings = [({}, 1)] + ([({'switch_cost': 1}, 1), ({'switch_cost': 0.5, 'warmup': 1}, 1)] if cls.costed() else [])
+    settings += [({}, k) for k in (2, 4)] if cls.smp is not None else []
+    for params, cores in settings:
+        r = cls.run(w, cores=cores, **params)
+        if not isinstance(r.timeline, CompactTimeline): continue
+        decoded = r.timeline.decode()
+        assert_equal(CompactTimeline.encode(decoded).decode(), decoded)
+        assert summarize(r.final, r.timeline, cores) == summarize(r.final, decoded, cores)
+        assert_equal(pickle.loads(pickle.dumps(r.timeline)).decode(), decoded)
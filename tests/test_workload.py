@@ -0,0 +1,67 @@
+"""Synthetic workloads: realized offered load, the rounded-burst mean and chunk-size independence."""
+
+import numpy as np
+import pytest
+
+from cpu_sched import effective_mean, generate, generate_chunks
+from cpu_sched.workload import _bursts
+
+N = 200_000
+
+SPECS = [
+    dict(burst='exponential', mean_burst=1),
+    dict(burst='exponential', mean_burst=2),
+    dict(burst='exponential', mean_burst=5),
+    dict(burst='lognormal', mean_burst=3, shape=1.0),
+    dict(burst='pareto', mean_burst=4, shape=2.5, max_burst=10**4),
+    dict(burst='exponential', mean_burst=5, max_burst=6),
+]
+
+
+def realized_load(table):
+    return table.burst_time.sum() / (table.arrival_time[-1] - table.arrival_time[0])
+
+
+@pytest.mark.parametrize('spec', SPECS, ids=lambda s: '-'.join(map(str, s.values())))
+@pytest.mark.parametrize('load', [0.5, 0.9])
+def test_realized_load_matches_request(spec, load):
+    # Rounding bursts up would push small means well past `load` if the rate ignored it
+    assert realized_load(generate(N, load=load, seed=3, **spec)) == pytest.approx(load, rel=0.03)
+
+
+def test_realized_load_mmpp():
+    assert realized_load(generate(N, arrival='mmpp', mean_burst=2, load=0.8, seed=5)) == pytest.approx(0.8, rel=0.06)
+
+
+def test_explicit_rate_wins():
+    table = generate(N, mean_burst=2, rate=0.1, seed=1)
+    assert N / (table.arrival_time[-1] - table.arrival_time[0]) == pytest.approx(0.1, rel=0.02)
+
+
+@pytest.mark.parametrize('spec', SPECS + [dict(burst='pareto', mean_burst=5, shape=1.5, max_burst=50),
+                                          dict(burst='lognormal', mean_burst=50, shape=1.0, max_burst=100)],
+                         ids=lambda s: '-'.join(map(str, s.values())))
+def test_effective_mean_matches_samples(spec):
+    spec = {'shape': None, 'max_burst': 10**6, **spec}
+    x = _bursts(np.random.default_rng(0), 10**6, spec['burst'], spec['mean_burst'], spec['shape'], spec['max_burst'])
+    assert effective_mean(**spec) == pytest.approx(x.mean(), rel=0.01)
+
+
+def test_effective_mean_tail_integral():
+    # Past the directly summed terms the tail is integrated; it must agree with the full sum
+    for spec in (dict(burst='pareto', shape=1.2), dict(burst='lognormal', shape=2.0)):
+        assert effective_mean(mean_burst=5, exact=1 << 10, **spec) == pytest.approx(effective_mean(mean_burst=5, exact=10**6, **spec), rel=1e-6)
+
+
+@pytest.mark.parametrize('arrival', ['poisson', 'mmpp'])
+def test_chunk_size_does_not_change_workload(arrival):
+    whole = generate(5000, arrival=arrival, priorities={0: 1, 5: 2}, seed=9)
+    parts = list(generate_chunks(5000, arrival=arrival, priorities={0: 1, 5: 2}, seed=9, chunk=777))
+    for col in ('id', 'arrival_time', 'burst_time', 'priority'):
+        assert np.array_equal(np.concatenate([getattr(p, col) for p in parts]), getattr(whole, col))
+
+
+def test_invalid_specs():
+    with pytest.raises(ValueError): generate(10, burst='pareto', shape=1.0)
+    with pytest.raises(ValueError): generate(10, burst='uniform')
+    with pytest.raises(ValueError): generate(10, mean_burst=0)